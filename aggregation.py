@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import csv
+import glob
+import os
+import re
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+from duration_log import DURATION_LOG_EXTENSIONS, read_duration_log
+from ui.utils.time_sum_helpers import normalize_tag, signed_effective_seconds
+from ui.utils.timesheet_csv import (
+    COLUMN_ACTIVE,
+    COLUMN_DATE,
+    COLUMN_DESCRIPTION,
+    COLUMN_MULTIPLIER,
+    COLUMN_OPERATOR,
+    COLUMN_TIME,
+    iter_timesheet_records,
+    parse_active,
+)
+
+GROUP_PERSON = "person"
+GROUP_MONTH = "month"
+GROUP_TAG = "tag"
+GROUP_FIELDS = (GROUP_PERSON, GROUP_MONTH, GROUP_TAG)
+
+PERSON_FROM_STEM = "stem"
+PERSON_FROM_PARENT = "parent"
+PERSON_SOURCES = (PERSON_FROM_STEM, PERSON_FROM_PARENT)
+
+ARCHIVE_EXTENSIONS = (".csv", ".tsv", ".txt", *DURATION_LOG_EXTENSIONS)
+SHARDS_PER_WORKER = 4
+
+GroupKey = tuple[str, ...]
+Partial = dict[GroupKey, list[int]]
+
+_MONTH_PATTERN = re.compile(r"(\d{4})[-_.](0[1-9]|1[0-2])")
+_GLOB_CHARACTERS = frozenset("*?[")
+
+
+@dataclass(frozen=True, slots=True)
+class GroupTotal:
+    key: GroupKey
+    total_seconds: int
+    rows: int
+    skipped: int
+
+
+@dataclass(slots=True)
+class AggregateResult:
+    group_by: tuple[str, ...]
+    groups: list[GroupTotal] = field(default_factory=list)
+    files: int = 0
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def total_seconds(self) -> int:
+        return sum(group.total_seconds for group in self.groups)
+
+
+def discover_files(sources: Sequence[str]) -> list[str]:
+    """Expand directories (recursively) and glob patterns into a sorted list of files."""
+    found: set[str] = set()
+    for source in sources:
+        if os.path.isdir(source):
+            for root, _dirs, names in os.walk(source):
+                for name in names:
+                    if name.lower().endswith(ARCHIVE_EXTENSIONS):
+                        found.add(os.path.join(root, name))
+        elif _GLOB_CHARACTERS.intersection(source):
+            found.update(path for path in glob.glob(source, recursive=True) if os.path.isfile(path))
+        else:
+            found.add(source)
+    return sorted(found)
+
+
+def month_from_text(text: str) -> str:
+    match = _MONTH_PATTERN.search(text)
+    return f"{match[1]}-{match[2]}" if match else ""
+
+
+def person_from_path(path: str, person_from: str = PERSON_FROM_STEM) -> str:
+    if person_from == PERSON_FROM_PARENT:
+        return os.path.basename(os.path.dirname(os.path.abspath(path)))
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def aggregate_lines(
+    lines: Iterable[str],
+    partial: Partial,
+    group_by: Sequence[str] = GROUP_FIELDS,
+    *,
+    person: str = "",
+    default_month: str = "",
+) -> None:
+    """Add every record from ``lines`` to ``partial`` as ``[seconds, rows, skipped]`` per group.
+
+    Inactive rows are counted but add nothing; malformed rows are counted as skipped.
+    """
+    for _line_number, record in iter_timesheet_records(lines):
+        key = tuple(
+            person
+            if group == GROUP_PERSON
+            else (month_from_text(record.get(COLUMN_DATE, "")) or default_month)
+            if group == GROUP_MONTH
+            else normalize_tag(record.get(COLUMN_DESCRIPTION, ""))
+            for group in group_by
+        )
+        bucket = partial.get(key)
+        if bucket is None:
+            bucket = partial[key] = [0, 0, 0]
+        bucket[1] += 1
+
+        operator = record.get(COLUMN_OPERATOR, "").strip() or "+"
+        is_active = parse_active(record.get(COLUMN_ACTIVE, ""))
+        if is_active is None or operator not in {"+", "-"}:
+            bucket[2] += 1
+            continue
+        if not is_active:
+            continue
+
+        seconds = signed_effective_seconds(
+            operator,
+            record.get(COLUMN_TIME, ""),
+            record.get(COLUMN_MULTIPLIER, "").strip() or "1",
+        )
+        if seconds is None:
+            bucket[2] += 1
+            continue
+        bucket[0] += seconds
+
+
+def merge_partial(target: Partial, partial: Partial) -> None:
+    for key, (seconds, rows, skipped) in partial.items():
+        bucket = target.get(key)
+        if bucket is None:
+            target[key] = [seconds, rows, skipped]
+            continue
+        bucket[0] += seconds
+        bucket[1] += rows
+        bucket[2] += skipped
+
+
+def _aggregate_duration_log(path: str, partial: Partial, group_by: Sequence[str], person_from: str) -> None:
+    # Raw duration logs carry no columns: the whole memory-mapped file lands in
+    # single group named after the file, without decoding a single line.
+    scan = read_duration_log(path)
+    values = {
+        GROUP_PERSON: person_from_path(path, person_from),
+        GROUP_MONTH: month_from_text(os.path.basename(path)),
+        GROUP_TAG: "",
+    }
+    partial[tuple(values[group] for group in group_by)] = [scan.total_seconds, scan.count, 0]
+
+
+def _aggregate_shard(task: tuple[tuple[str, ...], tuple[str, ...], str]) -> tuple[Partial, list[str]]:
+    paths, group_by, person_from = task
+    shard: Partial = {}
+    errors: list[str] = []
+
+    for path in paths:
+        partial: Partial = {}
+        try:
+            if path.lower().endswith(DURATION_LOG_EXTENSIONS):
+                _aggregate_duration_log(path, partial, group_by, person_from)
+            else:
+                with open(path, encoding="utf-8-sig", newline="") as handle:
+                    aggregate_lines(
+                        handle,
+                        partial,
+                        group_by,
+                        person=person_from_path(path, person_from),
+                        default_month=month_from_text(os.path.basename(path)),
+                    )
+        except (OSError, ValueError, csv.Error) as error:
+            errors.append(f"{path}: {error}")
+            continue
+        merge_partial(shard, partial)
+
+    return shard, errors
+
+
+def _shard_paths(paths: Sequence[str], shard_count: int) -> list[tuple[str, ...]]:
+    return [tuple(paths[index::shard_count]) for index in range(shard_count)]
+
+
+def aggregate_paths(
+    sources: Sequence[str],
+    group_by: Sequence[str] = GROUP_FIELDS,
+    *,
+    workers: int | None = None,
+    person_from: str = PERSON_FROM_STEM,
+    executor: Executor | None = None,
+) -> AggregateResult:
+    """Aggregate timesheet archives per group across a process pool.
+
+    Files are split round-robin into a few shards per worker and every shard
+    returns only its per-group partial sums, so memory is bounded by the number
+    of groups rather than rows. Integer partials are merged exactly, making the
+    result independent of scheduling; groups are returned sorted by key.
+    """
+    group_by = tuple(group_by)
+    unknown = [group for group in group_by if group not in GROUP_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown group fields: {', '.join(unknown)}")
+    if person_from not in PERSON_SOURCES:
+        raise ValueError(f"Unknown person source: {person_from}")
+
+    paths = discover_files(sources)
+    result = AggregateResult(group_by=group_by, files=len(paths))
+    if not paths:
+        return result
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    shard_count = min(len(paths), max(1, workers) * SHARDS_PER_WORKER)
+    tasks = [(shard, group_by, person_from) for shard in _shard_paths(paths, shard_count)]
+
+    merged: Partial = {}
+
+    def _collect(results: Iterable[tuple[Partial, list[str]]]) -> None:
+        for partial, errors in results:
+            merge_partial(merged, partial)
+            result.errors.extend(errors)
+
+    if executor is not None:
+        _collect(executor.map(_aggregate_shard, tasks))
+    elif workers <= 1 or len(tasks) == 1:
+        _collect(map(_aggregate_shard, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            _collect(pool.map(_aggregate_shard, tasks))
+
+    result.errors.sort()
+    result.groups = [GroupTotal(key, *merged[key]) for key in sorted(merged)]
+    return result
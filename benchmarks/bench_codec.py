@@ -0,0 +1,78 @@
+"""Compare the codec against the previous split/f-string implementations.
+
+Run with ``python -m benchmarks.bench_codec``.
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from time_codec import format_clock, format_many, parse_clock, parse_many
+from ui.utils.time_sum_helpers import mask_hhmmss
+
+SAMPLE_TIMES = [f"{hours:02}:{minutes:02}:{seconds:02}" for hours in range(24) for minutes in (0, 15, 30, 45) for seconds in (0, 30)]
+SAMPLE_SECONDS = list(range(0, 86400 * 4, 997))
+
+
+def _legacy_time_to_seconds(time_str: str) -> int:
+    hours, minutes, seconds = map(int, time_str.split(":"))
+    return hours * 3600 + minutes * 60 + seconds
+
+
+def _legacy_seconds_to_time(seconds: int) -> str:
+    return f"{seconds // 3600:02}:{(seconds % 3600) // 60:02}:{seconds % 60:02}"
+
+
+def _legacy_mask_hhmmss(value: str) -> str:
+    digits = "".join(character for character in value if character.isdigit())[:7]
+    if len(digits) <= 3:
+        return digits
+    if len(digits) == 4:
+        return f"{digits[:2]}:{digits[2:]}"
+    return f"{digits[:-4]}:{digits[-4:-2]}:{digits[-2:]}"
+
+
+def _best_of(statement, repeat: int = 5, number: int = 20) -> float:
+    return min(timeit.repeat(statement, repeat=repeat, number=number)) / number
+
+
+def main() -> None:
+    parse_buffer: list[int | None] = []
+    format_buffer: list[str] = []
+
+    cases = [
+        (
+            "parse",
+            lambda: [_legacy_time_to_seconds(value) for value in SAMPLE_TIMES],
+            lambda: [parse_clock(value) for value in SAMPLE_TIMES],
+        ),
+        (
+            "parse_many",
+            lambda: [_legacy_time_to_seconds(value) for value in SAMPLE_TIMES],
+            lambda: parse_many(SAMPLE_TIMES, out=parse_buffer),
+        ),
+        (
+            "format",
+            lambda: [_legacy_seconds_to_time(value) for value in SAMPLE_SECONDS],
+            lambda: [format_clock(value) for value in SAMPLE_SECONDS],
+        ),
+        (
+            "format_many",
+            lambda: [_legacy_seconds_to_time(value) for value in SAMPLE_SECONDS],
+            lambda: format_many(SAMPLE_SECONDS, out=format_buffer),
+        ),
+        (
+            "mask_hhmmss",
+            lambda: [_legacy_mask_hhmmss(value) for value in SAMPLE_TIMES],
+            lambda: [mask_hhmmss(value) for value in SAMPLE_TIMES],
+        ),
+    ]
+
+    for name, legacy, current in cases:
+        legacy_time = _best_of(legacy)
+        current_time = _best_of(current)
+        print(f"{name:<12} legacy {legacy_time * 1e6:9.1f} us  codec {current_time * 1e6:9.1f} us  x{legacy_time / current_time:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Run the benchmark suite and compare it with the stored baseline.
+
+    python -m benchmarks.run                  # compare with benchmarks/baseline.json
+    python -m benchmarks.run --save-baseline  # overwrite the baseline
+    python -m benchmarks.run --max-terms 1000 # skip the large expressions
+
+Exits with status 1 when a case is slower than the baseline by more than the
+threshold. Timings are normalised by the ``calibration`` case so that a
+uniformly slower or busier machine does not show up as a regression; still,
+refresh the baseline when the interpreter or hardware changes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+from pathlib import Path
+
+from benchmarks.suite import CALIBRATION_CASE, EXPRESSION_SIZES, BenchmarkCase, build_cases
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+DEFAULT_THRESHOLD = 0.25
+
+
+def run_case(case: BenchmarkCase) -> float:
+    statement = case.setup()
+    timings = timeit.repeat(statement, number=case.number, repeat=case.repeat)
+    return min(timings) / case.number
+
+
+def compare_results(
+    baseline: dict[str, float],
+    current: dict[str, float],
+    threshold: float,
+) -> list[tuple[str, float, float, float]]:
+    """Return ``(name, baseline, current, ratio)`` for every case slower than allowed.
+
+    ``ratio`` is corrected by the calibration case when both runs have it.
+    """
+    machine_factor = 1.0
+    if baseline.get(CALIBRATION_CASE) and current.get(CALIBRATION_CASE):
+        machine_factor = current[CALIBRATION_CASE] / baseline[CALIBRATION_CASE]
+
+    regressions = []
+    for name, current_seconds in current.items():
+        baseline_seconds = baseline.get(name)
+        if not baseline_seconds or name == CALIBRATION_CASE:
+            continue
+
+        ratio = current_seconds / baseline_seconds / machine_factor
+        if ratio > 1 + threshold:
+            regressions.append((name, baseline_seconds, current_seconds, ratio))
+    return regressions
+
+
+def load_baseline(path: Path) -> dict[str, float]:
+    if not path.exists():
+        return {}
+    with path.open(encoding="utf-8") as handle:
+        return json.load(handle).get("results", {})
+
+
+def save_baseline(path: Path, results: dict[str, float]) -> None:
+    payload = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    with path.open("w", encoding="utf-8") as handle:
+        json.dump(payload, handle, indent=2, sort_keys=True)
+        handle.write("\n")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--max-terms", type=int, default=EXPRESSION_SIZES[-1])
+    parser.add_argument("--only", help="run only cases whose name contains this text")
+    args = parser.parse_args(argv)
+
+    baseline = load_baseline(args.baseline)
+    results: dict[str, float] = {}
+
+    for case in build_cases(args.max_terms):
+        if args.only and args.only not in case.name:
+            continue
+
+        seconds = run_case(case)
+        results[case.name] = seconds
+
+        reference = baseline.get(case.name)
+        change = f"{(seconds / reference - 1) * 100:+7.1f}%" if reference else "    new"
+        per_term_ns = seconds / case.terms * 1e9
+        print(f"{case.name:<36} {seconds * 1e3:10.3f} ms  {per_term_ns:8.1f} ns/term  {change}")
+
+    if args.save_baseline:
+        save_baseline(args.baseline, {**baseline, **results})
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    regressions = compare_results(baseline, results, args.threshold)
+    for name, baseline_seconds, current_seconds, ratio in regressions:
+        print(
+            f"REGRESSION {name}: {baseline_seconds * 1e3:.3f} ms -> {current_seconds * 1e3:.3f} ms (x{ratio:.2f})",
+            file=sys.stderr,
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
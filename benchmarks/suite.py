@@ -0,0 +1,118 @@
+"""Benchmark cases for the hot helpers in time_utils and ui.utils."""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from time_utils import calculate_time_expression, seconds_to_time, time_to_seconds
+from ui.models import TimeRowState
+from ui.utils.time_converter_helpers import sanitize_decimal_input
+from ui.utils.time_sum_helpers import build_expression_payload, mask_hhmmss, parse_multiplier
+
+EXPRESSION_SIZES = (10, 1_000, 100_000, 1_000_000)
+SAMPLE_SIZE = 1_000
+SEED = 20240601
+CALIBRATION_CASE = "calibration"
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkCase:
+    name: str
+    setup: Callable[[], Callable[[], object]]
+    number: int = 10
+    repeat: int = 5
+    terms: int = SAMPLE_SIZE
+
+
+def _random_times(count: int, generator: random.Random) -> list[str]:
+    return [
+        f"{generator.randint(0, 99):02}:{generator.randint(0, 59):02}:{generator.randint(0, 59):02}"
+        for _ in range(count)
+    ]
+
+
+def _calibration_case() -> Callable[[], object]:
+    # Plain interpreter work that no repo change can affect; used to normalise machine speed.
+    values = [str(index) for index in range(SAMPLE_SIZE)]
+    return lambda: [int(value) * 3 + len(value) for value in values]
+
+
+def _time_to_seconds_case() -> Callable[[], object]:
+    times = _random_times(SAMPLE_SIZE, random.Random(SEED))
+    return lambda: [time_to_seconds(value) for value in times]
+
+
+def _seconds_to_time_case() -> Callable[[], object]:
+    generator = random.Random(SEED)
+    seconds = [generator.randint(0, 360_000) for _ in range(SAMPLE_SIZE)]
+    return lambda: [seconds_to_time(value) for value in seconds]
+
+
+def _expression_case(size: int) -> Callable[[], Callable[[], object]]:
+    def setup() -> Callable[[], object]:
+        generator = random.Random(SEED + size)
+        times = _random_times(size, generator)
+        operators = [generator.choice("+-") for _ in range(size - 1)]
+        multipliers = [generator.choice([1.0, 1.5, 2.0, 0.5, 1.15]) for _ in range(size - 1)]
+        return lambda: calculate_time_expression(times, operators, multipliers)
+
+    return setup
+
+
+def _build_expression_payload_case() -> Callable[[], object]:
+    generator = random.Random(SEED)
+    rows = [
+        TimeRowState(
+            row_id=str(index),
+            operator=generator.choice("+-"),
+            value=value,
+            multiplier=generator.choice(["1", "1,5", "2", "abc", ""]),
+            is_active=generator.random() > 0.1,
+        )
+        for index, value in enumerate(_random_times(SAMPLE_SIZE, generator))
+    ]
+    return lambda: build_expression_payload(rows)
+
+
+def _mask_hhmmss_case() -> Callable[[], object]:
+    generator = random.Random(SEED)
+    raw_values = [value.replace(":", "")[: generator.randint(1, 7)] for value in _random_times(SAMPLE_SIZE, generator)]
+    raw_values += _random_times(SAMPLE_SIZE, generator)
+    return lambda: [mask_hhmmss(value) for value in raw_values]
+
+
+def _parse_multiplier_case() -> Callable[[], object]:
+    generator = random.Random(SEED)
+    values = [generator.choice(["1", "1.5", "2,25", "0", "", "1..2", "abc", "12.3456"]) for _ in range(SAMPLE_SIZE)]
+    return lambda: [parse_multiplier(value) for value in values]
+
+
+def _sanitize_decimal_input_case() -> Callable[[], object]:
+    generator = random.Random(SEED)
+    values = [generator.choice(["1", "ab1,5x", "12.34", "1..2", "3600", "0,25h"]) for _ in range(SAMPLE_SIZE)]
+    return lambda: [sanitize_decimal_input(value) for value in values]
+
+
+def build_cases(max_terms: int = EXPRESSION_SIZES[-1]) -> list[BenchmarkCase]:
+    cases = [
+        BenchmarkCase(CALIBRATION_CASE, _calibration_case),
+        BenchmarkCase("time_to_seconds", _time_to_seconds_case),
+        BenchmarkCase("seconds_to_time", _seconds_to_time_case),
+        BenchmarkCase("build_expression_payload", _build_expression_payload_case),
+        BenchmarkCase("mask_hhmmss", _mask_hhmmss_case, terms=SAMPLE_SIZE * 2),
+        BenchmarkCase("parse_multiplier", _parse_multiplier_case),
+        BenchmarkCase("sanitize_decimal_input", _sanitize_decimal_input_case),
+    ]
+
+    for size in EXPRESSION_SIZES:
+        if size > max_terms:
+            continue
+        number = max(1, 10_000 // size)
+        repeat = 3 if size >= 100_000 else 5
+        cases.append(
+            BenchmarkCase(f"calculate_time_expression[{size}]", _expression_case(size), number, repeat, size)
+        )
+
+    return cases
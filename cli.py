@@ -0,0 +1,315 @@
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import sys
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING, TextIO
+
+from profiling import PROFILE_MODES
+from time_utils import calculate_vacation_days, seconds_to_float_hours
+from ui.utils.time_sum_helpers import format_signed_seconds, signed_effective_seconds
+
+# Subcommand backends (process pools, NumPy) are imported by their handlers, so
+# a plain GUI start only pays for argument parsing.
+if TYPE_CHECKING:
+    from aggregation import AggregateResult
+
+
+class StreamingTotal:
+    """Sums rows with the same rules as ``build_expression_payload`` in O(1) memory."""
+
+    def __init__(self) -> None:
+        self.total_seconds = 0
+        self.row_count = 0
+        self.skipped_count = 0
+
+    def add(self, operator: str, time_text: str, multiplier_text: str = "1") -> bool:
+        self.row_count += 1
+
+        signed_seconds = signed_effective_seconds(operator, time_text, multiplier_text)
+        if signed_seconds is None:
+            self.skipped_count += 1
+            return False
+
+        self.total_seconds += signed_seconds
+        return True
+
+    def add_line(self, line: str) -> bool:
+        if ";" in line:
+            line = line.replace(";", " ")
+
+        fields = line.split()
+        if not fields or fields[0].startswith("#"):
+            return False
+
+        operator = "+"
+        head = fields[0]
+        if head in {"+", "-"}:
+            operator = head
+            fields = fields[1:]
+        elif head[0] in "+-":
+            operator = head[0]
+            fields[0] = head[1:]
+
+        if not fields:
+            self.row_count += 1
+            self.skipped_count += 1
+            return False
+
+        multiplier_text = fields[1].lstrip("x*") if len(fields) > 1 else "1"
+        return self.add(operator, fields[0], multiplier_text)
+
+    def add_lines(self, lines: Iterable[str]) -> None:
+        for line in lines:
+            self.add_line(line)
+
+    def summary(self, daily_norm: str) -> dict[str, object]:
+        return {
+            "total_seconds": self.total_seconds,
+            "clock": format_signed_seconds(self.total_seconds),
+            "hours": seconds_to_float_hours(self.total_seconds),
+            "days": calculate_vacation_days(self.total_seconds, daily_norm),
+            "rows": self.row_count,
+            "skipped": self.skipped_count,
+        }
+
+
+def _iter_sources(paths: Sequence[str], stdin: TextIO) -> Iterable[TextIO]:
+    if not paths:
+        yield stdin
+        return
+
+    for path in paths:
+        if path == "-":
+            yield stdin
+            continue
+
+        with open(path, encoding="utf-8-sig") as handle:
+            yield handle
+
+
+def _write_summary(summary: dict[str, object], output_format: str, stdout: TextIO) -> None:
+    if output_format == "json":
+        stdout.write(json.dumps(summary) + "\n")
+        return
+
+    stdout.write(f"Format zegarowy: {summary['clock']}\n")
+    stdout.write(f"Format dziesiętny: {summary['hours']:.2f} h\n")
+    stdout.write(f"Liczba dni: {summary['days']:.2f}\n")
+    stdout.write(f"Wiersze: {summary['rows']} (pominięte: {summary['skipped']})\n")
+
+
+def _run_sum(args: argparse.Namespace, stdin: TextIO, stdout: TextIO) -> int:
+    total = StreamingTotal()
+    try:
+        for source in _iter_sources(args.files, stdin):
+            total.add_lines(source)
+    except (OSError, UnicodeDecodeError) as error:
+        print(f"[Godzinator] {error}", file=sys.stderr)
+        return 1
+
+    _write_summary(total.summary(args.norm), args.format, stdout)
+    return 0
+
+
+def _run_durations(args: argparse.Namespace, stdout: TextIO) -> int:
+    from duration_log import DurationScan, read_duration_log
+
+    total = DurationScan()
+    try:
+        for path in args.files:
+            total.merge(read_duration_log(path))
+    except (OSError, UnicodeDecodeError) as error:
+        print(f"[Godzinator] {error}", file=sys.stderr)
+        return 1
+
+    summary = {
+        "total_seconds": total.total_seconds,
+        "clock": total.clock,
+        "hours": total.hours,
+        "days": calculate_vacation_days(total.total_seconds, args.norm),
+        "rows": total.count,
+        "skipped": 0,
+    }
+    _write_summary(summary, args.format, stdout)
+    return 0
+
+
+def _run_calc(args: argparse.Namespace, stdin: TextIO, stdout: TextIO) -> int:
+    from time_expression import evaluate_many
+
+    lines = args.expressions or [line.rstrip("\n") for line in stdin]
+    expressions = [line for line in lines if line.strip() and not line.lstrip().startswith("#")]
+    results = evaluate_many(expressions)
+
+    if args.format == "json":
+        records = [
+            {
+                "expression": expression,
+                "result": None if result is None else str(result),
+                "total_seconds": result.seconds if result is not None and result.is_duration else None,
+            }
+            for expression, result in zip(expressions, results)
+        ]
+        stdout.write(json.dumps(records, ensure_ascii=False) + "\n")
+    else:
+        for expression, result in zip(expressions, results):
+            stdout.write(f"{expression} = {'błąd' if result is None else result}\n")
+    return 1 if None in results else 0
+
+
+def _parse_group_by(raw: str) -> tuple[str, ...]:
+    from aggregation import GROUP_FIELDS
+
+    groups = tuple(part.strip() for part in raw.split(",") if part.strip())
+    unknown = [group for group in groups if group not in GROUP_FIELDS]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"nieznane grupowanie: {', '.join(unknown)}")
+    return groups
+
+
+def _write_aggregate(result: AggregateResult, daily_norm: str, output_format: str, stdout: TextIO) -> None:
+    records = [
+        {
+            **dict(zip(result.group_by, group.key)),
+            "total_seconds": group.total_seconds,
+            "clock": format_signed_seconds(group.total_seconds),
+            "hours": seconds_to_float_hours(group.total_seconds),
+            "days": calculate_vacation_days(group.total_seconds, daily_norm),
+            "rows": group.rows,
+            "skipped": group.skipped,
+        }
+        for group in result.groups
+    ]
+
+    if output_format == "json":
+        payload = {"files": result.files, "errors": result.errors, "groups": records}
+        stdout.write(json.dumps(payload, ensure_ascii=False) + "\n")
+        return
+
+    if output_format == "csv":
+        columns = [*result.group_by, "total_seconds", "clock", "hours", "days", "rows", "skipped"]
+        writer = csv.DictWriter(stdout, fieldnames=columns, lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(records)
+        return
+
+    for record in records:
+        labels = " | ".join(str(record[group]) or "-" for group in result.group_by)
+        stdout.write(f"{labels}: {record['clock']} ({record['hours']:.2f} h, {record['days']:.2f} dni)\n")
+    total = result.total_seconds
+    stdout.write(f"Razem: {format_signed_seconds(total)} ({seconds_to_float_hours(total):.2f} h)\n")
+    stdout.write(f"Pliki: {result.files} (błędy: {len(result.errors)})\n")
+
+
+def _parse_person_from(raw: str) -> str:
+    from aggregation import PERSON_SOURCES
+
+    if raw not in PERSON_SOURCES:
+        raise argparse.ArgumentTypeError(f"nieznane źródło osoby: {raw} (dostępne: {', '.join(PERSON_SOURCES)})")
+    return raw
+
+
+def _run_aggregate(args: argparse.Namespace, stdout: TextIO) -> int:
+    from aggregation import GROUP_FIELDS, PERSON_SOURCES, aggregate_paths
+
+    result = aggregate_paths(
+        args.sources,
+        args.by or GROUP_FIELDS,
+        workers=args.workers,
+        person_from=args.person_from or PERSON_SOURCES[0],
+    )
+    for error in result.errors:
+        print(f"[Godzinator] {error}", file=sys.stderr)
+
+    _write_aggregate(result, args.norm, args.format, stdout)
+    return 1 if result.errors else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="godzinator")
+    parser.add_argument(
+        "--startup-report",
+        action="store_true",
+        help="wypisz czasy faz uruchamiania aplikacji okienkowej",
+    )
+    parser.add_argument(
+        "--profile",
+        choices=PROFILE_MODES,
+        help="zapisz profil aplikacji okienkowej przy zamknięciu (JSON lub cProfile)",
+    )
+    commands = parser.add_subparsers(dest="command")
+
+    commands.add_parser("gui", help="uruchom aplikację okienkową (domyślnie)")
+
+    sum_parser = commands.add_parser(
+        "sum",
+        help="zsumuj wiersze '[+|-] HH:MM:SS [mnożnik]' z plików lub stdin",
+    )
+    sum_parser.add_argument("files", nargs="*", help="pliki wejściowe; '-' oznacza stdin")
+    sum_parser.add_argument("--norm", default="08:00:00", help="norma dobowa do liczby dni")
+    sum_parser.add_argument("--format", choices=("text", "json"), default="text")
+
+    durations_parser = commands.add_parser(
+        "durations",
+        help="zsumuj tokeny HH:MM:SS z wielogigabajtowych logów (mmap, bez dekodowania linii)",
+    )
+    durations_parser.add_argument("files", nargs="+", help="pliki logów")
+    durations_parser.add_argument("--norm", default="08:00:00", help="norma dobowa do liczby dni")
+    durations_parser.add_argument("--format", choices=("text", "json"), default="text")
+
+    calc_parser = commands.add_parser(
+        "calc",
+        help="oblicz wyrażenia czasu, np. '(08:00:00 - 00:30:00) * 5', z argumentów lub stdin (jedno w linii)",
+    )
+    calc_parser.add_argument("expressions", nargs="*", help="wyrażenia; bez nich czytane są linie ze stdin")
+    calc_parser.add_argument("--format", choices=("text", "json"), default="text")
+
+    aggregate_parser = commands.add_parser(
+        "aggregate",
+        help="zsumuj archiwa CSV/TSV z katalogów lub wzorców glob na wielu rdzeniach",
+    )
+    aggregate_parser.add_argument("sources", nargs="+", help="katalogi, pliki lub wzorce glob")
+    aggregate_parser.add_argument(
+        "--by",
+        type=_parse_group_by,
+        default=None,
+        help="grupowanie oddzielone przecinkami: person, month, tag (domyślnie wszystkie)",
+    )
+    aggregate_parser.add_argument("--workers", type=int, default=None, help="liczba procesów (domyślnie liczba rdzeni)")
+    aggregate_parser.add_argument(
+        "--person-from",
+        type=_parse_person_from,
+        default=None,
+        help="osoba z nazwy pliku (stem) lub katalogu nadrzędnego (parent)",
+    )
+    aggregate_parser.add_argument("--norm", default="08:00:00", help="norma dobowa do liczby dni")
+    aggregate_parser.add_argument("--format", choices=("text", "json", "csv"), default="text")
+
+    return parser
+
+
+def main(
+    argv: Sequence[str] | None = None,
+    stdin: TextIO | None = None,
+    stdout: TextIO | None = None,
+) -> int:
+    args = build_parser().parse_args(argv)
+    stdin = stdin if stdin is not None else sys.stdin
+    stdout = stdout if stdout is not None else sys.stdout
+
+    if args.command == "sum":
+        return _run_sum(args, stdin, stdout)
+    if args.command == "durations":
+        return _run_durations(args, stdout)
+    if args.command == "aggregate":
+        return _run_aggregate(args, stdout)
+    if args.command == "calc":
+        return _run_calc(args, stdin, stdout)
+
+    from gui import run_app
+
+    run_app(startup_report=args.startup_report, profile=args.profile)
+    return 0
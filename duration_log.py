@@ -0,0 +1,196 @@
+"""Scan raw ``HH:MM:SS`` duration logs straight from a memory-mapped file.
+
+Time-clock dumps can be several gigabytes, so the file is never decoded or
+split into lines. With NumPy the mapped bytes are viewed in newline-aligned
+chunks and tokens are located and summed with array operations; without it a
+regular expression runs over the ``mmap`` buffer. Both accept exactly the same
+tokens.
+"""
+
+from __future__ import annotations
+
+import mmap
+import re
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from time_batch import HAS_NUMPY, _resolve_backend, np
+from time_utils import seconds_to_float_hours, seconds_to_time
+
+DURATION_LOG_EXTENSIONS = (".log",)
+SCAN_CHUNK_BYTES = 16 * 1024 * 1024
+
+# An optional sign glued to the token, 1-3 hour digits and two-digit minutes and
+# seconds. Tokens inside longer numbers, dotted versions or timestamps with
+# fractions are rejected by the look-arounds.
+DURATION_PATTERN = re.compile(rb"(?<![\w:.+-])([+-]?)(\d{1,3}):([0-5]\d):([0-5]\d)(?![\w:])")
+
+Buffer = bytes | bytearray | mmap.mmap
+
+
+@dataclass(slots=True)
+class DurationScan:
+    total_seconds: int = 0
+    count: int = 0
+
+    @property
+    def clock(self) -> str:
+        if self.total_seconds < 0:
+            return f"-{seconds_to_time(-self.total_seconds)}"
+        return seconds_to_time(self.total_seconds)
+
+    @property
+    def hours(self) -> float:
+        return seconds_to_float_hours(self.total_seconds)
+
+    def merge(self, other: DurationScan) -> None:
+        self.total_seconds += other.total_seconds
+        self.count += other.count
+
+
+def _scan_regex(buffer: Buffer) -> DurationScan:
+    hours = minutes = seconds = 0
+    negative_hours = negative_minutes = negative_seconds = 0
+    count = 0
+
+    for match in DURATION_PATTERN.finditer(buffer):
+        sign, hour_text, minute_text, second_text = match.groups()
+        count += 1
+        if sign == b"-":
+            negative_hours += int(hour_text)
+            negative_minutes += int(minute_text)
+            negative_seconds += int(second_text)
+        else:
+            hours += int(hour_text)
+            minutes += int(minute_text)
+            seconds += int(second_text)
+
+    total = (hours - negative_hours) * 3600 + (minutes - negative_minutes) * 60 + seconds - negative_seconds
+    return DurationScan(total_seconds=total, count=count)
+
+
+def _chunk_bounds(buffer: Buffer, chunk_bytes: int) -> Iterator[tuple[int, int]]:
+    size = len(buffer)
+    start = 0
+    while start < size:
+        end = min(start + chunk_bytes, size)
+        if end < size:
+            newline = buffer.rfind(b"\n", start, end)
+            if newline < 0:
+                newline = buffer.find(b"\n", end)
+            end = size if newline < 0 else newline + 1
+        yield start, end
+        start = end
+
+
+def _byte_table(characters: bytes):
+    table = np.zeros(256, dtype=bool)
+    table[list(characters)] = True
+    return table
+
+
+if HAS_NUMPY:
+    _DIGIT = _byte_table(b"0123456789")
+    _TENS_DIGIT = _byte_table(b"012345")
+    _WORD = _byte_table(b"0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_")
+    _AFTER_STOP = _WORD | _byte_table(b":")
+    _BEFORE_STOP = _WORD | _byte_table(b":.+-")
+    _SIGN = _byte_table(b"+-")
+
+
+def _scan_numpy_chunk(chunk) -> tuple[int, int]:
+    size = chunk.size
+    colons = np.flatnonzero(chunk == 58)
+    if colons.size < 2:
+        return 0, 0
+
+    def _at(positions):
+        # Bytes outside the chunk read as a newline, which never belongs to a token.
+        inside = (positions >= 0) & (positions < size)
+        return np.where(inside, chunk[np.clip(positions, 0, size - 1)], 10)
+
+    first = colons[:-1][np.diff(colons) == 3]
+    valid = (
+        _TENS_DIGIT[_at(first + 1)]
+        & _DIGIT[_at(first + 2)]
+        & _TENS_DIGIT[_at(first + 4)]
+        & _DIGIT[_at(first + 5)]
+        & ~_AFTER_STOP[_at(first + 6)]
+        & _DIGIT[_at(first - 1)]
+    )
+    first = first[valid]
+    if first.size == 0:
+        return 0, 0
+
+    second_digit = _DIGIT[_at(first - 2)]
+    third_digit = second_digit & _DIGIT[_at(first - 3)]
+    too_long = third_digit & _DIGIT[_at(first - 4)]
+    hour_length = 1 + second_digit.astype(np.int64) + third_digit
+
+    before = _at(first - 1 - hour_length)
+    signed = _SIGN[before]
+    outer = np.where(signed, _at(first - 2 - hour_length), before)
+    valid = ~too_long & ~_BEFORE_STOP[outer]
+    if not valid.any():
+        return 0, 0
+
+    first = first[valid]
+    second_digit = second_digit[valid]
+    third_digit = third_digit[valid]
+    negative = signed[valid] & (before[valid] == 45)
+
+    def _digit(offset: int):
+        return chunk[first + offset].astype(np.int64) - 48
+
+    hours = _digit(-1)
+    hours += np.where(second_digit, _digit(-2) * 10, 0)
+    hours += np.where(third_digit, _digit(-3) * 100, 0)
+    seconds = hours * 3600 + (_digit(1) * 10 + _digit(2)) * 60 + _digit(4) * 10 + _digit(5)
+    seconds = np.where(negative, -seconds, seconds)
+    return int(seconds.sum()), int(first.size)
+
+
+def _scan_numpy(buffer: Buffer, chunk_bytes: int) -> DurationScan:
+    result = DurationScan()
+    for start, end in _chunk_bounds(buffer, chunk_bytes):
+        chunk = np.frombuffer(buffer, dtype=np.uint8, count=end - start, offset=start)
+        total, count = _scan_numpy_chunk(chunk)
+        result.total_seconds += total
+        result.count += count
+    return result
+
+
+def scan_durations(
+    buffer: Buffer,
+    use_numpy: bool | None = None,
+    chunk_bytes: int = SCAN_CHUNK_BYTES,
+) -> DurationScan:
+    """Sum every duration token in ``buffer``; ``-`` tokens are subtracted."""
+    if _resolve_backend(use_numpy):
+        return _scan_numpy(buffer, chunk_bytes)
+    return _scan_regex(buffer)
+
+
+@contextmanager
+def map_file(path: str) -> Iterator[Buffer]:
+    """Yield a read-only ``mmap`` of ``path`` (an empty buffer for empty files)."""
+    with open(path, "rb") as handle:
+        try:
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Zero-length files cannot be mapped.
+            yield b""
+            return
+
+        try:
+            if hasattr(mapped, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            yield mapped
+        finally:
+            mapped.close()
+
+
+def read_duration_log(path: str, use_numpy: bool | None = None) -> DurationScan:
+    with map_file(path) as buffer:
+        return scan_durations(buffer, use_numpy=use_numpy)
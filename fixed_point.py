@@ -0,0 +1,69 @@
+"""Exact fixed-point multipliers.
+
+Multipliers are stored as integers scaled by ``MULTIPLIER_SCALE`` (four
+decimal places), so ``1.15`` is ``11500`` and applying it to a duration is
+pure integer math with the same half-up rounding the float path used to
+approximate. Text with more than four decimals is rounded half-up once, when
+it is parsed.
+"""
+
+from __future__ import annotations
+
+import math
+from decimal import ROUND_HALF_UP, Decimal
+from functools import lru_cache
+
+MULTIPLIER_DECIMALS = 4
+MULTIPLIER_SCALE = 10**MULTIPLIER_DECIMALS
+FIXED_ONE = MULTIPLIER_SCALE
+
+_HALF_SCALE = MULTIPLIER_SCALE // 2
+_QUANTUM = Decimal(1).scaleb(-MULTIPLIER_DECIMALS)
+
+
+@lru_cache(maxsize=4096)
+def parse_fixed_multiplier(raw: str) -> int | None:
+    """Parse ``"1,5"`` / ``"1.5"`` / ``"2"`` to a scaled integer, or None if invalid."""
+    normalized = raw.strip().replace(",", ".")
+    if not normalized or normalized == ".":
+        return None
+
+    whole, separator, fraction = normalized.partition(".")
+    if (whole and not whole.isdigit()) or (fraction and not fraction.isdigit()):
+        return None
+    if not whole.isascii() or not fraction.isascii():
+        return None
+
+    scaled = int(whole or "0") * MULTIPLIER_SCALE
+    if fraction:
+        scaled += int(fraction[:MULTIPLIER_DECIMALS].ljust(MULTIPLIER_DECIMALS, "0"))
+        if len(fraction) > MULTIPLIER_DECIMALS and fraction[MULTIPLIER_DECIMALS] >= "5":
+            scaled += 1
+    return scaled
+
+
+@lru_cache(maxsize=4096)
+def fixed_multiplier_from_float(value: float) -> int:
+    """Scale a float multiplier using its shortest decimal form (``1.15`` -> ``11500``)."""
+    if not math.isfinite(value):
+        raise ValueError("multiplier must be a finite number")
+    if value < 0:
+        raise ValueError("multiplier must be greater than or equal to 0")
+    return int(Decimal(repr(float(value))).quantize(_QUANTUM, rounding=ROUND_HALF_UP).scaleb(MULTIPLIER_DECIMALS))
+
+
+def fixed_to_float(scaled: int) -> float:
+    return scaled / MULTIPLIER_SCALE
+
+
+def format_fixed_multiplier(scaled: int) -> str:
+    """Shortest text that parses back to ``scaled`` (``15000`` -> ``"1.5"``)."""
+    whole, fraction = divmod(scaled, MULTIPLIER_SCALE)
+    if not fraction:
+        return str(whole)
+    return f"{whole}.{fraction:0{MULTIPLIER_DECIMALS}d}".rstrip("0")
+
+
+def apply_fixed_multiplier(seconds: int, scaled: int) -> int:
+    """Half-up rounded ``seconds * multiplier`` for non-negative ``seconds``."""
+    return (seconds * scaled + _HALF_SCALE) // MULTIPLIER_SCALE
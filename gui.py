@@ -1,11 +1,50 @@
-import customtkinter as ctk
+from __future__ import annotations
 
-from ui.app import GodzinatorApp
+from profiling import PROFILER
+from startup import StartupBudget, startup_report_requested
 
 
-def run_app() -> None:
+def run_app(startup_report: bool = False, profile: str | None = None) -> None:
+    if profile:
+        PROFILER.enable(profile)
+    else:
+        PROFILER.configure_from_env()
+
+    budget = StartupBudget()
+
+    # Imported here so that the CLI and the startup report do not pay for the GUI stack up front.
+    import customtkinter as ctk
+
+    budget.mark("import customtkinter")
+
+    from ui.app import GodzinatorApp
+
+    budget.mark("import ui.app")
+
     ctk.set_appearance_mode("system")
     ctk.set_default_color_theme("blue")
 
-    app = GodzinatorApp()
+    app = GodzinatorApp(startup_budget=budget)
+    show_report = startup_report or startup_report_requested()
+
+    def _on_first_paint() -> None:
+        budget.mark("first paint")
+        for phase, duration_ms in budget.phases:
+            PROFILER.record_phase(phase, duration_ms)
+        if show_report:
+            print(budget.report())
+
+    def _on_close() -> None:
+        if PROFILER.enabled:
+            app.collect_profile_gauges()
+        app.shutdown()
+        app.destroy()
+
+    if show_report or PROFILER.enabled:
+        app.after_idle(_on_first_paint)
+    app.protocol("WM_DELETE_WINDOW", _on_close)
+
     app.mainloop()
+
+    for path in PROFILER.dump():
+        print(f"[Godzinator] Profile written to {path}")
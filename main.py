@@ -1,5 +1,5 @@
-from gui import run_app
+from cli import main
 
 
 if __name__ == "__main__":
-    run_app()
+    raise SystemExit(main())
@@ -0,0 +1,148 @@
+"""Opt-in instrumentation for boot phases, input handlers and recalculations.
+
+Enable with ``GODZINATOR_PROFILE=json`` (or ``cprofile``) or ``--profile``.
+When disabled every hook returns after a single attribute check.
+"""
+
+from __future__ import annotations
+
+import bisect
+import cProfile
+import functools
+import json
+import os
+import time
+from collections.abc import Callable, Iterable
+from typing import Any, TypeVar
+
+PROFILE_ENV = "GODZINATOR_PROFILE"
+PROFILE_OUTPUT_ENV = "GODZINATOR_PROFILE_OUTPUT"
+PROFILE_MODES = ("json", "cprofile")
+DEFAULT_OUTPUT = "godzinator-profile"
+
+LATENCY_BUCKETS_MS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class LatencyHistogram:
+    def __init__(self, bounds_ms: Iterable[float] = LATENCY_BUCKETS_MS) -> None:
+        self.bounds_ms = tuple(bounds_ms)
+        self.buckets = [0] * (len(self.bounds_ms) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, duration_ms: float) -> None:
+        self.buckets[bisect.bisect_left(self.bounds_ms, duration_ms)] += 1
+        self.count += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+
+    def to_dict(self) -> dict[str, Any]:
+        labels = [f"<={bound}ms" for bound in self.bounds_ms] + [f">{self.bounds_ms[-1]}ms"]
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 4) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 4),
+            "buckets": dict(zip(labels, self.buckets)),
+        }
+
+
+class Profiler:
+    def __init__(self) -> None:
+        self.enabled = False
+        self.mode = ""
+        self.output_path = DEFAULT_OUTPUT
+        self.phases: list[tuple[str, float]] = []
+        self.handlers: dict[str, LatencyHistogram] = {}
+        self.counters: dict[str, int] = {}
+        self.gauges: dict[str, float] = {}
+        self._cprofile: cProfile.Profile | None = None
+
+    def enable(self, mode: str = "json", output_path: str | None = None) -> None:
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"profile mode must be one of {', '.join(PROFILE_MODES)}")
+
+        self.enabled = True
+        self.mode = mode
+        self.output_path = output_path or DEFAULT_OUTPUT
+
+        if mode == "cprofile" and self._cprofile is None:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+
+    def configure_from_env(self) -> None:
+        mode = os.environ.get(PROFILE_ENV, "").strip().lower()
+        if mode in {"1", "true", "yes", "on"}:
+            mode = "json"
+        if mode in PROFILE_MODES:
+            self.enable(mode, os.environ.get(PROFILE_OUTPUT_ENV) or None)
+
+    def record_phase(self, phase: str, duration_ms: float) -> None:
+        if self.enabled:
+            self.phases.append((phase, duration_ms))
+
+    def record_latency(self, name: str, duration_ms: float) -> None:
+        histogram = self.handlers.get(name)
+        if histogram is None:
+            histogram = self.handlers[name] = LatencyHistogram()
+        histogram.add(duration_ms)
+
+    def count(self, name: str, amount: int = 1) -> None:
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def set_gauge(self, name: str, value: float) -> None:
+        if self.enabled:
+            self.gauges[name] = value
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "boot_phases": [{"phase": phase, "ms": round(duration_ms, 3)} for phase, duration_ms in self.phases],
+            "handlers": {name: histogram.to_dict() for name, histogram in sorted(self.handlers.items())},
+            "counters": dict(sorted(self.counters.items())),
+            "gauges": dict(sorted(self.gauges.items())),
+        }
+
+    def dump(self) -> list[str]:
+        """Write the JSON trace (and the cProfile stats in ``cprofile`` mode); return the paths."""
+        if not self.enabled:
+            return []
+
+        written: list[str] = []
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            stats_path = f"{self.output_path}.prof"
+            self._cprofile.dump_stats(stats_path)
+            written.append(stats_path)
+
+        json_path = f"{self.output_path}.json"
+        with open(json_path, "w", encoding="utf-8") as handle:
+            json.dump(self.snapshot(), handle, indent=2)
+        written.append(json_path)
+        return written
+
+
+PROFILER = Profiler()
+
+
+def profiled(name: str) -> Callable[[F], F]:
+    """Record the latency of every call to the decorated handler under ``name``."""
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not PROFILER.enabled:
+                return func(*args, **kwargs)
+
+            started_at = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                PROFILER.record_latency(name, (time.perf_counter() - started_at) * 1000)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
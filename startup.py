@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import os
+import time
+from collections.abc import Callable
+
+STARTUP_REPORT_ENV = "GODZINATOR_STARTUP_REPORT"
+STARTUP_BUDGET_MS = 800.0
+
+
+def startup_report_requested() -> bool:
+    return os.environ.get(STARTUP_REPORT_ENV, "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+class StartupBudget:
+    """Records named boot phases and compares the time to first paint with a budget."""
+
+    def __init__(self, budget_ms: float = STARTUP_BUDGET_MS, clock: Callable[[], float] = time.perf_counter) -> None:
+        self.budget_ms = budget_ms
+        self._clock = clock
+        self._started_at = clock()
+        self._last_mark = self._started_at
+        self.phases: list[tuple[str, float]] = []
+
+    def mark(self, phase: str) -> float:
+        now = self._clock()
+        duration_ms = (now - self._last_mark) * 1000
+        self._last_mark = now
+        self.phases.append((phase, duration_ms))
+        return duration_ms
+
+    @property
+    def elapsed_ms(self) -> float:
+        return (self._last_mark - self._started_at) * 1000
+
+    @property
+    def is_within_budget(self) -> bool:
+        return self.elapsed_ms <= self.budget_ms
+
+    def report(self) -> str:
+        lines = ["[Godzinator] Startup budget report"]
+        cumulative_ms = 0.0
+        for phase, duration_ms in self.phases:
+            cumulative_ms += duration_ms
+            lines.append(f"  {phase:<28} {duration_ms:8.1f} ms  {cumulative_ms:8.1f} ms")
+
+        status = "OK" if self.is_within_budget else "OVER BUDGET"
+        lines.append(f"  {'total':<28} {self.elapsed_ms:8.1f} ms  budget {self.budget_ms:.0f} ms  {status}")
+        return "\n".join(lines)
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import io
+import json
+import os
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+from aggregation import (
+    GROUP_MONTH,
+    GROUP_PERSON,
+    GROUP_TAG,
+    PERSON_FROM_PARENT,
+    aggregate_lines,
+    aggregate_paths,
+    discover_files,
+    month_from_text,
+)
+from cli import main
+
+
+def _write(path: str, text: str) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as handle:
+        handle.write(text)
+
+
+class TestAggregateLines(unittest.TestCase):
+    def test_groups_by_month_column_and_normalized_tag(self) -> None:
+        partial: dict[tuple[str, ...], list[int]] = {}
+        aggregate_lines(
+            [
+                "znak;czas;mnożnik;aktywny;opis;data\n",
+                "+;01:00:00;1;1;Projekt  A;2024-03-04\n",
+                "-;00:15:00;2;1;projekt a;2024-03-05\n",
+                "+;02:00:00;1;0;Projekt A;2024-03-06\n",
+                "+;abc;1;1;Projekt A;2024-04-01\n",
+                "+;00:30:00;1;1;;\n",
+            ],
+            partial,
+            (GROUP_PERSON, GROUP_MONTH, GROUP_TAG),
+            person="jan",
+            default_month="2024-05",
+        )
+
+        self.assertEqual(
+            partial,
+            {
+                ("jan", "2024-03", "projekt a"): [1800, 3, 0],
+                ("jan", "2024-04", "projekt a"): [0, 1, 1],
+                ("jan", "2024-05", ""): [1800, 1, 0],
+            },
+        )
+
+    def test_month_from_text(self) -> None:
+        self.assertEqual(month_from_text("anna_2024_11.csv"), "2024-11")
+        self.assertEqual(month_from_text("2023-12-31"), "2023-12")
+        self.assertEqual(month_from_text("anna.csv"), "")
+
+
+class TestAggregatePaths(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = self._tmp.name
+        for person in ("anna", "jan", "ola"):
+            for month in ("2024-01", "2024-02"):
+                _write(
+                    os.path.join(self.root, person, f"{month}.csv"),
+                    "operator,time,multiplier,active,description\n"
+                    "+,01:00:00,1.5,1,Urlop\n"
+                    "+,00:20:00,1,1,Nadgodziny\n"
+                    "-,00:05:00,1,1,nadgodziny\n",
+                )
+        _write(os.path.join(self.root, "notes.md"), "ignored")
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_discover_files_expands_directories_and_globs(self) -> None:
+        by_directory = discover_files([self.root])
+        by_glob = discover_files([os.path.join(self.root, "*", "2024-01.csv")])
+
+        self.assertEqual(len(by_directory), 6)
+        self.assertEqual(by_directory, sorted(by_directory))
+        self.assertEqual(len(by_glob), 3)
+
+    def test_groups_are_sorted_and_summed_per_person_month_and_tag(self) -> None:
+        result = aggregate_paths([self.root], workers=1, person_from=PERSON_FROM_PARENT)
+
+        self.assertEqual(result.files, 6)
+        self.assertEqual(len(result.groups), 12)
+        self.assertEqual([group.key for group in result.groups], sorted(group.key for group in result.groups))
+        first = result.groups[0]
+        self.assertEqual(first.key, ("anna", "2024-01", "nadgodziny"))
+        self.assertEqual((first.total_seconds, first.rows, first.skipped), (900, 2, 0))
+        self.assertEqual(result.total_seconds, 6 * (5400 + 900))
+
+    def test_process_pool_matches_serial_result(self) -> None:
+        serial = aggregate_paths([self.root], (GROUP_TAG,), workers=1)
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            parallel = aggregate_paths([self.root], (GROUP_TAG,), workers=2, executor=pool)
+
+        self.assertEqual(parallel.groups, serial.groups)
+        self.assertEqual([group.key for group in serial.groups], [("nadgodziny",), ("urlop",)])
+
+    def test_unreadable_files_are_reported(self) -> None:
+        missing = os.path.join(self.root, "missing.csv")
+        result = aggregate_paths([missing, self.root], (GROUP_PERSON,), workers=1)
+
+        self.assertEqual(result.files, 7)
+        self.assertEqual(len(result.errors), 1)
+        self.assertTrue(result.errors[0].startswith(missing))
+
+    def test_unknown_group_is_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            aggregate_paths([self.root], ("team",))
+
+    def test_cli_aggregate_json(self) -> None:
+        stdout = io.StringIO()
+        exit_code = main(
+            ["aggregate", self.root, "--by", "month", "--workers", "1", "--format", "json"],
+            stdout=stdout,
+        )
+
+        payload = json.loads(stdout.getvalue())
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(payload["files"], 6)
+        self.assertEqual([group["month"] for group in payload["groups"]], ["2024-01", "2024-02"])
+        self.assertEqual(payload["groups"][0]["total_seconds"], 3 * 6300)
+
+
+if __name__ == "__main__":
+    unittest.main()
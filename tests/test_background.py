@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import threading
+import time
+import unittest
+from collections.abc import Callable
+
+from ui.utils.background import BackgroundRunner, JobContext
+
+
+class ManualAfterWidget:
+    def __init__(self) -> None:
+        self.pending: list[Callable[[], None]] = []
+
+    def after(self, ms: int, func: Callable[[], None]) -> str:
+        self.pending.append(func)
+        return f"after#{len(self.pending)}"
+
+    def after_idle(self, func: Callable[[], None]) -> str:
+        return self.after(0, func)
+
+    def after_cancel(self, id: str) -> None:
+        pass
+
+
+def _drain(runner: BackgroundRunner, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while runner.is_busy and time.monotonic() < deadline:
+        time.sleep(0.005)
+        runner.poll()
+
+
+class TestBackgroundRunner(unittest.TestCase):
+    def setUp(self) -> None:
+        self.widget = ManualAfterWidget()
+        self.runner = BackgroundRunner(self.widget)
+        self.addCleanup(self.runner.shutdown)
+
+    def test_result_and_progress_are_delivered_on_poll(self) -> None:
+        results: list[int] = []
+        progress: list[tuple[int, int]] = []
+
+        def work(context: JobContext) -> int:
+            context.report(1, 2)
+            return 42
+
+        self.runner.submit("job", work, results.append, on_progress=lambda done, total: progress.append((done, total)))
+        self.assertEqual(results, [])
+        self.assertEqual(len(self.widget.pending), 1)
+
+        _drain(self.runner)
+
+        self.assertEqual(results, [42])
+        self.assertEqual(progress, [(1, 2)])
+        self.assertEqual(self.runner.applied_count, 1)
+
+    def test_stale_version_is_dropped(self) -> None:
+        version = [1]
+        results: list[str] = []
+        release = threading.Event()
+
+        def work(_: JobContext) -> str:
+            release.wait(5)
+            return "old"
+
+        self.runner.submit("recalculate", work, results.append, version=1, current_version=lambda: version[0])
+        version[0] = 2
+        release.set()
+        _drain(self.runner)
+
+        self.assertEqual(results, [])
+        self.assertEqual(self.runner.dropped_count, 1)
+
+    def test_newer_job_with_same_key_supersedes_older(self) -> None:
+        results: list[str] = []
+        release = threading.Event()
+
+        def slow(context: JobContext) -> str:
+            release.wait(5)
+            context.raise_if_cancelled()
+            return "first"
+
+        self.runner.submit("import", slow, results.append)
+        self.runner.submit("import", lambda _: "second", results.append)
+        release.set()
+        _drain(self.runner)
+
+        self.assertEqual(results, ["second"])
+
+    def test_cancel_and_error_paths(self) -> None:
+        errors: list[BaseException] = []
+        finished: list[str] = []
+        release = threading.Event()
+
+        def cancellable(context: JobContext) -> None:
+            release.wait(5)
+            context.report(0, 1)
+
+        def failing(_: JobContext) -> None:
+            raise OSError("disk full")
+
+        self.runner.submit("export", cancellable, lambda _: finished.append("done"), on_finished=lambda job: finished.append(job.key))
+        self.runner.cancel("export")
+        release.set()
+        self.runner.submit("other", failing, lambda _: None, on_error=errors.append)
+        _drain(self.runner)
+
+        self.assertEqual(finished, ["export"])
+        self.assertEqual([str(error) for error in errors], ["disk full"])
+
+
+if __name__ == "__main__":
+    unittest.main()
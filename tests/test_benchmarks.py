@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from benchmarks.run import compare_results, load_baseline, save_baseline
+from benchmarks.suite import build_cases
+
+
+class TestBenchmarkHarness(unittest.TestCase):
+    def test_compare_results_flags_only_cases_over_threshold(self) -> None:
+        baseline = {"fast": 1.0, "slow": 1.0, "missing_current": 1.0}
+        current = {"fast": 1.2, "slow": 1.5, "new_case": 9.0}
+
+        regressions = compare_results(baseline, current, threshold=0.25)
+
+        self.assertEqual([name for name, *_ in regressions], ["slow"])
+        self.assertAlmostEqual(regressions[0][3], 1.5)
+
+    def test_compare_results_normalises_by_calibration(self) -> None:
+        baseline = {"calibration": 1.0, "case": 1.0, "other": 1.0}
+        current = {"calibration": 2.0, "case": 2.2, "other": 3.0}
+
+        regressions = compare_results(baseline, current, threshold=0.25)
+
+        self.assertEqual([name for name, *_ in regressions], ["other"])
+        self.assertAlmostEqual(regressions[0][3], 1.5)
+
+    def test_baseline_round_trip(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "baseline.json"
+            self.assertEqual(load_baseline(path), {})
+
+            save_baseline(path, {"time_to_seconds": 0.001})
+            self.assertEqual(load_baseline(path), {"time_to_seconds": 0.001})
+
+    def test_build_cases_respects_max_terms(self) -> None:
+        names = [case.name for case in build_cases(max_terms=1_000)]
+
+        self.assertIn("calculate_time_expression[1000]", names)
+        self.assertNotIn("calculate_time_expression[100000]", names)
+        self.assertIn("sanitize_decimal_input", names)
+
+
+if __name__ == "__main__":
+    unittest.main()
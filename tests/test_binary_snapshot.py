@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import time_batch
+from ui.models import TimeRowState
+from ui.timesheet import TimesheetModel
+from ui.utils.binary_snapshot import (
+    BinarySnapshot,
+    encode_snapshot,
+    is_snapshot_file,
+    read_snapshot_states,
+    rows_from_states,
+    write_snapshot,
+)
+from ui.utils.time_sum_helpers import row_signed_seconds
+
+
+def _states() -> list[TimeRowState]:
+    return [
+        TimeRowState(row_id="0f8e6a3c2b1d4e5f8a9b0c1d2e3f4a5b", value="01:30:00", multiplier="1,5", description="Spotkanie"),
+        TimeRowState(row_id="custom-id", operator="-", value="010:00:00", multiplier="2"),
+        TimeRowState(row_id="r3", value="00:45:00", multiplier="abc", description="zła mnożna"),
+        TimeRowState(row_id="r4", value="12:3", multiplier="1", description="niepełny"),
+        TimeRowState(row_id="r5", value="02:00:00", multiplier="0.3333", is_active=False, description="zażółć"),
+        TimeRowState(row_id="r6", value="00:00:10", multiplier="1.15000"),
+    ]
+
+
+def _fields(states: list[TimeRowState]) -> list[tuple[object, ...]]:
+    return [
+        (state.row_id, state.operator, state.value, state.multiplier, state.is_active, state.description)
+        for state in states
+    ]
+
+
+class TestBinarySnapshot(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, "session.gdz")
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_round_trip_keeps_texts_exactly(self) -> None:
+        states = _states()
+        write_snapshot(self.path, rows_from_states(states), generation=7)
+
+        self.assertTrue(is_snapshot_file(self.path))
+        self.assertEqual(_fields(read_snapshot_states(self.path)), _fields(states))
+
+        snapshot = BinarySnapshot.open(self.path)
+        self.assertEqual(snapshot.generation, 7)
+        self.assertEqual(len(snapshot), len(states))
+        snapshot.close()
+
+    def test_contributions_come_from_columns(self) -> None:
+        states = _states()
+        snapshot = BinarySnapshot(encode_snapshot(rows_from_states(states)))
+
+        expected = [row_signed_seconds(state) for state in states]
+        self.assertEqual(snapshot.contributions(), expected)
+        self.assertEqual(snapshot.total_seconds(), sum(expected))
+        with mock.patch.object(time_batch, "HAS_NUMPY", False):
+            self.assertEqual(snapshot.contributions(), expected)
+
+    def test_multipliers_beyond_int64_round_trip(self) -> None:
+        states = [
+            TimeRowState(row_id="big", value="00:00:01", multiplier="12345678901234567890"),
+            TimeRowState(row_id="small", value="01:00:00", multiplier="2"),
+        ]
+        snapshot = BinarySnapshot(encode_snapshot(rows_from_states(states)))
+
+        self.assertEqual(_fields(snapshot.states()), _fields(states))
+        self.assertEqual(snapshot.contributions(), [row_signed_seconds(state) for state in states])
+
+    def test_model_materializes_only_accessed_rows(self) -> None:
+        states = [TimeRowState(row_id=str(index), value="00:15:00", description=f"zadanie {index}") for index in range(1_000)]
+        write_snapshot(self.path, rows_from_states(states))
+        snapshot = BinarySnapshot.open(self.path)
+
+        model = TimesheetModel(source=snapshot)
+        self.assertEqual(len(model), 1_000)
+        self.assertEqual(model.total_seconds, 1_000 * 900)
+        self.assertEqual(model.materialized_count, 0)
+
+        self.assertEqual(model.state_at(10).description, "zadanie 10")
+        self.assertEqual(model.row_values("20")[1], "00:15:00")
+        model.update_row("30", value="00:30:00")
+        self.assertEqual(model.materialized_count, 2)
+        self.assertEqual(model.total_seconds, 1_000 * 900 + 900)
+
+        model.detach_source()
+        os.remove(self.path)
+        self.assertEqual(model.state_at(999).description, "zadanie 999")
+        snapshot.close()
+
+    def test_empty_snapshot(self) -> None:
+        snapshot = BinarySnapshot(encode_snapshot([]))
+        self.assertEqual(snapshot.row_ids(), [])
+        self.assertEqual(snapshot.total_seconds(), 0)
+
+    def test_rejects_foreign_and_truncated_files(self) -> None:
+        payload = encode_snapshot(rows_from_states(_states()))
+        for broken in (b"", b"PK\x03\x04" + payload[4:], payload[:-5], payload[:40]):
+            with self.subTest(size=len(broken)), self.assertRaises(ValueError):
+                BinarySnapshot(broken)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import io
+import json
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+from pathlib import Path
+
+from cli import StreamingTotal, main
+from ui.models import TimeRowState
+from ui.utils.time_sum_helpers import build_expression_payload
+
+
+class TestStreamingTotal(unittest.TestCase):
+    def test_matches_expression_payload_rules(self) -> None:
+        rows = [
+            ("+", "01:00:00", "1.5"),
+            ("-", "00:30:00", "2"),
+            ("+", "00:10:00", "abc"),
+            ("+", "00:00:01", "1,5"),
+            ("+", "14:3", "1"),
+            ("+", "1435500", "0.25"),
+        ]
+        states = [
+            TimeRowState(row_id=str(index), operator=operator, value=value, multiplier=multiplier)
+            for index, (operator, value, multiplier) in enumerate(rows)
+        ]
+
+        total = StreamingTotal()
+        for operator, value, multiplier in rows:
+            total.add(operator, value, multiplier)
+
+        self.assertEqual(total.total_seconds, build_expression_payload(states)[3])
+        self.assertEqual(total.row_count, 6)
+        self.assertEqual(total.skipped_count, 2)
+
+    def test_add_line_accepts_operator_and_multiplier_forms(self) -> None:
+        total = StreamingTotal()
+        total.add_lines(
+            [
+                "01:00:00\n",
+                "- 00:30:00\n",
+                "-00:10:00 x2\n",
+                "+00:00:10;*3\n",
+                "\n",
+                "# komentarz\n",
+            ]
+        )
+
+        self.assertEqual(total.total_seconds, 3600 - 1800 - 1200 + 30)
+        self.assertEqual(total.row_count, 4)
+
+
+class TestCliMain(unittest.TestCase):
+    def test_sum_reads_stdin_and_writes_json(self) -> None:
+        stdin = io.StringIO("+ 01:00:00 1.5\n- 00:30:00 2\n")
+        stdout = io.StringIO()
+
+        exit_code = main(["sum", "--format", "json", "--norm", "07:30:00"], stdin=stdin, stdout=stdout)
+
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(
+            json.loads(stdout.getvalue()),
+            {"total_seconds": 1800, "clock": "00:30:00", "hours": 0.5, "days": 0.07, "rows": 2, "skipped": 0},
+        )
+
+    def test_sum_text_output(self) -> None:
+        stdout = io.StringIO()
+        main(["sum"], stdin=io.StringIO("- 01:00:00\n"), stdout=stdout)
+
+        self.assertIn("Format zegarowy: -01:00:00", stdout.getvalue())
+        self.assertIn("Format dziesiętny: -1.00 h", stdout.getvalue())
+
+    def test_sum_reports_unreadable_files(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "czas.txt"
+            path.write_bytes("+ 01:00:00 zażółć\n".encode("cp1250"))
+            missing = str(Path(directory) / "brak.txt")
+
+            for arguments in (["sum", str(path)], ["sum", missing], ["durations", missing]):
+                stderr = io.StringIO()
+                with self.subTest(arguments=arguments), redirect_stderr(stderr):
+                    exit_code = main(arguments, stdin=io.StringIO(), stdout=io.StringIO())
+                    self.assertEqual(exit_code, 1)
+                    self.assertTrue(stderr.getvalue().startswith("[Godzinator] "))
+
+    def test_calc_evaluates_stdin_lines(self) -> None:
+        stdout = io.StringIO()
+        exit_code = main(
+            ["calc", "--format", "json"],
+            stdin=io.StringIO("(08:00:00 - 00:30:00) * 5\n# komentarz\n\n7,5h / 0:30\n1 +\n"),
+            stdout=stdout,
+        )
+
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(
+            [(record["result"], record["total_seconds"]) for record in json.loads(stdout.getvalue())],
+            [("37:30:00", 135000), ("15", None), (None, None)],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import io
+import json
+import os
+import random
+import tempfile
+import unittest
+
+from aggregation import GROUP_PERSON, aggregate_paths
+from cli import main
+from duration_log import HAS_NUMPY, read_duration_log, scan_durations
+from time_utils import time_to_seconds
+
+
+class TestScanDurations(unittest.TestCase):
+    def test_sums_signed_tokens_and_ignores_lookalikes(self) -> None:
+        buffer = (
+            b"2024-01-02 emp1 08:00:00\n"
+            b"emp2 -00:30:00\n"
+            b"+123:45:59 shift\n"
+            b"version 1.02:03:04 1234:00:00 12:34:56:78 07:60:00 x01:00:00\n"
+        )
+
+        scan = scan_durations(buffer, use_numpy=False)
+
+        self.assertEqual(scan.count, 3)
+        self.assertEqual(scan.total_seconds, 8 * 3600 - 1800 + time_to_seconds("123:45:59"))
+        self.assertEqual(scan.clock, "131:15:59")
+        self.assertEqual(scan.hours, 131.27)
+
+    def test_negative_total_clock(self) -> None:
+        self.assertEqual(scan_durations(b"-01:00:00\n00:15:00", use_numpy=False).clock, "-00:45:00")
+
+    @unittest.skipUnless(HAS_NUMPY, "NumPy is not installed")
+    def test_numpy_matches_regex_on_random_buffers(self) -> None:
+        generator = random.Random(5)
+        parts = [b"01:02:03", b"123:45:59", b"1234:00:00", b"9:99:00", b"-", b"+", b":", b".", b" ", b"\n", b"7", b"a"]
+        for _ in range(500):
+            buffer = b"".join(generator.choice(parts) for _ in range(generator.randint(0, 12)))
+            with self.subTest(buffer=buffer):
+                self.assertEqual(
+                    scan_durations(buffer, use_numpy=True, chunk_bytes=generator.randint(1, 30)),
+                    scan_durations(buffer, use_numpy=False),
+                )
+
+
+class TestReadDurationLog(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, "anna_2024-03.log")
+        with open(self.path, "wb") as handle:
+            handle.write(b"in 01:00:00\nout 00:30:00\n-00:15:00\n")
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_reads_memory_mapped_file(self) -> None:
+        scan = read_duration_log(self.path)
+
+        self.assertEqual((scan.total_seconds, scan.count), (4500, 3))
+
+    def test_empty_file(self) -> None:
+        empty = os.path.join(self._tmp.name, "empty.log")
+        open(empty, "wb").close()
+
+        self.assertEqual(read_duration_log(empty).count, 0)
+
+    def test_logs_feed_aggregation(self) -> None:
+        result = aggregate_paths([self._tmp.name], (GROUP_PERSON,), workers=1)
+
+        self.assertEqual([(group.key, group.total_seconds, group.rows) for group in result.groups], [(("anna_2024-03",), 4500, 3)])
+
+    def test_cli_durations_json(self) -> None:
+        stdout = io.StringIO()
+
+        exit_code = main(["durations", self.path, "--format", "json"], stdout=stdout)
+
+        summary = json.loads(stdout.getvalue())
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(summary["clock"], "01:15:00")
+        self.assertEqual(summary["rows"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
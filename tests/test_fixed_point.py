@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import unittest
+
+from fixed_point import (
+    FIXED_ONE,
+    apply_fixed_multiplier,
+    fixed_multiplier_from_float,
+    fixed_to_float,
+    parse_fixed_multiplier,
+)
+from time_batch import HAS_NUMPY, calculate_time_expression_batch
+from time_utils import calculate_time_expression
+from ui.models import TimeRowState
+from ui.utils.time_sum_helpers import build_expression_payload, row_signed_seconds
+
+
+class TestFixedPoint(unittest.TestCase):
+    def test_parse_fixed_multiplier(self) -> None:
+        self.assertEqual(parse_fixed_multiplier("1"), FIXED_ONE)
+        self.assertEqual(parse_fixed_multiplier("1,15"), 11500)
+        self.assertEqual(parse_fixed_multiplier(" .5 "), 5000)
+        self.assertEqual(parse_fixed_multiplier("2."), 20000)
+        self.assertEqual(parse_fixed_multiplier("0.00005"), 1)
+        self.assertEqual(parse_fixed_multiplier("0.00004999"), 0)
+
+        for invalid in ("", ".", "-1", "+1", "1..2", "1.2.3", "abc", "1e3", "²"):
+            with self.subTest(invalid=invalid):
+                self.assertIsNone(parse_fixed_multiplier(invalid))
+
+    def test_fixed_multiplier_from_float_uses_shortest_decimal(self) -> None:
+        self.assertEqual(fixed_multiplier_from_float(1.15), 11500)
+        self.assertEqual(fixed_multiplier_from_float(2), 20000)
+        self.assertEqual(fixed_multiplier_from_float(1e-05), 0)
+        with self.assertRaises(ValueError):
+            fixed_multiplier_from_float(-0.5)
+        with self.assertRaises(ValueError):
+            fixed_multiplier_from_float(float("nan"))
+
+    def test_apply_rounds_half_up_without_float_drift(self) -> None:
+        # 50 * 1.15 is 57.4999... in binary floating point.
+        self.assertEqual(int(50 * 1.15 + 0.5), 57)
+        self.assertEqual(apply_fixed_multiplier(50, 11500), 58)
+        self.assertEqual(apply_fixed_multiplier(1, 15000), 2)
+        self.assertEqual(apply_fixed_multiplier(3, 1666), 0)
+        self.assertEqual(fixed_to_float(11500), 1.15)
+
+    def test_expression_paths_agree_on_exact_products(self) -> None:
+        times = ["00:00:00", "00:00:10", "00:00:30"]
+        operators = ["+", "-"]
+        multipliers = [1.15, 0.35]
+
+        self.assertEqual(calculate_time_expression(times, operators, multipliers)[0], "00:00:01")
+        backends = [False, True] if HAS_NUMPY else [False]
+        for use_numpy in backends:
+            with self.subTest(use_numpy=use_numpy):
+                result = calculate_time_expression_batch(times, operators, multipliers, use_numpy=use_numpy)
+                self.assertEqual(result.effective_seconds, [12, -11])
+
+    def test_row_caches_parsed_multiplier_until_text_changes(self) -> None:
+        row = TimeRowState(row_id="1", value="00:00:10", multiplier="1,15")
+
+        self.assertEqual(row.multiplier_fixed, 11500)
+        self.assertEqual(row_signed_seconds(row), 12)
+        self.assertEqual(build_expression_payload([row])[2:], ([1.15], 12))
+
+        row.multiplier = "x"
+        self.assertIsNone(row.multiplier_fixed)
+        self.assertEqual(row_signed_seconds(row), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
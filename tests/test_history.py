@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import unittest
+from unittest import mock
+
+from ui import history as history_module
+from ui.history import EditHistory
+from ui.models import TimeRowState
+from ui.timesheet import TimesheetModel
+from ui.utils.binary_snapshot import BinarySnapshot, encode_snapshot, rows_from_states
+
+
+def _rows(model: TimesheetModel) -> list[tuple[object, ...]]:
+    return [
+        (state.row_id, state.operator, state.value, state.multiplier, state.is_active, state.description)
+        for state in model.states()
+    ]
+
+
+def _model(count: int = 5) -> TimesheetModel:
+    return TimesheetModel(TimeRowState(row_id=str(index), value=f"0{index}:00:00") for index in range(count))
+
+
+class TestEditHistory(unittest.TestCase):
+    def test_undo_and_redo_every_kind_of_change(self) -> None:
+        model = _model()
+        history = EditHistory(model)
+        checkpoints = [(_rows(model), model.total_seconds)]
+
+        model.add_row(TimeRowState(row_id="new", value="00:30:00"), index=2)
+        checkpoints.append((_rows(model), model.total_seconds))
+        model.update_row("3", multiplier="2", description="nadgodziny")
+        checkpoints.append((_rows(model), model.total_seconds))
+        model.remove_rows(["0", "new", "4"])
+        checkpoints.append((_rows(model), model.total_seconds))
+        model.clear()
+        checkpoints.append((_rows(model), model.total_seconds))
+
+        for expected in reversed(checkpoints[:-1]):
+            history.undo()
+            self.assertEqual((_rows(model), model.total_seconds), expected)
+        self.assertFalse(history.can_undo)
+
+        for expected in checkpoints[1:]:
+            history.redo()
+            self.assertEqual((_rows(model), model.total_seconds), expected)
+        self.assertFalse(history.can_redo)
+
+    def test_in_place_edits_are_recorded_through_row_changed(self) -> None:
+        model = _model(2)
+        history = EditHistory(model)
+
+        state = model.get("1")
+        state.operator = "-"
+        model.row_changed("1")
+        state.value = "05:00:00"
+        model.row_changed("1")
+
+        self.assertEqual(history.undo(), {"1"})
+        self.assertEqual((state.operator, state.value), ("-", "01:00:00"))
+        history.undo()
+        self.assertEqual((state.operator, state.value), ("+", "01:00:00"))
+        self.assertEqual(model.total_seconds, 3600)
+
+    def test_consecutive_edits_of_one_field_merge(self) -> None:
+        model = _model(1)
+        history = EditHistory(model)
+
+        for text in ("1", "12", "12:3", "12:30:00"):
+            model.update_row("0", value=text)
+        history.undo()
+        self.assertEqual(model.get("0").value, "00:00:00")
+        self.assertFalse(history.can_undo)
+
+        model.update_row("0", value="01:00:00")
+        with mock.patch.object(history_module.time, "monotonic", return_value=10**9):
+            model.update_row("0", value="02:00:00")
+        history.undo()
+        self.assertEqual(model.get("0").value, "01:00:00")
+
+    def test_group_undoes_as_one_step_and_new_edit_drops_redo(self) -> None:
+        model = _model(3)
+        history = EditHistory(model)
+
+        with history.group():
+            model.clear()
+            model.add_row(TimeRowState(row_id="placeholder"))
+        self.assertEqual(len(model), 1)
+
+        history.undo()
+        self.assertEqual(model.row_ids, ("0", "1", "2"))
+        self.assertTrue(history.can_redo)
+
+        model.update_row("1", is_active=False)
+        self.assertFalse(history.can_redo)
+
+    def test_undo_of_clear_reuses_lazy_rows(self) -> None:
+        states = [TimeRowState(row_id=str(index), value="00:15:00") for index in range(1_000)]
+        model = TimesheetModel(source=BinarySnapshot(encode_snapshot(rows_from_states(states))))
+        history = EditHistory(model)
+
+        model.update_row("7", value="01:00:00")
+        model.clear()
+        history.undo()
+
+        self.assertEqual(len(model), 1_000)
+        self.assertEqual(model.materialized_count, 1)
+        self.assertEqual(model.total_seconds, 999 * 900 + 3600)
+
+        history.undo()
+        self.assertEqual(model.get("7").value, "00:15:00")
+        self.assertEqual(model.total_seconds, 1_000 * 900)
+
+    def test_limit_drops_oldest_steps(self) -> None:
+        model = _model(1)
+        history = EditHistory(model, limit=3)
+
+        for index in range(5):
+            model.add_row(TimeRowState(row_id=f"n{index}"))
+        for _ in range(5):
+            history.undo()
+
+        self.assertEqual(model.row_ids, ("0", "n0", "n1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from profiling import PROFILE_ENV, PROFILER, LatencyHistogram, Profiler, profiled
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    def test_add_places_values_into_buckets(self) -> None:
+        histogram = LatencyHistogram(bounds_ms=(1.0, 10.0))
+        for value in (0.5, 1.0, 3.0, 50.0):
+            histogram.add(value)
+
+        self.assertEqual(histogram.buckets, [2, 1, 1])
+        self.assertEqual(histogram.to_dict()["max_ms"], 50.0)
+        self.assertEqual(histogram.to_dict()["mean_ms"], 13.625)
+
+
+class TestProfiler(unittest.TestCase):
+    def test_disabled_profiler_records_nothing(self) -> None:
+        profiler = Profiler()
+        profiler.count("recalculate")
+        profiler.set_gauge("widgets", 10)
+        profiler.record_phase("boot", 5.0)
+
+        self.assertEqual(profiler.snapshot()["counters"], {})
+        self.assertEqual(profiler.dump(), [])
+
+    def test_configure_from_env_and_dump_json(self) -> None:
+        profiler = Profiler()
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, "trace")
+            with mock.patch.dict(os.environ, {PROFILE_ENV: "1", "GODZINATOR_PROFILE_OUTPUT": output}):
+                profiler.configure_from_env()
+
+            profiler.record_phase("import customtkinter", 12.5)
+            profiler.count("time_sum.refresh_results", 3)
+            profiler.set_gauge("widgets.total", 42)
+            profiler.record_latency("row.time", 0.3)
+
+            self.assertEqual(profiler.dump(), [f"{output}.json"])
+            with open(f"{output}.json", encoding="utf-8") as handle:
+                trace = json.load(handle)
+
+        self.assertEqual(trace["boot_phases"], [{"phase": "import customtkinter", "ms": 12.5}])
+        self.assertEqual(trace["counters"], {"time_sum.refresh_results": 3})
+        self.assertEqual(trace["gauges"], {"widgets.total": 42})
+        self.assertEqual(trace["handlers"]["row.time"]["count"], 1)
+
+    def test_enable_rejects_unknown_mode(self) -> None:
+        with self.assertRaises(ValueError):
+            Profiler().enable("flamegraph")
+
+    def test_profiled_decorator_records_only_when_enabled(self) -> None:
+        @profiled("test.handler")
+        def handler(value: int) -> int:
+            return value * 2
+
+        with mock.patch.object(PROFILER, "enabled", False):
+            self.assertEqual(handler(2), 4)
+        self.assertNotIn("test.handler", PROFILER.handlers)
+
+        with mock.patch.object(PROFILER, "enabled", True), mock.patch.dict(PROFILER.handlers, clear=True):
+            self.assertEqual(handler(3), 6)
+            self.assertEqual(PROFILER.handlers["test.handler"].count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import random
+import unittest
+
+from ui.history import EditHistory
+from ui.models import TimeRowState
+from ui.range_totals import RangeTotals
+from ui.timesheet import TimesheetModel
+from ui.utils.fenwick import FenwickTree
+from ui.utils.time_sum_helpers import row_signed_seconds
+
+
+class TestFenwickTree(unittest.TestCase):
+    def test_matches_list_sums_under_updates_and_appends(self) -> None:
+        generator = random.Random(25)
+        values = [generator.randint(-100, 100) for _ in range(37)]
+        tree = FenwickTree(values)
+
+        for _ in range(500):
+            action = generator.random()
+            if action < 0.3:
+                index = generator.randrange(len(values))
+                values[index] = generator.randint(-100, 100)
+                tree.set(index, values[index])
+            elif action < 0.4:
+                values.append(generator.randint(-100, 100))
+                tree.append(values[-1])
+
+            start = generator.randint(0, len(values))
+            end = generator.randint(0, len(values))
+            self.assertEqual(tree.range_sum(start, end), sum(values[start:end]))
+        self.assertEqual(tree.total, sum(values))
+        self.assertEqual(FenwickTree().total, 0)
+
+
+class TestRangeTotals(unittest.TestCase):
+    def test_ranges_follow_edits_inserts_and_undo(self) -> None:
+        generator = random.Random(250)
+        model = TimesheetModel(
+            TimeRowState(row_id=f"r{index}", value=f"0{index % 10}:{index % 60:02}:00") for index in range(200)
+        )
+        history = EditHistory(model)
+        totals = RangeTotals(model)
+
+        for step in range(300):
+            action = generator.random()
+            if action < 0.5:
+                model.update_row(generator.choice(model.row_ids), operator=generator.choice("+-"), multiplier="1,5")
+            elif action < 0.65:
+                model.add_row(TimeRowState(row_id=f"n{step}", value="00:30:00"))
+            elif action < 0.75:
+                model.add_row(TimeRowState(row_id=f"m{step}", value="00:10:00"), index=generator.randrange(len(model)))
+            elif action < 0.85 and len(model) > 1:
+                model.remove_row(generator.choice(model.row_ids))
+            else:
+                history.undo()
+
+            states = model.states()
+            start = generator.randint(0, len(states))
+            end = generator.randint(start, len(states))
+            expected = sum(row_signed_seconds(state) for state in states[start:end])
+            self.assertEqual(totals.range_seconds(start, end), expected)
+
+        self.assertEqual(totals.range_seconds(0, len(model)), model.total_seconds)
+        self.assertEqual(
+            totals.selection_seconds([(5, 10), (0, 7), (20, 21)]),
+            totals.range_seconds(0, 10) + totals.range_seconds(20, 21),
+        )
+        self.assertEqual(totals.position(model.row_ids[3]), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
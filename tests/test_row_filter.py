@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import random
+import unittest
+
+from ui.models import TimeRowState
+from ui.row_filter import RowFilter
+from ui.timesheet import TimesheetModel
+from ui.utils.time_sum_helpers import normalize_tag, row_signed_seconds
+
+
+def _expected(model: TimesheetModel, query: str, low: int | None, high: int | None) -> list[str]:
+    needle = normalize_tag(query)
+    result = []
+    for state in model.states():
+        seconds = abs(row_signed_seconds(state))
+        if needle not in normalize_tag(state.description):
+            continue
+        if (low is not None and seconds < low) or (high is not None and seconds > high):
+            continue
+        result.append(state.row_id)
+    return result
+
+
+class TestRowFilter(unittest.TestCase):
+    def setUp(self) -> None:
+        self.model = TimesheetModel(
+            [
+                TimeRowState(row_id="a", value="01:00:00", description="Spotkanie z klientem"),
+                TimeRowState(row_id="b", value="00:30:00", description="Code review"),
+                TimeRowState(row_id="c", operator="-", value="02:00:00", description="spotkanie  zespołu"),
+                TimeRowState(row_id="d", value="00:10:00", description="Kawa"),
+            ]
+        )
+        self.row_filter = RowFilter(self.model)
+
+    def test_query_and_range_report_only_flipped_rows(self) -> None:
+        self.assertFalse(self.row_filter.active)
+        self.assertEqual(self.row_filter.visible_ids(), ["a", "b", "c", "d"])
+
+        change = self.row_filter.set_filter("SPOTKANIE")
+        self.assertEqual((change.shown, change.hidden), (frozenset(), frozenset({"b", "d"})))
+        self.assertEqual(self.row_filter.visible_ids(), ["a", "c"])
+        self.assertEqual(self.row_filter.total_seconds, -3600)
+
+        change = self.row_filter.set_filter("spotkanie", max_seconds=3600)
+        self.assertEqual(change.hidden, frozenset({"c"}))
+        self.assertEqual(self.row_filter.total_seconds, 3600)
+
+        self.assertFalse(self.row_filter.set_filter("spotkanie", max_seconds=3600))
+        self.assertEqual(self.row_filter.set_filter("", min_seconds=1800, max_seconds=3600).shown, frozenset({"b"}))
+        self.assertEqual(self.row_filter.set_filter("e").shown, frozenset({"c"}))
+        self.assertEqual(self.row_filter.set_filter("zespo").hidden, frozenset({"a", "b"}))
+
+    def test_edits_update_membership_and_total(self) -> None:
+        self.row_filter.set_filter("kawa")
+        self.assertEqual(self.row_filter.total_seconds, 600)
+
+        self.model.update_row("d", value="00:20:00")
+        self.assertEqual(self.row_filter.total_seconds, 1200)
+        self.model.update_row("b", description="kawa z zespołem")
+        self.assertEqual(self.row_filter.visible_ids(), ["b", "d"])
+        self.model.update_row("d", description="herbata")
+        self.assertEqual(self.row_filter.visible_ids(), ["b"])
+        self.assertEqual(self.row_filter.total_seconds, 1800)
+
+        self.model.add_row(TimeRowState(row_id="e", value="00:05:00", description="Kawa"), index=0)
+        self.model.remove_row("b")
+        self.assertEqual(self.row_filter.visible_ids(), ["e"])
+        self.assertEqual(self.row_filter.total_seconds, 300)
+
+        self.model.clear()
+        self.assertEqual(self.row_filter.match_count, 0)
+
+    def test_matches_brute_force_on_random_sheets(self) -> None:
+        generator = random.Random(20)
+        words = ["projekt", "spotkanie", "kod", "urlop", "review", "ab", ""]
+        for index in range(300):
+            self.model.add_row(
+                TimeRowState(
+                    row_id=f"r{index}",
+                    operator=generator.choice("+-"),
+                    value=f"0{generator.randint(0, 3)}:{generator.randint(10, 59)}:00",
+                    description=" ".join(generator.choices(words, k=generator.randint(0, 3))),
+                )
+            )
+
+        for _ in range(200):
+            if generator.random() < 0.3:
+                row_id = generator.choice(self.model.row_ids)
+                self.model.update_row(row_id, description=generator.choice(words), value="00:45:00")
+            query = generator.choice(["", "o", "ko", "pro", "jekt sp", "spotkanie", "zzz", "d u"])
+            low = generator.choice([None, 0, 1800, 3600])
+            high = generator.choice([None, 2700, 7200])
+            self.row_filter.set_filter(query, low, high)
+
+            expected = _expected(self.model, query, low, high)
+            self.assertEqual(self.row_filter.visible_ids(), expected)
+            total = sum(row_signed_seconds(self.model.get(row_id)) for row_id in expected)
+            self.assertEqual(self.row_filter.total_seconds, total)
+
+
+if __name__ == "__main__":
+    unittest.main()
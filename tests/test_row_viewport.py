@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import unittest
+
+from ui.utils.row_viewport import RowViewport
+
+
+class TestRowViewport(unittest.TestCase):
+    def test_visible_window_covers_only_rows_in_view(self) -> None:
+        viewport = RowViewport(row_height=44)
+        viewport.set_height(440, total_rows=50_000)
+
+        self.assertEqual(viewport.visible_window(50_000), (0, 11, 0))
+
+        viewport.scroll_to(44 * 1000 + 10, total_rows=50_000)
+        self.assertEqual(viewport.visible_window(50_000), (1000, 1011, 10))
+
+    def test_visible_window_is_clamped_to_row_count(self) -> None:
+        viewport = RowViewport(row_height=44)
+        viewport.set_height(440, total_rows=3)
+
+        self.assertEqual(viewport.visible_window(3), (0, 3, 0))
+        self.assertEqual(viewport.scroll_by(500, total_rows=3), 0)
+
+    def test_scroll_to_is_clamped(self) -> None:
+        viewport = RowViewport(row_height=10)
+        viewport.set_height(100, total_rows=50)
+
+        self.assertEqual(viewport.scroll_to(-20, total_rows=50), 0)
+        self.assertEqual(viewport.scroll_to(10_000, total_rows=50), 400)
+
+    def test_ensure_visible_scrolls_minimally(self) -> None:
+        viewport = RowViewport(row_height=10)
+        viewport.set_height(100, total_rows=50)
+
+        self.assertEqual(viewport.ensure_visible(5, total_rows=50), 0)
+        self.assertEqual(viewport.ensure_visible(49, total_rows=50), 400)
+        self.assertEqual(viewport.ensure_visible(20, total_rows=50), 200)
+
+    def test_scrollbar_fractions(self) -> None:
+        viewport = RowViewport(row_height=10)
+        viewport.set_height(100, total_rows=5)
+        self.assertEqual(viewport.scrollbar_fractions(5), (0.0, 1.0))
+
+        viewport.scroll_to(100, total_rows=40)
+        self.assertEqual(viewport.scrollbar_fractions(40), (0.25, 0.5))
+
+
+if __name__ == "__main__":
+    unittest.main()
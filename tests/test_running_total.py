@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import unittest
+
+from ui.models import TimeRowState
+from ui.utils.running_total import RunningTotal
+from ui.utils.time_sum_helpers import build_expression_payload
+
+
+class TestRunningTotal(unittest.TestCase):
+    def test_update_applies_only_delta_for_changed_row(self) -> None:
+        total = RunningTotal()
+        first = TimeRowState(row_id="1", value="01:00:00")
+        second = TimeRowState(row_id="2", operator="-", value="00:30:00", multiplier="2")
+
+        total.update(first)
+        total.update(second)
+        self.assertEqual(total.total_seconds, 0)
+
+        second.multiplier = "1"
+        total.update(second)
+        self.assertEqual(total.total_seconds, 1800)
+        self.assertEqual(total.contribution("2"), -1800)
+
+    def test_toggle_and_remove_adjust_total(self) -> None:
+        total = RunningTotal()
+        row = TimeRowState(row_id="1", value="00:10:00")
+        total.update(row)
+
+        row.is_active = False
+        total.update(row)
+        self.assertEqual(total.total_seconds, 0)
+
+        row.is_active = True
+        total.update(row)
+        self.assertEqual(total.remove("1"), 0)
+        self.assertEqual(len(total), 0)
+
+    def test_rebuild_matches_expression_payload(self) -> None:
+        rows = [
+            TimeRowState(row_id="1", operator="+", value="01:00:00", multiplier="1.5"),
+            TimeRowState(row_id="2", operator="-", value="00:30:00", multiplier="2"),
+            TimeRowState(row_id="3", operator="+", value="00:10:00", multiplier="abc"),
+            TimeRowState(row_id="4", operator="+", value="00:20:00", is_active=False),
+            TimeRowState(row_id="5", operator="*", value="00:00:01", multiplier="1,5"),
+            TimeRowState(row_id="6", operator="+", value="14:3"),
+        ]
+
+        total = RunningTotal()
+        self.assertEqual(total.rebuild(rows), build_expression_payload(rows)[3])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import io
+import unittest
+from collections.abc import Callable
+from contextlib import redirect_stdout
+
+from ui.utils.scheduler import CoalescingScheduler
+
+
+class FakeTkWidget:
+    def __init__(self) -> None:
+        self.calls: dict[str, tuple[int | None, Callable[[], None]]] = {}
+        self._next_id = 0
+
+    def after(self, ms: int, func: Callable[[], None]) -> str:
+        return self._register(ms, func)
+
+    def after_idle(self, func: Callable[[], None]) -> str:
+        return self._register(None, func)
+
+    def after_cancel(self, id: str) -> None:
+        self.calls.pop(id, None)
+
+    def run_all(self) -> None:
+        calls = list(self.calls.values())
+        self.calls.clear()
+        for _, func in calls:
+            func()
+
+    def _register(self, ms: int | None, func: Callable[[], None]) -> str:
+        self._next_id += 1
+        after_id = f"after#{self._next_id}"
+        self.calls[after_id] = (ms, func)
+        return after_id
+
+
+class TestCoalescingScheduler(unittest.TestCase):
+    def test_repeated_schedules_for_same_key_run_once(self) -> None:
+        widget = FakeTkWidget()
+        scheduler = CoalescingScheduler(widget)
+        runs: list[str] = []
+
+        for value in ("a", "ab", "abc"):
+            scheduler.schedule("row", lambda value=value: runs.append(value))
+
+        self.assertEqual(len(widget.calls), 1)
+        widget.run_all()
+
+        self.assertEqual(runs, ["abc"])
+        self.assertEqual(scheduler.scheduled_count, 3)
+        self.assertEqual(scheduler.executed_count, 1)
+        self.assertEqual(scheduler.skipped_count, 2)
+
+    def test_distinct_keys_run_in_one_pass_in_order(self) -> None:
+        widget = FakeTkWidget()
+        scheduler = CoalescingScheduler(widget)
+        runs: list[str] = []
+
+        scheduler.schedule("row", lambda: runs.append("row"))
+        scheduler.schedule("results", lambda: runs.append("results"))
+        widget.run_all()
+
+        self.assertEqual(runs, ["row", "results"])
+        self.assertEqual(scheduler.pending_keys, ())
+
+    def test_min_interval_delays_next_pass(self) -> None:
+        now = [100.0]
+        widget = FakeTkWidget()
+        scheduler = CoalescingScheduler(widget, min_interval_ms=50, clock=lambda: now[0])
+
+        scheduler.schedule("row", lambda: None)
+        self.assertEqual([ms for ms, _ in widget.calls.values()], [None])
+        widget.run_all()
+
+        now[0] += 0.02
+        scheduler.schedule("row", lambda: None)
+        self.assertEqual([ms for ms, _ in widget.calls.values()], [30])
+
+    def test_cancel_and_flush(self) -> None:
+        widget = FakeTkWidget()
+        scheduler = CoalescingScheduler(widget)
+        runs: list[str] = []
+
+        scheduler.schedule("row", lambda: runs.append("row"))
+        scheduler.cancel("row")
+        self.assertEqual(widget.calls, {})
+
+        scheduler.schedule("norm", lambda: runs.append("norm"))
+        scheduler.flush()
+        self.assertEqual(runs, ["norm"])
+        self.assertEqual(widget.calls, {})
+
+    def test_keys_scheduled_during_a_pass_run_in_it(self) -> None:
+        widget = FakeTkWidget()
+        scheduler = CoalescingScheduler(widget, min_interval_ms=50)
+        runs: list[str] = []
+
+        def edit_row() -> None:
+            runs.append("row")
+            scheduler.schedule("results", lambda: runs.append("results"))
+            scheduler.schedule("row", edit_row)
+
+        scheduler.schedule("row", edit_row)
+        widget.run_all()
+
+        self.assertEqual(runs, ["row", "results"])
+        # Only the key that rescheduled itself is left for the next pass.
+        self.assertEqual(scheduler.pending_keys, ("row",))
+        self.assertEqual(len(widget.calls), 1)
+
+    def test_failing_callback_does_not_drop_the_others(self) -> None:
+        widget = FakeTkWidget()
+        scheduler = CoalescingScheduler(widget)
+        runs: list[str] = []
+
+        def fail() -> None:
+            raise ValueError("zły wiersz")
+
+        scheduler.schedule("row", fail)
+        scheduler.schedule("results", lambda: runs.append("results"))
+        output = io.StringIO()
+        with redirect_stdout(output):
+            widget.run_all()
+
+        self.assertEqual(runs, ["results"])
+        self.assertIn("zły wiersz", output.getvalue())
+        self.assertEqual(widget.calls, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
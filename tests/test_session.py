@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import time
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from unittest import mock
+
+from ui.models import TimeRowState
+from ui import session
+from ui.session import SessionStore
+from ui.timesheet import TimesheetModel
+
+
+def _rows(model: TimesheetModel) -> list[tuple[object, ...]]:
+    return [
+        (state.row_id, state.operator, state.value, state.multiplier, state.is_active, state.description)
+        for state in model.states()
+    ]
+
+
+class TestSessionStore(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.directory = os.path.join(self._tmp.name, "session")
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _restore(self) -> TimesheetModel:
+        return SessionStore(self.directory).load()
+
+    def test_journal_restores_every_kind_of_change(self) -> None:
+        store = SessionStore(self.directory)
+        model = store.load()
+        store.attach(model)
+
+        model.insert_rows([TimeRowState(row_id=str(index), value="01:00:00") for index in range(4)])
+        model.add_row(TimeRowState(row_id="first", value="00:30:00"), index=0)
+        model.update_row("2", multiplier="1,5", description="Urlop")
+        model.update_row("3", is_active=False)
+        model.remove_rows(["1"])
+        self.assertTrue(store.flush(timeout=5))
+
+        restored = self._restore()
+        self.assertEqual(_rows(restored), _rows(model))
+        self.assertEqual(restored.total_seconds, model.total_seconds)
+        store.close()
+
+    def test_updates_only_journal_changed_fields(self) -> None:
+        store = SessionStore(self.directory)
+        model = TimesheetModel([TimeRowState(row_id="a", value="01:00:00", description="długi opis")])
+        store.attach(model)
+
+        model.update_row("a", value="02:00:00")
+        model.row_changed("a")
+        store.flush(timeout=5)
+
+        with open(store.journal_path, encoding="utf-8") as handle:
+            entries = [json.loads(line) for line in handle][1:]
+        self.assertEqual(entries, [{"event": "update", "row_id": "a", "fields": {"value": "02:00:00"}}])
+        store.close()
+
+    def test_compaction_folds_journal_into_snapshot(self) -> None:
+        store = SessionStore(self.directory, compact_after=3)
+        model = TimesheetModel()
+        store.attach(model)
+
+        for index in range(5):
+            model.add_row(TimeRowState(row_id=str(index), value="00:10:00"))
+        store.flush(timeout=5)
+
+        self.assertLess(store.journal_entries, 3)
+        self.assertEqual(_rows(self._restore()), _rows(model))
+
+        model.clear()
+        store.close()
+        self.assertEqual(len(self._restore()), 0)
+
+    def test_failed_compaction_keeps_journaling(self) -> None:
+        store = SessionStore(self.directory, compact_after=3)
+        model = TimesheetModel()
+        store.attach(model)
+        self.assertTrue(store.flush(timeout=5))
+
+        write_atomically = session._write_atomically
+        failures = []
+
+        def fail_snapshot_once(path: str, data: bytes) -> None:
+            if path == store.snapshot_path and not failures:
+                failures.append(path)
+                raise OSError("dysk pełny")
+            write_atomically(path, data)
+
+        output = StringIO()
+        with mock.patch.object(session, "_write_atomically", fail_snapshot_once), redirect_stdout(output):
+            for index in range(3):
+                model.add_row(TimeRowState(row_id=str(index), value="00:10:00"))
+            self.assertTrue(store.flush(timeout=5))
+            model.add_row(TimeRowState(row_id="after", value="00:05:00"))
+            self.assertTrue(store.flush(timeout=5))
+
+        self.assertEqual(failures, [store.snapshot_path])
+        self.assertIn("dysk pełny", output.getvalue())
+        self.assertEqual(_rows(self._restore()), _rows(model))
+        store.close()
+        self.assertEqual(_rows(self._restore()), _rows(model))
+
+    def test_stale_and_torn_journals_are_ignored(self) -> None:
+        store = SessionStore(self.directory)
+        model = TimesheetModel([TimeRowState(row_id="a", value="01:00:00")])
+        store.attach(model)
+        model.update_row("a", value="02:00:00")
+        store.close()
+
+        with open(store.journal_path, "a", encoding="utf-8") as handle:
+            handle.write('{"event":"update","row_id":"a","fields":{"value":"03:00:00"}}\n{"event":"rem')
+        self.assertEqual(self._restore().state_at(0).value, "03:00:00")
+
+        with open(store.journal_path, "w", encoding="utf-8") as handle:
+            handle.write('{"generation":-1}\n{"event":"reset"}\n')
+        self.assertEqual(self._restore().state_at(0).value, "02:00:00")
+
+    def test_legacy_json_snapshot_is_migrated(self) -> None:
+        os.makedirs(self.directory)
+        store = SessionStore(self.directory)
+        with open(store.legacy_snapshot_path, "w", encoding="utf-8") as handle:
+            json.dump({"format": 1, "generation": 3, "rows": [["a", "-", "01:00:00", "1", True, "stary"]]}, handle)
+
+        model = store.load()
+        store.attach(model)
+        store.close()
+
+        self.assertFalse(os.path.exists(store.legacy_snapshot_path))
+        restored = self._restore()
+        self.assertEqual(restored.materialized_count, 0)
+        self.assertEqual(_rows(restored), [("a", "-", "01:00:00", "1", True, "stary")])
+
+    def test_restores_ten_thousand_rows_quickly(self) -> None:
+        store = SessionStore(self.directory)
+        model = TimesheetModel(
+            TimeRowState(row_id=str(index), value="00:15:00", multiplier="1.25", description=f"zadanie {index}")
+            for index in range(10_000)
+        )
+        store.attach(model)
+        for index in range(0, 10_000, 10):
+            model.update_row(str(index), value="00:30:00")
+        store.flush(timeout=5)
+
+        started = time.perf_counter()
+        restored = self._restore()
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual(restored.total_seconds, model.total_seconds)
+        self.assertLess(elapsed, 1.0)
+        store.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import unittest
+from unittest import mock
+
+from startup import STARTUP_REPORT_ENV, StartupBudget, startup_report_requested
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestStartupBudget(unittest.TestCase):
+    def test_marks_record_phase_durations(self) -> None:
+        clock = FakeClock()
+        budget = StartupBudget(budget_ms=500, clock=clock)
+
+        clock.now = 0.1
+        budget.mark("import customtkinter")
+        clock.now = 0.35
+        budget.mark("first paint")
+
+        self.assertEqual([phase for phase, _ in budget.phases], ["import customtkinter", "first paint"])
+        self.assertAlmostEqual(budget.phases[1][1], 250.0)
+        self.assertAlmostEqual(budget.elapsed_ms, 350.0)
+        self.assertTrue(budget.is_within_budget)
+        self.assertIn("OK", budget.report())
+
+    def test_report_flags_budget_overrun(self) -> None:
+        clock = FakeClock()
+        budget = StartupBudget(budget_ms=100, clock=clock)
+
+        clock.now = 0.2
+        budget.mark("first paint")
+
+        self.assertFalse(budget.is_within_budget)
+        self.assertIn("OVER BUDGET", budget.report())
+
+    def test_startup_report_requested_reads_environment(self) -> None:
+        with mock.patch.dict(os.environ, {STARTUP_REPORT_ENV: "1"}):
+            self.assertTrue(startup_report_requested())
+        with mock.patch.dict(os.environ, {STARTUP_REPORT_ENV: "0"}):
+            self.assertFalse(startup_report_requested())
+
+
+
+def _modules_loaded_by(statement: str, modules: tuple[str, ...]) -> list[str]:
+    code = f"import sys; {statement}; print(','.join(name for name in {modules!r} if name in sys.modules))"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    return [name for name in output.strip().split(",") if name]
+
+
+class TestStartupImports(unittest.TestCase):
+    def test_app_does_not_load_numpy_before_the_first_paint(self) -> None:
+        self.assertEqual(_modules_loaded_by("import ui.app", ("numpy", "time_batch")), [])
+
+    def test_cli_import_skips_subcommand_backends(self) -> None:
+        backends = ("aggregation", "concurrent.futures.process", "duration_log", "numpy", "time_expression")
+        self.assertEqual(_modules_loaded_by("import cli", backends), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
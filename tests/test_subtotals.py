@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import random
+import unittest
+
+from ui.history import EditHistory
+from ui.models import TimeRowState
+from ui.subtotals import TagSubtotals
+from ui.timesheet import TimesheetModel
+from ui.utils.time_sum_helpers import normalize_tag, row_signed_seconds
+
+
+def _rescan(model: TimesheetModel) -> dict[str, tuple[int, int]]:
+    totals: dict[str, tuple[int, int]] = {}
+    for state in model.states():
+        seconds, rows = totals.get(normalize_tag(state.description), (0, 0))
+        totals[normalize_tag(state.description)] = (seconds + row_signed_seconds(state), rows + 1)
+    return totals
+
+
+def _indexed(subtotals: TagSubtotals) -> dict[str, tuple[int, int]]:
+    return {group.tag: (group.total_seconds, group.rows) for group in subtotals.groups()}
+
+
+class TestTagSubtotals(unittest.TestCase):
+    def test_groups_by_normalized_description(self) -> None:
+        model = TimesheetModel(
+            [
+                TimeRowState(row_id="a", value="01:00:00", description="Projekt  X"),
+                TimeRowState(row_id="b", value="00:30:00", multiplier="2", description=" projekt x"),
+                TimeRowState(row_id="c", operator="-", value="00:15:00", description="Przerwa"),
+                TimeRowState(row_id="d", value="02:00:00", is_active=False, description="Przerwa"),
+                TimeRowState(row_id="e", value="00:10:00"),
+            ]
+        )
+        subtotals = TagSubtotals(model)
+
+        self.assertEqual(_indexed(subtotals), {"projekt x": (7200, 2), "przerwa": (-900, 2), "": (600, 1)})
+        self.assertEqual(subtotals.get("PROJEKT X").label, "Projekt X")
+        self.assertEqual([group.tag for group in subtotals.groups()], ["projekt x", "przerwa", ""])
+
+    def test_every_field_change_moves_only_its_row(self) -> None:
+        model = TimesheetModel([TimeRowState(row_id="a", value="01:00:00", description="A")])
+        subtotals = TagSubtotals(model)
+
+        model.update_row("a", multiplier="1,5")
+        self.assertEqual(subtotals.get("a").total_seconds, 5400)
+        model.update_row("a", operator="-")
+        self.assertEqual(subtotals.get("a").total_seconds, -5400)
+        model.update_row("a", is_active=False)
+        self.assertEqual(subtotals.get("a").total_seconds, 0)
+        model.update_row("a", is_active=True, description="B")
+        self.assertIsNone(subtotals.get("a"))
+        self.assertEqual(_indexed(subtotals), {"b": (-5400, 1)})
+
+        model.clear()
+        self.assertEqual(len(subtotals), 0)
+
+    def test_matches_rescan_after_random_edits_and_undo(self) -> None:
+        generator = random.Random(19)
+        tags = ["Spotkanie", "spotkanie ", "Kod", "", "Urlop"]
+        model = TimesheetModel()
+        history = EditHistory(model)
+        subtotals = TagSubtotals(model)
+
+        for step in range(400):
+            action = generator.random()
+            if action < 0.35 or not len(model):
+                model.add_row(
+                    TimeRowState(
+                        row_id=f"r{step}",
+                        value=f"0{generator.randint(0, 9)}:{generator.randint(10, 59)}:00",
+                        description=generator.choice(tags),
+                    )
+                )
+            elif action < 0.5:
+                model.remove_row(generator.choice(model.row_ids))
+            elif action < 0.9:
+                model.update_row(
+                    generator.choice(model.row_ids),
+                    description=generator.choice(tags),
+                    operator=generator.choice("+-"),
+                    multiplier=generator.choice(["1", "0,5", "x"]),
+                )
+            else:
+                history.undo()
+            self.assertEqual(_indexed(subtotals), _rescan(model))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import random
+import unittest
+
+from time_batch import (
+    HAS_NUMPY,
+    calculate_time_expression_batch,
+    format_seconds_batch,
+    multiply_time_batch,
+    parse_times_batch,
+)
+from time_utils import calculate_time_expression, multiply_time, seconds_to_time, time_to_seconds
+
+BACKENDS = [False, True] if HAS_NUMPY else [False]
+
+
+def _random_columns(count: int, seed: int) -> tuple[list[str], list[str], list[float]]:
+    generator = random.Random(seed)
+    times = [
+        f"{generator.randint(0, 120):02}:{generator.randint(0, 59):02}:{generator.randint(0, 59):02}"
+        for _ in range(count)
+    ]
+    operators = [generator.choice("+-") for _ in range(count - 1)]
+    multipliers = [generator.choice([0.0, 0.5, 1.0, 1.15, 1.5, 2.25, 0.3333]) for _ in range(count - 1)]
+    return times, operators, multipliers
+
+
+class TestTimeBatch(unittest.TestCase):
+    def test_matches_scalar_calculate_time_expression(self) -> None:
+        times, operators, multipliers = _random_columns(5000, seed=7)
+        expected = calculate_time_expression(times, operators, multipliers)
+
+        for use_numpy in BACKENDS:
+            with self.subTest(use_numpy=use_numpy):
+                result = calculate_time_expression_batch(times, operators, multipliers, use_numpy=use_numpy)
+                self.assertEqual((result.clock, result.hours), expected)
+                self.assertEqual(
+                    result.total_seconds,
+                    time_to_seconds(times[0]) + sum(result.effective_seconds),
+                )
+
+    def test_fixed_width_and_mixed_width_columns_agree(self) -> None:
+        fixed = ["08:00:00", "00:00:01", "99:59:59", "12:75:00"]
+        mixed = ["8:00:00", "100:00:01", "1:2:3", "00:00:00"]
+
+        for times in (fixed, mixed):
+            expected = [time_to_seconds(value) for value in times]
+            for use_numpy in BACKENDS:
+                with self.subTest(times=times, use_numpy=use_numpy):
+                    self.assertEqual(parse_times_batch(times, use_numpy=use_numpy), expected)
+
+    def test_accepts_pre_parsed_seconds_and_rounds_half_up(self) -> None:
+        for use_numpy in BACKENDS:
+            with self.subTest(use_numpy=use_numpy):
+                result = calculate_time_expression_batch(
+                    None,
+                    ["+", "-", "*"],
+                    [1.5, 1.0, 1.0],
+                    seconds=[0, 1, 3600, 60],
+                    use_numpy=use_numpy,
+                )
+                self.assertEqual(result.effective_seconds, [2, -3600, 0])
+                self.assertEqual(result.total_seconds, -3598)
+
+    def test_validates_like_scalar_path(self) -> None:
+        for use_numpy in BACKENDS:
+            with self.subTest(use_numpy=use_numpy):
+                with self.assertRaises(ValueError):
+                    calculate_time_expression_batch([], [], use_numpy=use_numpy)
+                with self.assertRaises(ValueError):
+                    calculate_time_expression_batch(["00:00:00", "01:00:00"], ["+"], [1.0, 2.0], use_numpy=use_numpy)
+                with self.assertRaises(ValueError):
+                    calculate_time_expression_batch(["00:00:00", "01:00:00"], ["+"], [-1.0], use_numpy=use_numpy)
+                with self.assertRaises(ValueError):
+                    parse_times_batch(["14:35"], use_numpy=use_numpy)
+
+    def test_format_and_parse_round_trip(self) -> None:
+        seconds = [0, 59, 3661, 360000, -1, -3661]
+        expected = [seconds_to_time(value) for value in seconds]
+
+        for use_numpy in BACKENDS:
+            with self.subTest(use_numpy=use_numpy):
+                self.assertEqual(format_seconds_batch(seconds, use_numpy=use_numpy), expected)
+                self.assertEqual(parse_times_batch(expected[:4], use_numpy=use_numpy), seconds[:4])
+
+    def test_multiply_time_batch_matches_multiply_time(self) -> None:
+        times = ["07:35:00", "08:00:00", "00:00:01"]
+        days = [3, 0, 7]
+        expected = [multiply_time(value, day) for value, day in zip(times, days)]
+
+        for use_numpy in BACKENDS:
+            with self.subTest(use_numpy=use_numpy):
+                clocks, hours = multiply_time_batch(times, days, use_numpy=use_numpy)
+                self.assertEqual(list(zip(clocks, hours)), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import unittest
+
+from time_codec import (
+    clean_digits,
+    digits_to_seconds,
+    format_clock,
+    format_many,
+    format_signed_clock,
+    mask_digits,
+    parse_clock,
+    parse_many,
+    parse_time_input,
+)
+
+
+def _legacy_time_to_seconds(time_str: str) -> int:
+    hours, minutes, seconds = map(int, time_str.split(":"))
+    return hours * 3600 + minutes * 60 + seconds
+
+
+def _legacy_seconds_to_time(seconds: int) -> str:
+    return f"{seconds // 3600:02}:{(seconds % 3600) // 60:02}:{seconds % 60:02}"
+
+
+class TestTimeCodec(unittest.TestCase):
+    def test_parse_clock_agrees_with_split_parser(self) -> None:
+        for value in ["00:00:00", "08:00:00", "1:43:55", "143:55:00", "12345:00:00", "00:75:99"]:
+            with self.subTest(value=value):
+                self.assertEqual(parse_clock(value), _legacy_time_to_seconds(value))
+
+    def test_parse_clock_rejects_non_strict_forms(self) -> None:
+        for value in ["", "14:35", "1:2:3", "0a:00:00", "+1:00:00", " 1:00:00", "08-00-00", "0800000"]:
+            with self.subTest(value=value):
+                self.assertIsNone(parse_clock(value))
+
+    def test_parse_time_input_accepts_digits_masked_and_colon_forms(self) -> None:
+        self.assertEqual(parse_time_input("1435500"), 518100)
+        self.assertEqual(parse_time_input("143:55:00"), 518100)
+        self.assertEqual(parse_time_input("14355"), 6235)
+        self.assertEqual(parse_time_input("a1b4c3d5e5"), 6235)
+        self.assertIsNone(parse_time_input("14:35"))
+        self.assertIsNone(parse_time_input(""))
+
+    def test_non_ascii_digits_are_not_time_digits(self) -> None:
+        for value in ["١٢٣٤٥٦", "12:٣٠:00", "1²3⁴5", "１２３４５"]:
+            with self.subTest(value=value):
+                self.assertIsNone(parse_clock(value))
+                self.assertIsNone(parse_time_input(value))
+        self.assertEqual(clean_digits("12:٣٠:00"), "1200")
+        self.assertEqual(parse_time_input("0٢8:00:00"), 28800)
+        for digits in ["١٢٣٤٥", "1٢345", "12٣45"]:
+            with self.subTest(digits=digits), self.assertRaises(ValueError):
+                digits_to_seconds(digits)
+
+    def test_clean_and_mask_digits(self) -> None:
+        self.assertEqual(clean_digits("ab1:2-3 4x567"), "1234567")
+        self.assertEqual(clean_digits("12:34:56"), "123456")
+        self.assertEqual(clean_digits("987654321"), "9876543")
+        self.assertEqual(mask_digits("1435"), "14:35")
+        self.assertEqual(mask_digits("1435500"), "143:55:00")
+
+    def test_digits_to_seconds_requires_complete_digits(self) -> None:
+        self.assertEqual(digits_to_seconds("080000"), 28800)
+        with self.assertRaises(ValueError):
+            digits_to_seconds("1435")
+
+    def test_format_clock_matches_f_string_formatter(self) -> None:
+        for seconds in [0, 59, 3661, 359999, 360000, 123456789, -1, -3661]:
+            with self.subTest(seconds=seconds):
+                self.assertEqual(format_clock(seconds), _legacy_seconds_to_time(seconds))
+
+        self.assertEqual(format_signed_clock(-3661), "-01:01:01")
+        self.assertEqual(format_signed_clock(0), "00:00:00")
+
+    def test_bulk_variants_refill_buffers(self) -> None:
+        parsed: list[int | None] = [1, 2, 3, 4]
+        result = parse_many(["08:00:00", "143", "14355"], out=parsed)
+        self.assertIs(result, parsed)
+        self.assertEqual(parsed, [28800, None, 6235])
+
+        formatted: list[str] = []
+        self.assertIs(format_many([28800, -10], out=formatted, signed=True), formatted)
+        self.assertEqual(formatted, ["08:00:00", "-00:00:10"])
+        self.assertEqual(format_many([28800]), ["08:00:00"])
+
+
+if __name__ == "__main__":
+    unittest.main()
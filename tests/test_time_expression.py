@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import random
+import unittest
+
+from time_expression import ExpressionError, compile_expression, evaluate_expression, evaluate_many
+from time_utils import calculate_time_expression
+
+
+class TestTimeExpression(unittest.TestCase):
+    def test_literals_precedence_and_parentheses(self) -> None:
+        cases = {
+            "(08:00:00 - 00:30:00) * 5": "37:30:00",
+            "08:00:00 - 00:30:00 * 5": "05:30:00",
+            "8:00 + 083000 + 7,5h + .5h": "24:30:00",
+            "-(1:00:00 / 3) + 3 x 0:10:00": "00:10:00",
+            "2:00:00 / 0:30": "4",
+            "1,15 * 3": "3.45",
+            "10 / 4 * 1:00:00": "02:30:00",
+        }
+        for text, expected in cases.items():
+            with self.subTest(text=text):
+                self.assertEqual(str(evaluate_expression(text)), expected)
+
+    def test_half_up_rounding_matches_row_chains(self) -> None:
+        generator = random.Random(24)
+        for _ in range(300):
+            times = [f"{generator.randint(0, 30):02}:{generator.randint(0, 59):02}:{generator.randint(0, 59):02}" for _ in range(4)]
+            operators = [generator.choice("+-") for _ in range(3)]
+            multipliers = [generator.choice([0.5, 1.15, 1.3333, 0.0001, 2.5]) for _ in range(3)]
+
+            text = times[0] + "".join(
+                f" {operator} {time} * {str(multiplier).replace('.', ',')}"
+                for operator, time, multiplier in zip(operators, times[1:], multipliers)
+            )
+            clock, _hours = calculate_time_expression(times, operators, multipliers)
+            # Negative clocks use floor hours: "-01:59:00" is -3600 + 59 * 60.
+            hours, minutes, seconds = map(int, clock.split(":"))
+            expected = hours * 3600 + minutes * 60 + seconds
+            self.assertEqual(evaluate_expression(text).seconds, expected, text)
+
+        self.assertEqual(evaluate_expression("00:00:01 * 0,5").seconds, 1)
+        self.assertEqual(evaluate_expression("-00:00:01 * 0,5").seconds, -1)
+        self.assertEqual(evaluate_expression("00:00:01 / 3").seconds, 0)
+
+    def test_errors_and_cache(self) -> None:
+        for text, position in [("", 0), ("1:00:00 +", 9), ("(1:00:00", 0), ("1:00:00 ? 2", 8), ("8:75", 0)]:
+            with self.subTest(text=text), self.assertRaises(ExpressionError) as caught:
+                compile_expression(text)
+            self.assertEqual(caught.exception.position, position)
+
+        for text in ("1 + 1:00:00", "1:00:00 * 1:00:00", "2 / 1:00:00"):
+            with self.subTest(text=text), self.assertRaises(ExpressionError):
+                compile_expression(text)
+        with self.assertRaises(ExpressionError):
+            evaluate_expression("1:00:00 / (2 - 2)")
+        with self.assertRaises(ExpressionError):
+            _ = evaluate_expression("3 * 2").seconds
+
+        self.assertIs(compile_expression("1:00:00 * 2"), compile_expression("1:00:00 * 2"))
+        results = evaluate_many(["1:00:00 * 2", "zz", "1h"] * 1000)
+        self.assertEqual([str(result) if result else None for result in results[:3]], ["02:00:00", None, "01:00:00"])
+        self.assertEqual(len(results), 3000)
+
+    def test_only_ascii_digits_are_literals(self) -> None:
+        for text in ("١٢٣٤٥", "1:٣٠", "٢ * 1:00:00", "²h"):
+            with self.subTest(text=text), self.assertRaises(ExpressionError) as caught:
+                compile_expression(text)
+            self.assertIsNotNone(caught.exception.position)
+        self.assertEqual(evaluate_many(["١٢٣٤٥", "12345"]), [None, evaluate_expression("1:23:45")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import tkinter
+import unittest
+
+import customtkinter as ctk
+
+from ui.models import TimeRowState
+from ui.utils.scheduler import CoalescingScheduler
+from ui.widgets.time_row import TimeRowWidget
+
+
+class TestTimeRowWidgetRebind(unittest.TestCase):
+    def setUp(self) -> None:
+        try:
+            self.root = ctk.CTk()
+        except tkinter.TclError as error:
+            self.skipTest(f"Tk is not available: {error}")
+        self.addCleanup(self.root.destroy)
+        self.scheduler = CoalescingScheduler(self.root)
+        self.changes: list[str] = []
+        self.first = TimeRowState(row_id="a", value="01:00:00")
+        self.second = TimeRowState(row_id="b", value="02:00:00")
+        self.row = TimeRowWidget(
+            self.root,
+            self.first,
+            on_change=self.changes.append,
+            on_toggle=lambda _: None,
+            on_remove=lambda _: None,
+            scheduler=self.scheduler,
+        )
+
+    def test_pending_input_is_applied_to_the_row_it_was_typed_into(self) -> None:
+        self.row._time_entry.delete(0, "end")
+        self.row._time_entry.insert(0, "030000")
+        self.row._on_time_interaction()
+        self.assertEqual(len(self.scheduler.pending_keys), 1)
+
+        self.row.bind_state(self.second)
+        self.scheduler.flush()
+
+        self.assertEqual(self.first.value, "03:00:00")
+        self.assertEqual(self.second.value, "02:00:00")
+        self.assertEqual(self.row._time_entry.get(), "02:00:00")
+        self.assertEqual(self.changes, ["a"])
+        self.assertEqual(self.scheduler.pending_keys, ())
+
+
+if __name__ == "__main__":
+    unittest.main()
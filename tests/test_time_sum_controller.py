@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from ui.models import TimeRowState
+from ui.time_sum_controller import (
+    JOB_EXPORT,
+    JOB_IMPORT,
+    JOB_PASTE,
+    PASTE_BACKGROUND_LINES,
+    SUBTOTALS_SHOWN,
+    JobRequest,
+    TimeSumController,
+)
+from ui.timesheet import TimesheetModel
+from ui.utils.timesheet_csv import ImportResult
+
+
+class _Context:
+    """Stands in for ``JobContext`` when a job runs inline."""
+
+    def __init__(self) -> None:
+        self.reports: list[tuple[int, int]] = []
+
+    def report(self, done: int, total: int) -> None:
+        self.reports.append((done, total))
+
+    def raise_if_cancelled(self) -> None:
+        pass
+
+
+def _rows() -> list[TimeRowState]:
+    return [
+        TimeRowState(row_id="a", value="01:00:00", description="Projekt A"),
+        TimeRowState(row_id="b", operator="-", value="00:30:00", description="Przerwa"),
+        TimeRowState(row_id="c", value="02:00:00", description="projekt  a"),
+        TimeRowState(row_id="d", value="00:15:00"),
+    ]
+
+
+class TestTimeSumController(unittest.TestCase):
+    def setUp(self) -> None:
+        self.model = TimesheetModel(_rows())
+        self.edited: list[set[str]] = []
+        self.controller = TimeSumController(self.model, on_rows_edited=self.edited.append)
+
+    def _values(self) -> list[tuple[str, str, bool, str]]:
+        return [(state.operator, state.value, state.is_active, state.description) for state in self.model.states()]
+
+    def test_bulk_actions_are_single_undo_steps(self) -> None:
+        original = self._values()
+
+        self.assertEqual(self.controller.duplicate_rows(["a", "missing", "c"]), 2)
+        self.assertEqual(len(self.model), 6)
+        self.assertEqual(self.model.state_at(1).description, "Projekt A")
+        self.assertNotEqual(self.model.row_ids[1], "a")
+        self.controller.undo()
+        self.assertEqual(self._values(), original)
+
+        self.assertEqual(self.controller.deactivate_tag(" PROJEKT a "), 2)
+        self.assertEqual(self.edited[-1], {"a", "c"})
+        self.assertEqual(self.model.total_seconds, -30 * 60 + 15 * 60)
+        self.assertEqual(self.controller.deactivate_tag("  "), 0)
+        self.controller.undo()
+        self.assertEqual(self.edited[-1], {"a", "c"})
+        self.assertEqual(self._values(), original)
+
+        self.assertEqual(self.controller.flip_operators(), 4)
+        self.assertEqual([state.operator for state in self.model.states()], ["-", "+", "-", "-"])
+        self.controller.undo()
+        self.controller.redo()
+        self.assertEqual(self.edited[-1], {"a", "b", "c", "d"})
+        self.assertEqual(self.model.total_seconds, -(3600 - 1800 + 7200 + 900))
+        self.assertFalse(self.controller.history.can_redo)
+
+    def test_removing_the_last_row_leaves_an_empty_row(self) -> None:
+        self.controller.clear_all()
+        self.assertEqual(len(self.model), 1)
+        only_id = self.model.row_ids[0]
+
+        self.assertTrue(self.controller.remove_row(only_id))
+        self.assertFalse(self.controller.remove_row(only_id))
+        self.assertEqual(len(self.model), 1)
+        self.assertNotEqual(self.model.row_ids[0], only_id)
+
+        self.controller.undo()
+        self.assertEqual(self.model.row_ids, (only_id,))
+        self.controller.undo()
+        self.assertEqual(self._values(), [(s.operator, s.value, s.is_active, s.description) for s in _rows()])
+
+    def test_paste_fills_the_target_row_and_inserts_the_rest_below_it(self) -> None:
+        parsed = self.controller.parse_paste("-00:20:00\tSpotkanie\n00:05:00\tKawa\nabc")
+        self.assertIsInstance(parsed, ImportResult)
+        self.assertEqual(len(parsed.issues), 1)
+        self.assertIsNone(self.controller.parse_paste("01:30:00"))
+
+        self.assertEqual(self.controller.paste_rows("b", parsed.rows), 2)
+        self.assertEqual(self.model.row_ids[:2], ("a", "b"))
+        self.assertEqual(self.model.get("b").operator, "-")
+        self.assertEqual(self.model.get("b").description, "Spotkanie")
+        self.assertEqual(self.model.state_at(2).description, "Kawa")
+        self.assertEqual(self.model.row_ids[3:], ("c", "d"))
+        self.assertEqual(self.edited[-1], {"b"})
+
+        self.controller.undo()
+        self.assertEqual(len(self.model), 4)
+        self.assertEqual(self.model.get("b").description, "Przerwa")
+
+    def test_long_pastes_become_a_background_job(self) -> None:
+        text = "\n".join("00:01:00" for _ in range(PASTE_BACKGROUND_LINES + 2))
+        request = self.controller.parse_paste(text)
+
+        self.assertIsInstance(request, JobRequest)
+        self.assertEqual(request.key, JOB_PASTE)
+        context = _Context()
+        result = request.work(context)
+        self.assertEqual(len(result.rows), PASTE_BACKGROUND_LINES + 2)
+        self.assertEqual(context.reports, [(0, 1)])
+        self.assertEqual(len(self.model), 4)
+
+    def test_import_replaces_an_untouched_placeholder(self) -> None:
+        model = TimesheetModel()
+        controller = TimeSumController(model)
+        placeholder = controller.add_row()
+
+        self.assertEqual(controller.import_rows([]), 0)
+        self.assertEqual(model.row_ids, (placeholder.row_id,))
+        self.assertEqual(controller.import_rows(_rows()), 4)
+        self.assertEqual(model.row_ids, ("a", "b", "c", "d"))
+        controller.undo()
+        self.assertEqual(model.row_ids, (placeholder.row_id,))
+
+        model.update_row(placeholder.row_id, description="Notatka")
+        controller.import_rows([TimeRowState(row_id="e", value="00:01:00")])
+        self.assertEqual(model.row_ids, (placeholder.row_id, "e"))
+
+    def test_export_and_import_jobs_round_trip_a_snapshot(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = str(Path(directory) / "rows.csv")
+            request = self.controller.export_job(path)
+            self.assertEqual((request.key, request.label), (JOB_EXPORT, "Eksportowanie…"))
+
+            # Edits made while the job waits do not reach the file.
+            self.model.update_row("a", value="09:00:00")
+            context = _Context()
+            request.work(context)
+            self.assertTrue(context.reports)
+
+            result = TimeSumController.import_job(path).work(_Context())
+            self.assertEqual(TimeSumController.import_job(path).key, JOB_IMPORT)
+
+        self.assertEqual([row.value for row in result.rows], ["01:00:00", "00:30:00", "02:00:00", "00:15:00"])
+        self.assertEqual(result.issues, [])
+
+    def test_filter_narrows_visible_rows_and_summarizes_them(self) -> None:
+        self.assertFalse(self.controller.set_filter("", "", ""))
+        self.assertEqual(self.controller.filter_summary(), "")
+        self.assertEqual(self.controller.visible_row_ids(), ["a", "b", "c", "d"])
+
+        self.assertTrue(self.controller.set_filter("projekt", "", ""))
+        self.assertTrue(self.controller.filter_active)
+        self.assertEqual(self.controller.visible_row_ids(), ["a", "c"])
+        self.assertEqual(self.controller.visible_row_count(), 2)
+        self.assertEqual(self.controller.visible_state(1).row_id, "c")
+        self.assertEqual(self.controller.filter_summary(), "Pasujące: 2 z 4 · 03:00:00 (3.00 h)")
+
+        # Incomplete bounds are ignored until the mask is filled in.
+        self.assertTrue(self.controller.set_filter("", "00:20:00", "01:3"))
+        self.assertEqual(self.controller.visible_row_ids(), ["a", "b", "c"])
+
+        self.assertEqual(self.controller.flip_operators(self.controller.visible_row_ids()), 3)
+        self.assertEqual(self.model.get("d").operator, "+")
+
+        self.assertTrue(self.controller.set_filter("", "", ""))
+        self.assertFalse(self.controller.filter_active)
+        self.assertEqual(self.controller.visible_row_count(), 4)
+
+    def test_totals_follow_the_daily_norm(self) -> None:
+        totals = self.controller.totals("08:00:00")
+        self.assertEqual((totals.clock, totals.hours, totals.days), ("02:45:00", "2.75 h", "0.34"))
+        self.assertTrue(totals.norm_valid)
+
+        for norm in ("08:00", "00:00:00", ""):
+            totals = self.controller.totals(norm)
+            self.assertFalse(totals.norm_valid)
+            self.assertEqual(totals.days, "0.00")
+
+        self.controller.clear_all()
+        self.assertEqual(self.controller.totals("08:00:00").hours, "0.00 h")
+
+    def test_range_summary_uses_row_numbers_shown_to_the_user(self) -> None:
+        self.assertEqual(self.controller.range_summary(None, None), "")
+        self.assertEqual(self.controller.range_summary(2, 3), "2–3: 01:30:00 (1.50 h)")
+        self.assertEqual(self.controller.range_summary(0, None), "1–4: 02:45:00 (2.75 h)")
+        self.assertEqual(self.controller.range_summary(3, 99), "3–4: 02:15:00 (2.25 h)")
+        self.assertEqual(self.controller.range_summary(4, 2), "Pusty zakres")
+
+        self.controller.duplicate_rows(["a"])
+        self.assertEqual(self.controller.range_summary(1, 2), "1–2: 02:00:00 (2.00 h)")
+
+    def test_subtotal_lines_are_built_only_while_enabled_and_changed(self) -> None:
+        self.assertIsNone(self.controller.subtotal_lines("08:00:00"))
+
+        self.controller.set_subtotals_enabled(True)
+        lines = self.controller.subtotal_lines("08:00:00")
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[0].startswith("Projekt A"))
+        self.assertTrue(lines[0].endswith("03:00:00     3.00 h   0.38 d"))
+        self.assertTrue(any(line.startswith("(bez opisu)") for line in lines))
+        self.assertIsNone(self.controller.subtotal_lines("08:00:00"))
+        self.assertTrue(self.controller.subtotal_lines("00:00:00")[0].endswith("0.00 d"))
+
+        self.controller.import_rows(
+            TimeRowState(row_id=f"t{index}", value="00:01:00", description=f"zadanie {index}")
+            for index in range(SUBTOTALS_SHOWN + 5)
+        )
+        lines = self.controller.subtotal_lines("00:00:00")
+        self.assertEqual(len(lines), SUBTOTALS_SHOWN + 1)
+        self.assertEqual(lines[-1], "… i 8 innych")
+
+        self.controller.set_subtotals_enabled(False)
+        self.assertFalse(self.controller.subtotals_enabled)
+        self.assertIsNone(self.controller.subtotal_lines("08:00:00"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,6 +10,7 @@ from ui.utils.time_sum_helpers import (
     is_valid_multiplier,
     mask_hhmmss,
     parse_multiplier,
+    row_signed_seconds,
     sanitize_digits,
     sanitize_multiplier_text,
 )
@@ -111,6 +112,16 @@ class TestTimeSumHelpers(unittest.TestCase):
         self.assertEqual(multipliers, [1.0])
         self.assertEqual(total_seconds, 900)
 
+    def test_row_signed_seconds(self) -> None:
+        self.assertEqual(
+            row_signed_seconds(TimeRowState(row_id="1", operator="-", value="00:30:00", multiplier="2")),
+            -3600,
+        )
+        self.assertEqual(row_signed_seconds(TimeRowState(row_id="2", value="00:00:01", multiplier="1.5")), 2)
+        self.assertEqual(row_signed_seconds(TimeRowState(row_id="3", value="00:10:00", is_active=False)), 0)
+        self.assertEqual(row_signed_seconds(TimeRowState(row_id="4", value="14:3")), 0)
+        self.assertEqual(row_signed_seconds(TimeRowState(row_id="5", value="00:10:00", multiplier="")), 0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import tkinter
+import unittest
+
+import customtkinter as ctk
+
+from ui.models import TimeRowState
+from ui.utils.time_sum_helpers import mask_hhmmss, sanitize_multiplier_text
+from ui.widgets.time_table import (
+    COLUMN_ACTIVE,
+    COLUMN_DESCRIPTION,
+    COLUMN_MULTIPLIER,
+    COLUMN_ORDER,
+    COLUMN_REMOVE,
+    COLUMN_TIME,
+    TimeTable,
+    column_at,
+    layout_columns,
+    sanitize_cell_input,
+)
+
+
+class TestTimeTableLayout(unittest.TestCase):
+    def test_columns_tile_the_width_and_description_flexes(self) -> None:
+        columns = layout_columns(800)
+        self.assertEqual([column.key for column in columns], list(COLUMN_ORDER))
+        self.assertEqual(columns[0].x0, 0)
+        self.assertEqual(columns[-1].x1, 800)
+        for left, right in zip(columns, columns[1:]):
+            self.assertEqual(left.x1, right.x0)
+
+        narrow = {column.key: column for column in layout_columns(0)}
+        self.assertGreater(narrow[COLUMN_DESCRIPTION].x1 - narrow[COLUMN_DESCRIPTION].x0, 0)
+
+    def test_hit_testing(self) -> None:
+        columns = layout_columns(800)
+        self.assertEqual(column_at(columns, 0), COLUMN_ACTIVE)
+        self.assertEqual(column_at(columns, 799), COLUMN_REMOVE)
+        self.assertIsNone(column_at(columns, 800))
+        self.assertIsNone(column_at(columns, -1))
+
+    def test_editor_reuses_row_input_rules(self) -> None:
+        for text in ("12a345", "1.5x", "0,25", "99:99"):
+            self.assertEqual(sanitize_cell_input(COLUMN_TIME, text), mask_hhmmss(text))
+            self.assertEqual(sanitize_cell_input(COLUMN_MULTIPLIER, text), sanitize_multiplier_text(text))
+        self.assertEqual(sanitize_cell_input(COLUMN_DESCRIPTION, "12a345"), "12a345")
+
+
+class TestTimeTableEditor(unittest.TestCase):
+    def setUp(self) -> None:
+        try:
+            self.root = ctk.CTk()
+        except tkinter.TclError as error:
+            self.skipTest(f"Tk is not available: {error}")
+        self.addCleanup(self.root.destroy)
+        self.changes: list[str] = []
+        self.table = TimeTable(self.root, on_change=self.changes.append, on_remove=lambda _: None)
+        self.table.pack(fill="both", expand=True)
+        self.root.update_idletasks()
+
+    def test_start_edit_places_the_shared_editor_over_the_cell(self) -> None:
+        states = [TimeRowState(row_id="a", value="01:00:00"), TimeRowState(row_id="b", value="02:30:00")]
+        self.table.render(states, 0)
+
+        self.table._start_edit(states[1], COLUMN_TIME)
+        self.root.update_idletasks()
+
+        self.assertEqual(self.table.editing_row_id, "b")
+        self.assertEqual(self.table._editor.winfo_manager(), "place")
+        self.assertEqual(self.table._editor.get(), "02:30:00")
+
+        self.table._editor.delete(0, "end")
+        self.table._editor.insert(0, "03:00:00")
+        self.table.commit_edit()
+
+        self.assertIsNone(self.table.editing_row_id)
+        self.assertEqual(states[1].value, "03:00:00")
+        self.assertEqual(self.changes, ["b"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import unittest
+
+from ui.history import EditHistory
+from ui.models import TimeRowState
+from ui.timesheet import EVENT_INSERT, EVENT_REMOVE, EVENT_RESET, EVENT_UPDATE, ModelEvent, TimesheetModel
+from ui.utils.time_sum_helpers import build_expression_payload, compute_contributions
+
+
+class TestTimesheetModel(unittest.TestCase):
+    def setUp(self) -> None:
+        self.model = TimesheetModel()
+        self.events: list[ModelEvent] = []
+        self.model.subscribe(self.events.append)
+
+    def test_add_and_insert_keep_order_and_total(self) -> None:
+        first = self.model.add_row(TimeRowState(row_id="a", value="01:00:00"))
+        self.model.add_row(TimeRowState(row_id="c", value="00:10:00", operator="-"))
+        self.model.add_row(TimeRowState(row_id="b", value="00:30:00", multiplier="2"), index=1)
+
+        self.assertIs(self.model.get("a"), first)
+        self.assertEqual(self.model.row_ids, ("a", "b", "c"))
+        self.assertEqual(self.model.index_of("c"), 2)
+        self.assertEqual(self.model.total_seconds, 3600 + 3600 - 600)
+        self.assertEqual([event.kind for event in self.events], [EVENT_INSERT] * 3)
+
+    def test_insert_rows_is_one_event_and_rejects_duplicates(self) -> None:
+        states = [TimeRowState(row_id=str(index), value="00:01:00") for index in range(100)]
+        self.model.insert_rows(states)
+
+        self.assertEqual(len(self.model), 100)
+        self.assertEqual(self.model.total_seconds, 6000)
+        self.assertEqual(self.events, [ModelEvent(EVENT_INSERT, tuple(str(index) for index in range(100)))])
+
+        with self.assertRaises(ValueError):
+            self.model.insert_rows([TimeRowState(row_id="5")])
+        with self.assertRaises(ValueError):
+            self.model.insert_rows([TimeRowState(row_id="x"), TimeRowState(row_id="x")])
+        self.assertEqual(len(self.model), 100)
+
+    def test_update_and_row_changed_apply_deltas(self) -> None:
+        state = self.model.add_row(TimeRowState(row_id="a", value="01:00:00"))
+
+        self.model.update_row("a", multiplier="1,5")
+        self.assertEqual(self.model.total_seconds, 5400)
+
+        state.is_active = False
+        self.model.row_changed("a")
+        self.assertEqual(self.model.total_seconds, 0)
+        self.assertEqual(self.events[-1], ModelEvent(EVENT_UPDATE, ("a",)))
+
+    def test_remove_and_clear(self) -> None:
+        self.model.insert_rows(TimeRowState(row_id=row_id, value="00:10:00") for row_id in "abc")
+
+        self.assertTrue(self.model.remove_row("b"))
+        self.assertFalse(self.model.remove_row("missing"))
+        self.assertEqual(self.model.remove_rows(["a", "a", "zzz"]), ["a"])
+        self.assertEqual(self.model.row_ids, ("c",))
+        self.assertEqual(self.model.total_seconds, 600)
+
+        self.model.clear()
+        self.assertEqual(len(self.model), 0)
+        self.assertEqual(self.model.total_seconds, 0)
+        self.assertEqual([event.kind for event in self.events[1:]], [EVENT_REMOVE, EVENT_REMOVE, EVENT_RESET])
+
+    def test_total_matches_expression_payload(self) -> None:
+        states = [
+            TimeRowState(row_id="1", operator="+", value="01:00:00", multiplier="1.5"),
+            TimeRowState(row_id="2", operator="-", value="00:30:00", multiplier="2"),
+            TimeRowState(row_id="3", operator="+", value="00:10:00", multiplier="abc"),
+            TimeRowState(row_id="4", operator="+", value="00:20:00", is_active=False),
+        ]
+        model = TimesheetModel(states)
+
+        self.assertEqual(model.total_seconds, build_expression_payload(states)[3])
+        self.assertEqual(model.recalculate(), model.total_seconds)
+
+    def test_snapshot_states_are_copies(self) -> None:
+        self.model.add_row(TimeRowState(row_id="a", value="00:10:00"))
+        snapshot = self.model.snapshot_states()
+        snapshot[0].value = "09:00:00"
+
+        self.assertEqual(self.model.get("a").value, "00:10:00")
+
+    def test_apply_contributions_rejects_stale_versions(self) -> None:
+        self.model.insert_rows(TimeRowState(row_id=row_id, value="00:10:00") for row_id in "ab")
+        version = self.model.version
+        contributions = compute_contributions(self.model.states())
+
+        self.model.update_row("a", value="01:00:00")
+        self.assertFalse(self.model.apply_contributions(contributions, version))
+
+        version = self.model.version
+        self.assertTrue(self.model.apply_contributions(compute_contributions(self.model.states()), version))
+        self.assertEqual(self.model.total_seconds, 4200)
+
+    def test_batch_applies_queued_changes_with_few_events(self) -> None:
+        self.model.insert_rows(TimeRowState(row_id=row_id, value="01:00:00") for row_id in "abcd")
+        self.events.clear()
+
+        with self.model.batch() as batch:
+            batch.update("a", operator="-")
+            batch.update("b", is_active=False)
+            batch.remove("c")
+            batch.insert(TimeRowState(row_id="a2", value="00:30:00"), after="a")
+            batch.insert(TimeRowState(row_id="a3", value="00:15:00"), after="a2")
+            batch.insert(TimeRowState(row_id="b2", value="00:10:00"), after="b")
+            batch.insert(TimeRowState(row_id="e", value="00:05:00"))
+            batch.update("e", operator="-")
+            self.assertEqual(self.events, [])
+
+        self.assertEqual(self.model.row_ids, ("a", "a2", "a3", "b", "b2", "d", "e"))
+        self.assertEqual(self.model.total_seconds, -3600 + 1800 + 900 + 600 + 3600 - 300)
+        self.assertEqual(
+            [(event.kind, event.row_ids, event.index) for event in self.events],
+            [
+                (EVENT_UPDATE, ("a", "b"), 0),
+                (EVENT_REMOVE, ("c",), 0),
+                (EVENT_INSERT, ("a2", "a3"), 1),
+                (EVENT_INSERT, ("b2",), 4),
+                (EVENT_INSERT, ("e",), 6),
+            ],
+        )
+
+    def test_batch_is_discarded_on_error_and_undoes_as_one_step(self) -> None:
+        history = EditHistory(self.model)
+        self.model.insert_rows(TimeRowState(row_id=row_id, value="00:10:00") for row_id in "ab")
+
+        with self.assertRaises(RuntimeError), self.model.batch() as batch:
+            batch.remove("a")
+            raise RuntimeError
+        self.assertEqual(self.model.row_ids, ("a", "b"))
+
+        with history.group(), self.model.batch() as batch:
+            for row_id in self.model.row_ids:
+                batch.insert(TimeRowState(row_id=f"{row_id}-copy", value="00:10:00"), after=row_id)
+                batch.update(row_id, operator="-")
+        self.assertEqual(self.model.row_ids, ("a", "a-copy", "b", "b-copy"))
+        self.assertEqual(self.model.total_seconds, 0)
+
+        history.undo()
+        self.assertEqual(self.model.row_ids, ("a", "b"))
+        self.assertEqual(self.model.total_seconds, 1200)
+        history.redo()
+        self.assertEqual(self.model.row_ids, ("a", "a-copy", "b", "b-copy"))
+
+    def test_rejected_batch_changes_nothing(self) -> None:
+        self.model.insert_rows(TimeRowState(row_id=row_id, value="00:10:00") for row_id in "ab")
+        self.events.clear()
+
+        with self.assertRaises(ValueError), self.model.batch() as batch:
+            batch.update("a", operator="-")
+            batch.remove("b")
+            batch.insert(TimeRowState(row_id="a"))
+        self.assertEqual(self.events, [])
+        self.assertEqual(self.model.row_ids, ("a", "b"))
+        self.assertEqual(self.model.get("a").operator, "+")
+        self.assertEqual(self.model.total_seconds, 1200)
+
+        with self.assertRaises(ValueError), self.model.batch() as batch:
+            batch.update("a", operator="-", colour="red")
+        self.assertEqual(self.events, [])
+
+        with self.model.batch() as batch:
+            batch.remove("b")
+            batch.insert(TimeRowState(row_id="b", value="00:05:00"), after="a")
+            self.assertEqual(batch.removed_ids, ("b",))
+            self.assertEqual(list(batch.inserts), ["a"])
+        self.assertEqual(self.model.row_ids, ("a", "b"))
+        self.assertEqual(self.model.total_seconds, 900)
+
+    def test_unsubscribe_stops_notifications(self) -> None:
+        unsubscribe = self.model.subscribe(self.events.append)
+        unsubscribe()
+        self.model.add_row()
+
+        self.assertEqual(len(self.events), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
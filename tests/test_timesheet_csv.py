@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+
+from ui.timesheet import TimesheetModel
+from ui.models import TimeRowState
+from ui.utils.timesheet_csv import (
+    ImportIssue,
+    detect_delimiter,
+    iter_timesheet_rows,
+    parse_pasted_rows,
+    read_timesheet,
+    write_timesheet,
+)
+
+
+class TestTimesheetCsv(unittest.TestCase):
+    def test_positional_tsv_rows(self) -> None:
+        lines = [
+            "+\t01:00:00\t1,5\t1\tProjekt A\n",
+            "-\t003000\t2\tnie\tPrzerwa\n",
+            "\t00:10:00\t\t\t\n",
+        ]
+
+        rows = list(iter_timesheet_rows(lines))
+
+        self.assertEqual([row.operator for row in rows], ["+", "-", "+"])
+        self.assertEqual([row.value for row in rows], ["01:00:00", "00:30:00", "00:10:00"])
+        self.assertEqual([row.multiplier for row in rows], ["1,5", "2", "1"])
+        self.assertEqual([row.is_active for row in rows], [True, False, True])
+        self.assertEqual(rows[0].description, "Projekt A")
+        self.assertEqual(len({row.row_id for row in rows}), 3)
+
+    def test_header_selects_columns_and_invalid_lines_are_reported(self) -> None:
+        lines = [
+            "opis;czas;mnożnik\n",
+            "A;01:00:00;1\n",
+            "B;14:3;1\n",
+            "C;01:00:00;1..2\n",
+            "\n",
+            "D;00:00:30;2\n",
+        ]
+        issues: list[ImportIssue] = []
+
+        rows = list(iter_timesheet_rows(lines, issues))
+
+        self.assertEqual([row.description for row in rows], ["A", "D"])
+        self.assertEqual([issue.line_number for issue in issues], [3, 4])
+
+    def test_detect_delimiter(self) -> None:
+        self.assertEqual(detect_delimiter("a\tb"), "\t")
+        self.assertEqual(detect_delimiter("a;b"), ";")
+        self.assertEqual(detect_delimiter("a,b"), ",")
+        self.assertEqual(detect_delimiter(""), ",")
+
+    def test_read_timesheet_loads_large_file_into_model_in_one_batch(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "export.csv")
+            with open(path, "w", encoding="utf-8") as handle:
+                handle.write("operator,time,multiplier,active,description\n")
+                for index in range(20_000):
+                    handle.write(f"+,00:01:00,1,1,row {index}\n")
+
+            result = read_timesheet(path)
+
+        model = TimesheetModel()
+        events = []
+        model.subscribe(events.append)
+        model.insert_rows(result.rows)
+
+        self.assertEqual(result.issues, [])
+        self.assertEqual(len(model), 20_000)
+        self.assertEqual(model.total_seconds, 20_000 * 60)
+        self.assertEqual(len(events), 1)
+
+    def test_write_timesheet_round_trips_through_reader(self) -> None:
+        rows = [
+            TimeRowState(row_id="1", operator="-", value="01:30:00", multiplier="1,5", description="a, b"),
+            TimeRowState(row_id="2", value="00:00:10", is_active=False),
+        ]
+        progress: list[tuple[int, int]] = []
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "export.tsv")
+            self.assertEqual(write_timesheet(path, rows, progress=lambda done, total: progress.append((done, total))), 2)
+            result = read_timesheet(path)
+
+        self.assertEqual(progress[-1], (2, 2))
+        self.assertEqual(
+            [(row.operator, row.value, row.multiplier, row.is_active, row.description) for row in result.rows],
+            [(row.operator, row.value, row.multiplier, row.is_active, row.description) for row in rows],
+        )
+
+    def test_pasted_lines_and_cells_become_rows(self) -> None:
+        self.assertIsNone(parse_pasted_rows("01:30:00"))
+        self.assertIsNone(parse_pasted_rows("013000\n"))
+
+        issues: list[ImportIssue] = []
+        rows = parse_pasted_rows("1:30:00\r\n2024-05-06\t-0:15:00\tPrzerwa\nabc\n\n0450000", issues)
+        self.assertEqual(
+            [(row.operator, row.value, row.description) for row in rows],
+            [("+", "01:30:00", ""), ("-", "00:15:00", "2024-05-06 Przerwa"), ("+", "45:00:00", "")],
+        )
+        self.assertEqual(issues, [ImportIssue(3, "brak czasu w 'abc'")])
+
+        rows = parse_pasted_rows("opis\tczas\nKod\t02:00:00\n")
+        self.assertEqual([(row.value, row.description) for row in rows], [("02:00:00", "Kod")])
+
+    def test_large_paste_lands_below_the_target_row_in_one_insert(self) -> None:
+        model = TimesheetModel([TimeRowState(row_id="a"), TimeRowState(row_id="z", value="01:00:00")])
+        events = []
+        model.subscribe(events.append)
+
+        rows = parse_pasted_rows("\n".join(f"00:{minute % 60:02}:00\tzadanie {minute}" for minute in range(5000)))
+        with model.batch() as batch:
+            batch.update("a", value=rows[0].value, description=rows[0].description)
+            batch.insert_rows(rows[1:], after="a")
+
+        self.assertEqual(len(model), 5001)
+        self.assertEqual(model.row_ids[-1], "z")
+        self.assertEqual(model.state_at(1).description, "zadanie 1")
+        self.assertEqual(len(events), 2)
+        self.assertEqual(model.total_seconds, 3600 + sum((minute % 60) * 60 for minute in range(5000)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from fixed_point import FIXED_ONE, MULTIPLIER_SCALE, apply_fixed_multiplier, fixed_multiplier_from_float
+from time_utils import (
+    seconds_to_float_hours,
+    seconds_to_time,
+    time_to_seconds,
+)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without NumPy
+    np = None
+
+HAS_NUMPY = np is not None
+
+
+@dataclass(frozen=True, slots=True)
+class BatchResult:
+    total_seconds: int
+    effective_seconds: list[int]
+    clock: str
+    hours: float
+
+
+def _resolve_backend(use_numpy: bool | None) -> bool:
+    if use_numpy is None:
+        return HAS_NUMPY
+    if use_numpy and not HAS_NUMPY:
+        raise RuntimeError("NumPy is not installed")
+    return use_numpy
+
+
+def _parse_fixed_width_numpy(times: Sequence[str]):
+    widths = set(map(len, times))
+    if len(widths) != 1:
+        return None
+
+    width = widths.pop()
+    if width < 7:
+        return None
+
+    try:
+        raw = "".join(times).encode("ascii")
+    except UnicodeEncodeError:
+        return None
+
+    grid = np.frombuffer(raw, dtype=np.uint8).reshape(-1, width).astype(np.int64) - ord("0")
+    colon = ord(":") - ord("0")
+    digit_columns = [column for column in range(width) if column not in (width - 6, width - 3)]
+
+    if not (np.all(grid[:, width - 6] == colon) and np.all(grid[:, width - 3] == colon)):
+        return None
+    if not np.all((grid[:, digit_columns] >= 0) & (grid[:, digit_columns] <= 9)):
+        return None
+
+    hours = np.zeros(len(grid), dtype=np.int64)
+    for column in range(width - 6):
+        hours = hours * 10 + grid[:, column]
+
+    minutes = grid[:, width - 5] * 10 + grid[:, width - 4]
+    seconds = grid[:, width - 2] * 10 + grid[:, width - 1]
+    return hours * 3600 + minutes * 60 + seconds
+
+
+def _parse_times_numpy(times: Sequence[str]):
+    if len(times) == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    fixed_width = _parse_fixed_width_numpy(times)
+    if fixed_width is not None:
+        return fixed_width
+
+    if any(value.count(":") != 2 for value in times):
+        raise ValueError("each time must have the HH:MM:SS form")
+
+    try:
+        parts = np.asarray(":".join(times).split(":"), dtype=np.int64).reshape(-1, 3)
+    except ValueError:
+        # Let the scalar parser raise the same error it always has.
+        return np.asarray([time_to_seconds(value) for value in times], dtype=np.int64)
+
+    return parts[:, 0] * 3600 + parts[:, 1] * 60 + parts[:, 2]
+
+
+def parse_times_batch(times: Sequence[str], use_numpy: bool | None = None) -> list[int]:
+    if _resolve_backend(use_numpy):
+        return _parse_times_numpy(times).tolist()
+    return [time_to_seconds(value) for value in times]
+
+
+def format_seconds_batch(seconds: Sequence[int], use_numpy: bool | None = None) -> list[str]:
+    if not _resolve_backend(use_numpy):
+        return [seconds_to_time(value) for value in seconds]
+
+    values = np.asarray(seconds, dtype=np.int64)
+    if values.size == 0:
+        return []
+
+    hours = np.char.zfill((values // 3600).astype(str), 2)
+    minutes = np.char.zfill(((values % 3600) // 60).astype(str), 2)
+    secs = np.char.zfill((values % 60).astype(str), 2)
+    return np.char.add(np.char.add(np.char.add(np.char.add(hours, ":"), minutes), ":"), secs).tolist()
+
+
+def _validate_columns(
+    term_count: int,
+    operators: Sequence[str],
+    multipliers: Sequence[float] | None,
+) -> None:
+    if term_count == 0:
+        raise ValueError("times cannot be empty")
+
+    if term_count - 1 != len(operators):
+        raise ValueError("operators length must match times length minus one")
+
+    if multipliers is not None and len(multipliers) != len(operators):
+        raise ValueError("multipliers length must match operators length")
+
+
+def calculate_time_expression_batch(
+    times: Sequence[str] | None,
+    operators: Sequence[str],
+    multipliers: Sequence[float] | None = None,
+    *,
+    seconds: Sequence[int] | None = None,
+    use_numpy: bool | None = None,
+) -> BatchResult:
+    """Column-wise ``calculate_time_expression``.
+
+    Either ``times`` or pre-parsed ``seconds`` describe the terms. The result
+    carries the signed effective seconds of every term after the first one and
+    is identical to the scalar path, which is also the fallback without NumPy.
+    """
+    if (times is None) == (seconds is None):
+        raise ValueError("pass exactly one of times or seconds")
+
+    term_count = len(times) if times is not None else len(seconds)
+    _validate_columns(term_count, operators, multipliers)
+
+    if _resolve_backend(use_numpy):
+        return _calculate_numpy(times, operators, multipliers, seconds)
+    return _calculate_scalar(times, operators, multipliers, seconds)
+
+
+def _calculate_scalar(
+    times: Sequence[str] | None,
+    operators: Sequence[str],
+    multipliers: Sequence[float] | None,
+    seconds: Sequence[int] | None,
+) -> BatchResult:
+    if seconds is None:
+        seconds = [time_to_seconds(value) for value in times]
+
+    total_seconds = int(seconds[0])
+    effective: list[int] = []
+
+    for index, operator in enumerate(operators):
+        scaled = FIXED_ONE
+        if multipliers is not None:
+            multiplier = multipliers[index]
+            if multiplier < 0:
+                raise ValueError("multiplier must be greater than or equal to 0")
+            scaled = fixed_multiplier_from_float(multiplier)
+
+        effective_seconds = apply_fixed_multiplier(seconds[index + 1], scaled)
+        if operator == "+":
+            effective.append(effective_seconds)
+        elif operator == "-":
+            effective.append(-effective_seconds)
+        else:
+            effective.append(0)
+        total_seconds += effective[-1]
+
+    return BatchResult(
+        total_seconds=total_seconds,
+        effective_seconds=effective,
+        clock=seconds_to_time(total_seconds),
+        hours=seconds_to_float_hours(total_seconds),
+    )
+
+
+def _calculate_numpy(
+    times: Sequence[str] | None,
+    operators: Sequence[str],
+    multipliers: Sequence[float] | None,
+    seconds: Sequence[int] | None,
+) -> BatchResult:
+    values = _parse_times_numpy(times) if seconds is None else np.asarray(seconds, dtype=np.int64)
+    terms = values[1:]
+
+    if multipliers is None:
+        effective = terms.copy()
+    else:
+        factors = np.asarray(multipliers, dtype=np.float64)
+        if np.any(factors < 0):
+            raise ValueError("multiplier must be greater than or equal to 0")
+        # Columns usually repeat a handful of multipliers: scale the distinct
+        # values once and gather them back as exact fixed-point integers.
+        distinct, inverse = np.unique(factors, return_inverse=True)
+        scaled = np.array([fixed_multiplier_from_float(float(value)) for value in distinct], dtype=object)
+        effective = _apply_fixed_numpy(terms, scaled, inverse)
+
+    operator_column = np.asarray(operators, dtype=str)
+    signs = (operator_column == "+").astype(np.int64) - (operator_column == "-").astype(np.int64)
+    effective *= signs
+
+    total_seconds = int(values[0]) + int(effective.sum())
+    return BatchResult(
+        total_seconds=total_seconds,
+        effective_seconds=effective.tolist(),
+        clock=seconds_to_time(total_seconds),
+        hours=seconds_to_float_hours(total_seconds),
+    )
+
+
+def _apply_fixed_numpy(terms, distinct_scaled, inverse):
+    largest = max(distinct_scaled, default=0) * int(terms.max(initial=0))
+    if largest >= 2**62:
+        # Products could overflow int64; stay exact with Python integers.
+        pairs = zip(terms.tolist(), distinct_scaled[inverse].tolist())
+        return np.array([apply_fixed_multiplier(term, scale) for term, scale in pairs], dtype=object)
+
+    scaled = distinct_scaled.astype(np.int64)[inverse]
+    return (terms * scaled + MULTIPLIER_SCALE // 2) // MULTIPLIER_SCALE
+
+
+def multiply_time_batch(
+    times: Sequence[str],
+    days: Sequence[int],
+    use_numpy: bool | None = None,
+) -> tuple[list[str], list[float]]:
+    """Column-wise ``multiply_time`` returning clock strings and decimal hours."""
+    if len(times) != len(days):
+        raise ValueError("days length must match times length")
+
+    if _resolve_backend(use_numpy):
+        totals = (_parse_times_numpy(times) * np.asarray(days, dtype=np.int64)).tolist()
+    else:
+        totals = [time_to_seconds(value) * day for value, day in zip(times, days)]
+
+    return (
+        format_seconds_batch(totals, use_numpy=use_numpy),
+        [seconds_to_float_hours(value) for value in totals],
+    )
@@ -0,0 +1,121 @@
+"""Fast parsing and formatting of clock strings.
+
+Every helper that turns ``HH:MM:SS`` text, masked input or raw digits into
+seconds (or back) goes through this module, so the rules live in one place.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+MAX_TIME_DIGITS = 7
+
+_PAIRS: tuple[str, ...] = tuple(f"{value:02}" for value in range(100))
+_PAIR_VALUES: dict[str, int] = {text: value for value, text in enumerate(_PAIRS)}
+_HOUR_VALUES: dict[str, int] = {**_PAIR_VALUES, **{str(value): value for value in range(10)}}
+
+
+def clean_digits(value: str) -> str:
+    """Keep only ASCII digits, at most ``MAX_TIME_DIGITS`` of them."""
+    stripped = value.replace(":", "")
+    if (stripped.isdigit() and stripped.isascii()) or not stripped:
+        return stripped[:MAX_TIME_DIGITS]
+    # str.isdigit() also accepts other scripts and superscripts, which the digit tables do not know.
+    return "".join(character for character in value if "0" <= character <= "9")[:MAX_TIME_DIGITS]
+
+
+def mask_digits(digits: str) -> str:
+    length = len(digits)
+
+    if length <= 3:
+        return digits
+    if length == 4:
+        return f"{digits[:2]}:{digits[2:]}"
+    return f"{digits[:-4]}:{digits[-4:-2]}:{digits[-2:]}"
+
+
+def digits_to_seconds(digits: str) -> int:
+    """Convert 5 to 7 clean digits (``HMMSS`` to ``HHHMMSS``) to seconds."""
+    if not 5 <= len(digits) <= MAX_TIME_DIGITS:
+        raise ValueError("Time value must contain from 5 to 7 digits")
+
+    hours_text = digits[:-4]
+    hours = _HOUR_VALUES.get(hours_text)
+    if hours is None:
+        if not hours_text.isdigit() or not hours_text.isascii():
+            raise ValueError("Time value must contain only the digits 0-9")
+        hours = int(hours_text)
+
+    try:
+        return hours * 3600 + _PAIR_VALUES[digits[-4:-2]] * 60 + _PAIR_VALUES[digits[-2:]]
+    except KeyError:
+        raise ValueError("Time value must contain only the digits 0-9") from None
+
+
+def parse_clock(text: str) -> int | None:
+    """Parse the strict ``H+:MM:SS`` form in one pass, or return ``None``."""
+    if len(text) < 7 or text[-3] != ":" or text[-6] != ":":
+        return None
+
+    minutes = _PAIR_VALUES.get(text[-5:-3])
+    seconds = _PAIR_VALUES.get(text[-2:])
+    if minutes is None or seconds is None:
+        return None
+
+    hours_text = text[:-6]
+    hours = _HOUR_VALUES.get(hours_text)
+    if hours is None:
+        if not hours_text.isdigit() or not hours_text.isascii():
+            return None
+        hours = int(hours_text)
+
+    return hours * 3600 + minutes * 60 + seconds
+
+
+def parse_time_input(text: str) -> int | None:
+    """Parse digits, masked or colon input the way a time row reads it."""
+    if len(text) <= MAX_TIME_DIGITS + 2:
+        seconds = parse_clock(text)
+        if seconds is not None:
+            return seconds
+
+    digits = clean_digits(text)
+    if not 5 <= len(digits) <= MAX_TIME_DIGITS:
+        return None
+    return digits_to_seconds(digits)
+
+
+def format_clock(seconds: int) -> str:
+    if seconds < 0:
+        hours = seconds // 3600
+        return f"{hours:02}:{_PAIRS[(seconds % 3600) // 60]}:{_PAIRS[seconds % 60]}"
+
+    hours, remainder = divmod(seconds, 3600)
+    minutes, secs = divmod(remainder, 60)
+    hours_text = _PAIRS[hours] if hours < 100 else str(hours)
+    return f"{hours_text}:{_PAIRS[minutes]}:{_PAIRS[secs]}"
+
+
+def format_signed_clock(seconds: int) -> str:
+    if seconds < 0:
+        return "-" + format_clock(-seconds)
+    return format_clock(seconds)
+
+
+def parse_many(texts: Iterable[str], out: list[int | None] | None = None) -> list[int | None]:
+    """``parse_time_input`` over many values, refilling ``out`` when given."""
+    if out is None:
+        return [parse_time_input(text) for text in texts]
+
+    out[:] = map(parse_time_input, texts)
+    return out
+
+
+def format_many(seconds: Iterable[int], out: list[str] | None = None, signed: bool = False) -> list[str]:
+    """``format_clock`` over many values, refilling ``out`` when given."""
+    formatter = format_signed_clock if signed else format_clock
+    if out is None:
+        return [formatter(value) for value in seconds]
+
+    out[:] = map(formatter, seconds)
+    return out
@@ -0,0 +1,250 @@
+"""Time arithmetic expressions, compiled once and cached by their text.
+
+``compile_expression("(08:00:00 - 00:30:00) * 5")`` parses the text into a
+tree of closures and checks it: durations can be added to and subtracted
+from durations, scaled by numbers, and divided by numbers or by other
+durations (giving a number). Literals are:
+
+* clocks, ``8:00:00`` or ``8:00`` (hours and minutes),
+* 5 to 7 digits, ``083000``, read like the time rows read them,
+* decimal hours, ``7,5h``,
+* plain numbers, ``1,15`` or ``3``, rounded half-up to the four decimals of
+  the row multipliers.
+
+``x``, ``×`` and ``÷`` are accepted for ``*`` and ``/``.
+
+Durations stay whole seconds: every product and quotient is rounded half-up
+(away from zero for negative values), exactly like ``apply_fixed_multiplier``
+rounds a row. Numbers are fixed-point integers, so nothing goes through floats.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+
+from fixed_point import MULTIPLIER_SCALE, apply_fixed_multiplier, format_fixed_multiplier, parse_fixed_multiplier
+from time_codec import MAX_TIME_DIGITS, digits_to_seconds, format_signed_clock, parse_clock
+
+EXPRESSION_CACHE_SIZE = 4096
+
+_TOKEN = re.compile(
+    r"(?P<clock>[0-9]+:[0-9]{2}(?::[0-9]{2})?)"
+    r"|(?P<number>[0-9]+(?:[.,][0-9]*)?|[.,][0-9]+)(?P<hours>\s*h(?![a-z]))?"
+    r"|(?P<operator>[-+*/×x÷()])",
+    re.IGNORECASE,
+)
+_SPACE = re.compile(r"\s*")
+_OPERATOR_ALIASES = {"×": "*", "x": "*", "X": "*", "÷": "/"}
+
+Evaluator = Callable[[], int]
+
+
+class ExpressionError(ValueError):
+    """Invalid expression text; ``position`` is the offending character."""
+
+    def __init__(self, message: str, position: int | None = None) -> None:
+        super().__init__(message)
+        self.position = position
+
+
+@dataclass(frozen=True, slots=True)
+class Quantity:
+    """A duration in whole seconds or a number scaled by ``MULTIPLIER_SCALE``."""
+
+    value: int
+    is_duration: bool
+
+    @property
+    def seconds(self) -> int:
+        if not self.is_duration:
+            raise ExpressionError("result is a number, not a duration")
+        return self.value
+
+    def __str__(self) -> str:
+        if self.is_duration:
+            return format_signed_clock(self.value)
+        sign = "-" if self.value < 0 else ""
+        return sign + format_fixed_multiplier(abs(self.value))
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledExpression:
+    text: str
+    is_duration: bool
+    _evaluate: Evaluator
+
+    def evaluate(self) -> Quantity:
+        return Quantity(self._evaluate(), self.is_duration)
+
+
+def _divide_half_up(numerator: int, denominator: int) -> int:
+    if denominator == 0:
+        raise ExpressionError("division by zero")
+    quotient = (2 * abs(numerator) + abs(denominator)) // (2 * abs(denominator))
+    return quotient if (numerator < 0) == (denominator < 0) else -quotient
+
+
+def _scale(seconds: int, scaled: int) -> int:
+    result = apply_fixed_multiplier(abs(seconds), abs(scaled))
+    return result if (seconds < 0) == (scaled < 0) else -result
+
+
+def _multiply(left: tuple[bool, Evaluator], right: tuple[bool, Evaluator]) -> tuple[bool, Evaluator]:
+    (left_is_duration, left_value), (right_is_duration, right_value) = left, right
+    if left_is_duration and right_is_duration:
+        raise ExpressionError("cannot multiply two durations")
+    if right_is_duration:
+        return True, lambda: _scale(right_value(), left_value())
+    # Duration by number and number by number round the same way: to the left operand's unit.
+    return left_is_duration, lambda: _scale(left_value(), right_value())
+
+
+def _divide(left: tuple[bool, Evaluator], right: tuple[bool, Evaluator]) -> tuple[bool, Evaluator]:
+    (left_is_duration, left_value), (right_is_duration, right_value) = left, right
+    if right_is_duration and not left_is_duration:
+        raise ExpressionError("cannot divide a number by a duration")
+    # Duration / duration is a ratio; anything divided by a number keeps its unit.
+    return left_is_duration and not right_is_duration, lambda: _divide_half_up(
+        left_value() * MULTIPLIER_SCALE, right_value()
+    )
+
+
+def _add(left: tuple[bool, Evaluator], right: tuple[bool, Evaluator], sign: int) -> tuple[bool, Evaluator]:
+    (left_is_duration, left_value), (right_is_duration, right_value) = left, right
+    if left_is_duration != right_is_duration:
+        raise ExpressionError("cannot add a number to a duration")
+    if sign > 0:
+        return left_is_duration, lambda: left_value() + right_value()
+    return left_is_duration, lambda: left_value() - right_value()
+
+
+def _constant(value: int) -> Evaluator:
+    return lambda: value
+
+
+class _Parser:
+    """Recursive descent over the tokens, building closures as it goes."""
+
+    def __init__(self, text: str) -> None:
+        self._text = text
+        self._tokens = self._tokenize(text)
+        self._index = 0
+
+    def parse(self) -> tuple[bool, Evaluator]:
+        if not self._tokens:
+            raise ExpressionError("empty expression", 0)
+        result = self._sum()
+        if self._index < len(self._tokens):
+            _, _, position = self._tokens[self._index]
+            raise ExpressionError("unexpected token", position)
+        return result
+
+    @staticmethod
+    def _tokenize(text: str) -> list[tuple[str, object, int]]:
+        tokens: list[tuple[str, object, int]] = []
+        start = _SPACE.match(text).end()
+        while start < len(text):
+            match = _TOKEN.match(text, start)
+            if match is None:
+                raise ExpressionError(f"unexpected character {text[start]!r}", start)
+
+            if match.group("operator"):
+                operator = match.group("operator")
+                tokens.append(("operator", _OPERATOR_ALIASES.get(operator, operator), start))
+            elif match.group("clock"):
+                tokens.append(("literal", _clock_literal(match.group("clock"), start), start))
+            else:
+                tokens.append(("literal", _number_literal(match.group("number"), bool(match.group("hours")), start), start))
+            start = _SPACE.match(text, match.end()).end()
+        return tokens
+
+    def _peek(self) -> object | None:
+        if self._index < len(self._tokens):
+            kind, value, _ = self._tokens[self._index]
+            if kind == "operator":
+                return value
+        return None
+
+    def _sum(self) -> tuple[bool, Evaluator]:
+        result = self._product()
+        while (operator := self._peek()) in {"+", "-"}:
+            self._index += 1
+            result = _add(result, self._product(), 1 if operator == "+" else -1)
+        return result
+
+    def _product(self) -> tuple[bool, Evaluator]:
+        result = self._unary()
+        while (operator := self._peek()) in {"*", "/"}:
+            self._index += 1
+            right = self._unary()
+            result = _multiply(result, right) if operator == "*" else _divide(result, right)
+        return result
+
+    def _unary(self) -> tuple[bool, Evaluator]:
+        operator = self._peek()
+        if operator in {"+", "-"}:
+            self._index += 1
+            is_duration, value = self._unary()
+            return (is_duration, value) if operator == "+" else (is_duration, lambda: -value())
+        return self._primary()
+
+    def _primary(self) -> tuple[bool, Evaluator]:
+        if self._index >= len(self._tokens):
+            raise ExpressionError("unexpected end of expression", len(self._text))
+
+        kind, value, position = self._tokens[self._index]
+        self._index += 1
+        if kind == "literal":
+            is_duration, constant = value
+            return is_duration, _constant(constant)
+        if value == "(":
+            result = self._sum()
+            if self._peek() != ")":
+                raise ExpressionError("missing closing parenthesis", position)
+            self._index += 1
+            return result
+        raise ExpressionError("unexpected token", position)
+
+
+def _clock_literal(text: str, position: int) -> tuple[bool, int]:
+    seconds = parse_clock(text if text.count(":") == 2 else f"{text}:00")
+    if seconds is None or any(int(part) > 59 for part in text.split(":")[1:]):
+        raise ExpressionError(f"invalid time {text!r}", position)
+    return True, seconds
+
+
+def _number_literal(text: str, is_hours: bool, position: int) -> tuple[bool, int]:
+    if not is_hours and text.isascii() and text.isdigit() and 5 <= len(text) <= MAX_TIME_DIGITS:
+        return True, digits_to_seconds(text)
+
+    scaled = parse_fixed_multiplier(text)
+    if scaled is None:
+        raise ExpressionError(f"invalid number {text!r}", position)
+    if is_hours:
+        return True, apply_fixed_multiplier(3600, scaled)
+    return False, scaled
+
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def compile_expression(text: str) -> CompiledExpression:
+    """Parse and type-check ``text`` once; later calls with the same text reuse the result."""
+    is_duration, evaluate = _Parser(text).parse()
+    return CompiledExpression(text, is_duration, evaluate)
+
+
+def evaluate_expression(text: str) -> Quantity:
+    return compile_expression(text).evaluate()
+
+
+def evaluate_many(texts: Iterable[str]) -> list[Quantity | None]:
+    """``evaluate_expression`` over many texts; invalid ones give ``None``."""
+    results: list[Quantity | None] = []
+    for text in texts:
+        try:
+            results.append(compile_expression(text).evaluate())
+        except ExpressionError:
+            results.append(None)
+    return results
@@ -1,24 +1,24 @@
-﻿def time_to_seconds(time_str: str) -> int:
+﻿from fixed_point import FIXED_ONE, apply_fixed_multiplier, fixed_multiplier_from_float
+from time_codec import format_clock, parse_clock
+
+
+def time_to_seconds(time_str: str) -> int:
+    parsed = parse_clock(time_str)
+    if parsed is not None:
+        return parsed
+
     hours, minutes, seconds = map(int, time_str.split(":"))
     return hours * 3600 + minutes * 60 + seconds
 
 
 def seconds_to_time(seconds: int) -> str:
-    hours = seconds // 3600
-    minutes = (seconds % 3600) // 60
-    secs = seconds % 60
-    return f"{hours:02}:{minutes:02}:{secs:02}"
+    return format_clock(seconds)
 
 
 def seconds_to_float_hours(seconds: int) -> float:
     return round(seconds / 3600, 2)
 
 
-def _round_half_up_non_negative(value: float) -> int:
-    # Value is expected to be >= 0 in multiplier flow.
-    return int(value + 0.5)
-
-
 def multiply_time(time_str: str, days: int):
     seconds = time_to_seconds(time_str)
     total_seconds = seconds * days
@@ -40,20 +40,22 @@ def calculate_time_expression(
     if len(times) - 1 != len(operators):
         raise ValueError("operators length must match times length minus one")
 
-    if multipliers is None:
-        multipliers = [1.0] * len(operators)
-    elif len(multipliers) != len(operators):
+    if multipliers is not None and len(multipliers) != len(operators):
         raise ValueError("multipliers length must match operators length")
 
     total_seconds = time_to_seconds(times[0])
 
     for i in range(1, len(times)):
-        multiplier = multipliers[i - 1]
-        if multiplier < 0:
-            raise ValueError("multiplier must be greater than or equal to 0")
+        scaled = FIXED_ONE
+        if multipliers is not None:
+            multiplier = multipliers[i - 1]
+            if multiplier < 0:
+                raise ValueError("multiplier must be greater than or equal to 0")
+            # Multipliers are applied as exact four-decimal fixed-point values.
+            scaled = fixed_multiplier_from_float(multiplier)
 
         seconds = time_to_seconds(times[i])
-        effective_seconds = _round_half_up_non_negative(seconds * multiplier)
+        effective_seconds = apply_fixed_multiplier(seconds, scaled)
 
         if operators[i - 1] == "+":
             total_seconds += effective_seconds
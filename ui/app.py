@@ -1,22 +1,34 @@
 from __future__ import annotations
 
+import importlib
+
 import customtkinter as ctk
 
-from ui.sidebar import (
-    VIEW_TIME_CONVERTER,
-    VIEW_TIME_MULTIPLY,
-    VIEW_TIME_SUM,
-    Sidebar,
-)
-from ui.views.placeholder_view import PlaceholderView
-from ui.views.time_converter_view import TimeConverterView
-from ui.views.time_sum_view import TimeSumView
+from profiling import PROFILER
+from startup import StartupBudget
+from ui.registry import VIEW_REGISTRY, get_view_spec
+from ui.session import SessionStore, default_session_dir
+from ui.sidebar import VIEW_TIME_SUM, Sidebar
+from ui.timesheet import TimesheetModel
+from ui.utils.scheduler import CoalescingScheduler
+
+RECALC_MIN_INTERVAL_MS = 16
+VIEW_PRELOAD_DELAY_MS = 300
 
 
 class GodzinatorApp(ctk.CTk):
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        startup_budget: StartupBudget | None = None,
+        session: SessionStore | None = None,
+    ) -> None:
         super().__init__()
 
+        self._startup_budget = startup_budget
+        self._session = session if session is not None else SessionStore(default_session_dir())
+        self.timesheet_model: TimesheetModel = self._session.load()
+        self._mark_startup("restore session")
+
         self.title("Godzinator")
         self.geometry("1140x700")
         self.minsize(900, 560)
@@ -33,10 +45,20 @@ class GodzinatorApp(ctk.CTk):
         self.content.grid_columnconfigure(0, weight=1)
         self.content.grid_rowconfigure(0, weight=1)
 
+        self.recalc_scheduler = CoalescingScheduler(self, min_interval_ms=RECALC_MIN_INTERVAL_MS)
         self._view_cache: dict[str, ctk.CTkFrame] = {}
         self._current_view_id = ""
+        self._mark_startup("build window")
 
         self.show_view(VIEW_TIME_SUM)
+        self._mark_startup("build first view")
+
+        try:
+            self._session.attach(self.timesheet_model)
+        except OSError as error:
+            print(f"[Godzinator] Autozapis sesji wyłączony: {error}")
+
+        self.after(VIEW_PRELOAD_DELAY_MS, self._preload_view_modules)
 
     def show_view(self, view_id: str) -> None:
         if view_id == self._current_view_id:
@@ -57,22 +79,46 @@ class GodzinatorApp(ctk.CTk):
         if cached is not None:
             return cached
 
-        if view_id == VIEW_TIME_SUM:
-            view: ctk.CTkFrame = TimeSumView(self.content)
-        elif view_id == VIEW_TIME_CONVERTER:
-            view = TimeConverterView(self.content)
-        elif view_id == VIEW_TIME_MULTIPLY:
-            view = PlaceholderView(
-                self.content,
-                title="Mnożenie czasu",
-                description="Ten widok jest w przygotowaniu.",
-            )
-        else:
-            view = PlaceholderView(
-                self.content,
-                title="Nieznany widok",
-                description="Wybrany widok nie istnieje.",
-            )
+        spec = get_view_spec(view_id)
+        options = dict(spec.options)
+        if spec.uses_scheduler:
+            options["scheduler"] = self.recalc_scheduler
+        if spec.uses_timesheet:
+            options["model"] = self.timesheet_model
+
+        view: ctk.CTkFrame = spec.load()(self.content, **options)
 
         self._view_cache[view_id] = view
         return view
+
+    def _preload_view_modules(self) -> None:
+        # Runs after the first paint so that switching views later does not pay for imports.
+        for spec in VIEW_REGISTRY.values():
+            importlib.import_module(spec.module)
+
+    def shutdown(self) -> None:
+        """Stop background jobs and write the final session snapshot; call before ``destroy()``."""
+        time_sum_view = self._view_cache.get(VIEW_TIME_SUM)
+        if time_sum_view is not None:
+            time_sum_view.shutdown()
+        self._session.close()
+
+    def collect_profile_gauges(self) -> None:
+        PROFILER.set_gauge("widgets.total", self._count_widgets(self))
+        PROFILER.set_gauge("views.loaded", len(self._view_cache))
+        PROFILER.set_gauge("scheduler.scheduled", self.recalc_scheduler.scheduled_count)
+        PROFILER.set_gauge("scheduler.executed", self.recalc_scheduler.executed_count)
+        PROFILER.set_gauge("scheduler.skipped", self.recalc_scheduler.skipped_count)
+
+        time_sum_view = self._view_cache.get(VIEW_TIME_SUM)
+        if time_sum_view is not None:
+            PROFILER.set_gauge("time_sum.rows", time_sum_view.row_count)
+            PROFILER.set_gauge("time_sum.row_widgets", time_sum_view.row_pool_size)
+
+    @staticmethod
+    def _count_widgets(widget: ctk.CTkBaseClass) -> int:
+        return 1 + sum(GodzinatorApp._count_widgets(child) for child in widget.winfo_children())
+
+    def _mark_startup(self, phase: str) -> None:
+        if self._startup_budget is not None:
+            self._startup_budget.mark(phase)
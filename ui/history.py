@@ -0,0 +1,276 @@
+"""Undo/redo for ``TimesheetModel`` as an operation log.
+
+Each step stores only what the change touched: the removed rows with their
+old positions, the before/after field values of an edited row, or the
+containers a ``clear()`` dropped (handed back as-is, so undoing a clear of a
+million rows copies nothing). Undo and redo replay steps through the normal
+model API, so the total moves by per-row deltas and listeners see ordinary
+insert/remove/update events.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from ui.models import TimeRowState
+from ui.timesheet import (
+    EVENT_INSERT,
+    EVENT_REMOVE,
+    EVENT_RESET,
+    EVENT_UPDATE,
+    ROW_FIELDS,
+    ClearedRows,
+    ModelEvent,
+    RemovedRow,
+    RowValues,
+    TimesheetModel,
+    state_values,
+)
+
+HISTORY_LIMIT = 200
+# Consecutive edits of the same fields of one row within this window undo together.
+MERGE_WINDOW_SECONDS = 1.0
+
+
+# Rows are stored as private copies and reinserted as fresh copies, because the
+# model edits live states in place.
+@dataclass(frozen=True, slots=True)
+class _Inserted:
+    index: int
+    states: tuple[TimeRowState, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class _Removed:
+    rows: tuple[RemovedRow, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class _Updated:
+    row_id: str
+    before: RowValues
+    after: RowValues
+
+    @property
+    def fields(self) -> frozenset[str]:
+        return frozenset(name for name, old, new in zip(ROW_FIELDS, self.before, self.after) if old != new)
+
+
+@dataclass(slots=True)
+class _Cleared:
+    # Replaced on every redo: ``clear()`` hands out fresh containers each time.
+    cleared: ClearedRows
+    shadow: dict[str, RowValues]
+
+
+_Change = _Inserted | _Removed | _Updated | _Cleared
+
+
+class EditHistory:
+    """Records every change of ``model`` and replays it backwards or forwards.
+
+    ``undo()`` and ``redo()`` return the ids of rows whose fields changed in
+    place, so a view can refresh just those widgets. Changes made inside
+    ``with history.group():`` undo as one step.
+    """
+
+    def __init__(self, model: TimesheetModel, limit: int = HISTORY_LIMIT) -> None:
+        self._model = model
+        self._undo: deque[list[_Change]] = deque(maxlen=limit)
+        self._redo: deque[list[_Change]] = deque(maxlen=limit)
+        self._shadow: dict[str, RowValues] = {state.row_id: state_values(state) for state in model.materialized_states()}
+        self._group: list[_Change] | None = None
+        self._group_depth = 0
+        self._replaying = False
+        self._restoring_clear = False
+        self._last_edit_at = 0.0
+        self._listeners: list[Callable[[], None]] = []
+        self._unsubscribe = model.subscribe(self._on_model_change)
+
+    @property
+    def can_undo(self) -> bool:
+        return bool(self._undo)
+
+    @property
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    def subscribe(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """``listener`` is called whenever ``can_undo`` / ``can_redo`` may have changed."""
+        self._listeners.append(listener)
+
+        def unsubscribe() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return unsubscribe
+
+    def close(self) -> None:
+        self._unsubscribe()
+
+    def clear(self) -> None:
+        self._undo.clear()
+        self._redo.clear()
+        self._notify()
+
+    @contextmanager
+    def group(self) -> Iterator[None]:
+        if self._group_depth == 0:
+            self._group = []
+        self._group_depth += 1
+        try:
+            yield
+        finally:
+            self._group_depth -= 1
+            if self._group_depth == 0:
+                changes, self._group = self._group, None
+                if changes:
+                    self._push(changes)
+
+    def undo(self) -> set[str]:
+        if not self._undo or self._group_depth:
+            return set()
+        changes = self._undo.pop()
+        touched = self._replay(reversed(changes), forward=False)
+        self._redo.append(changes)
+        self._notify()
+        return touched
+
+    def redo(self) -> set[str]:
+        if not self._redo or self._group_depth:
+            return set()
+        changes = self._redo.pop()
+        touched = self._replay(changes, forward=True)
+        self._undo.append(changes)
+        self._notify()
+        return touched
+
+    def _replay(self, changes, forward: bool) -> set[str]:
+        model = self._model
+        touched: set[str] = set()
+        self._replaying = True
+        self._last_edit_at = 0.0
+        try:
+            for change in changes:
+                if isinstance(change, _Updated):
+                    values = change.after if forward else change.before
+                    fields = change.fields
+                    model.update_row(
+                        change.row_id,
+                        **{name: value for name, value in zip(ROW_FIELDS, values) if name in fields},
+                    )
+                    touched.add(change.row_id)
+                elif isinstance(change, _Inserted) == forward:
+                    self._restore(change)
+                else:
+                    self._drop(change)
+        finally:
+            self._replaying = False
+        return touched
+
+    def _restore(self, change: _Change) -> None:
+        """Put back what an insert added (redo) or a removal / clear dropped (undo)."""
+        model = self._model
+        if isinstance(change, _Inserted):
+            model.insert_rows([dataclasses.replace(state) for state in change.states], change.index)
+        elif isinstance(change, _Cleared):
+            self._restoring_clear = True
+            try:
+                model.restore_cleared(change.cleared)
+            finally:
+                self._restoring_clear = False
+            self._shadow = change.shadow
+        else:
+            # Ascending old positions: each row lands where it was once its predecessors are back.
+            run: list[TimeRowState] = []
+            run_start = 0
+            for row in change.rows:
+                if run and row.index != run_start + len(run):
+                    model.insert_rows(run, run_start)
+                    run = []
+                if not run:
+                    run_start = row.index
+                run.append(dataclasses.replace(row.state))
+            model.insert_rows(run, run_start)
+
+    def _drop(self, change: _Change) -> None:
+        """Take away what an insert added (undo) or drop again what was removed / cleared (redo)."""
+        model = self._model
+        if isinstance(change, _Inserted):
+            model.remove_rows(state.row_id for state in change.states)
+        elif isinstance(change, _Cleared):
+            change.shadow = self._shadow
+            change.cleared = model.clear()
+        else:
+            model.remove_rows(row.state.row_id for row in change.rows)
+
+    def _on_model_change(self, event: ModelEvent) -> None:
+        model = self._model
+        changes: list[_Change] = []
+
+        if event.kind == EVENT_INSERT:
+            if self._restoring_clear:
+                return
+            for row_id in event.row_ids:
+                self._shadow[row_id] = model.row_values(row_id)
+            if not self._replaying and event.row_ids:
+                states = tuple(dataclasses.replace(model.get(row_id)) for row_id in event.row_ids)
+                changes.append(_Inserted(event.index, states))
+        elif event.kind == EVENT_REMOVE:
+            for row_id in event.row_ids:
+                self._shadow.pop(row_id, None)
+            changes.append(_Removed(event.removed))
+        elif event.kind == EVENT_RESET:
+            # Rows brought back by undo need their last known values, not the source's.
+            shadow, self._shadow = self._shadow, {}
+            if event.cleared is not None and len(event.cleared):
+                changes.append(_Cleared(event.cleared, shadow))
+        elif event.kind == EVENT_UPDATE:
+            for row_id in event.row_ids:
+                state = model.get(row_id)
+                if state is None:
+                    continue
+                after = state_values(state)
+                before = self._shadow.get(row_id) or model.source_values(row_id) or after
+                self._shadow[row_id] = after
+                if before != after:
+                    changes.append(_Updated(row_id, before, after))
+
+        if not changes or self._replaying:
+            return
+        if self._group is not None:
+            self._group.extend(changes)
+        elif len(changes) > 1 or not self._merge(changes[0]):
+            self._push(changes)
+
+    def _merge(self, change: _Change) -> bool:
+        now = time.monotonic()
+        previous_edit_at, self._last_edit_at = self._last_edit_at, now
+        if not isinstance(change, _Updated) or not self._undo or now - previous_edit_at > MERGE_WINDOW_SECONDS:
+            return False
+
+        last = self._undo[-1]
+        if len(last) != 1 or not isinstance(last[0], _Updated):
+            return False
+        if last[0].row_id != change.row_id or last[0].fields != change.fields:
+            return False
+
+        last[0] = _Updated(change.row_id, last[0].before, change.after)
+        self._redo.clear()
+        return True
+
+    def _push(self, changes: list[_Change]) -> None:
+        if len(changes) > 1 or not isinstance(changes[0], _Updated):
+            self._last_edit_at = 0.0
+        self._undo.append(changes)
+        self._redo.clear()
+        self._notify()
+
+    def _notify(self) -> None:
+        for listener in list(self._listeners):
+            listener()
@@ -1,10 +1,9 @@
 ﻿from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-
-def _only_digits(value: str) -> str:
-    return "".join(character for character in value if character.isdigit())[:7]
+from fixed_point import parse_fixed_multiplier
+from time_codec import clean_digits
 
 
 @dataclass(slots=True)
@@ -15,10 +14,12 @@ class TimeRowState:
     multiplier: str = "1"
     is_active: bool = True
     description: str = ""
+    _parsed_multiplier: str | None = field(default=None, init=False, repr=False, compare=False)
+    _multiplier_fixed: int | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def digits(self) -> str:
-        return _only_digits(self.value)
+        return clean_digits(self.value)
 
     @property
     def is_started(self) -> bool:
@@ -27,3 +28,11 @@ class TimeRowState:
     @property
     def is_complete(self) -> bool:
         return 5 <= len(self.digits) <= 7
+
+    @property
+    def multiplier_fixed(self) -> int | None:
+        """The multiplier as a scaled integer, re-parsed only after the text changes."""
+        if self._parsed_multiplier is not self.multiplier:
+            self._multiplier_fixed = parse_fixed_multiplier(self.multiplier)
+            self._parsed_multiplier = self.multiplier
+        return self._multiplier_fixed
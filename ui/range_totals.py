@@ -0,0 +1,78 @@
+"""Subtotals of row ranges in model order.
+
+``RangeTotals`` keeps a Fenwick tree over the signed contribution of every
+row, in the order of ``TimesheetModel.row_ids``. An edit is one point update
+and a range query reads two prefix sums, both O(log N). Appending rows (the
+usual "add row" and paste at the end) extends the tree in place; any other
+insert or removal shifts positions, so the tree is rebuilt in O(N) on the
+next query instead.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+
+from ui.timesheet import EVENT_INSERT, EVENT_UPDATE, ModelEvent, TimesheetModel
+from ui.utils.fenwick import FenwickTree
+
+
+class RangeTotals:
+    """Range and selection subtotals of ``model``; indexes are 0-based model positions."""
+
+    def __init__(self, model: TimesheetModel) -> None:
+        self._model = model
+        self._tree: FenwickTree | None = None
+        self._positions: dict[str, int] = {}
+        self._unsubscribe: Callable[[], None] = model.subscribe(self._on_model_change)
+
+    def __len__(self) -> int:
+        return len(self._model)
+
+    def range_seconds(self, start: int, end: int) -> int:
+        """Signed total of rows ``start`` up to, but not including, ``end``."""
+        return self._ensure_tree().range_sum(start, end)
+
+    def selection_seconds(self, ranges: Iterable[tuple[int, int]]) -> int:
+        """Signed total of a selection given as ``(start, end)`` ranges; overlaps count once."""
+        tree = self._ensure_tree()
+        total = 0
+        covered_until = 0
+        for start, end in sorted(ranges):
+            start = max(start, covered_until)
+            if end > start:
+                total += tree.range_sum(start, end)
+                covered_until = end
+        return total
+
+    def position(self, row_id: str) -> int:
+        self._ensure_tree()
+        return self._positions[row_id]
+
+    def close(self) -> None:
+        self._unsubscribe()
+
+    def _ensure_tree(self) -> FenwickTree:
+        if self._tree is None:
+            model = self._model
+            row_ids = model.row_ids
+            self._positions = {row_id: index for index, row_id in enumerate(row_ids)}
+            self._tree = FenwickTree(model.contribution(row_id) for row_id in row_ids)
+        return self._tree
+
+    def _on_model_change(self, event: ModelEvent) -> None:
+        tree = self._tree
+        if tree is None:
+            return
+
+        if event.kind == EVENT_UPDATE:
+            for row_id in event.row_ids:
+                position = self._positions.get(row_id)
+                if position is not None:
+                    tree.set(position, self._model.contribution(row_id))
+        elif event.kind == EVENT_INSERT and event.index == len(tree):
+            for row_id in event.row_ids:
+                self._positions[row_id] = len(tree)
+                tree.append(self._model.contribution(row_id))
+        else:
+            self._tree = None
+            self._positions = {}
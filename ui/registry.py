@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import importlib
+from dataclasses import dataclass, field
+from typing import Any
+
+from ui.sidebar import VIEW_TIME_CONVERTER, VIEW_TIME_EXPRESSION, VIEW_TIME_SUM
+
+
+@dataclass(frozen=True, slots=True)
+class ViewSpec:
+    module: str
+    class_name: str
+    options: dict[str, Any] = field(default_factory=dict)
+    uses_scheduler: bool = False
+    uses_timesheet: bool = False
+
+    def load(self) -> type:
+        return getattr(importlib.import_module(self.module), self.class_name)
+
+
+VIEW_REGISTRY: dict[str, ViewSpec] = {
+    VIEW_TIME_SUM: ViewSpec("ui.views.time_sum_view", "TimeSumView", uses_scheduler=True, uses_timesheet=True),
+    VIEW_TIME_CONVERTER: ViewSpec("ui.views.time_converter_view", "TimeConverterView", uses_scheduler=True),
+    VIEW_TIME_EXPRESSION: ViewSpec("ui.views.time_expression_view", "TimeExpressionView", uses_scheduler=True),
+}
+
+UNKNOWN_VIEW = ViewSpec(
+    "ui.views.placeholder_view",
+    "PlaceholderView",
+    options={"title": "Nieznany widok", "description": "Wybrany widok nie istnieje."},
+)
+
+
+def get_view_spec(view_id: str) -> ViewSpec:
+    return VIEW_REGISTRY.get(view_id, UNKNOWN_VIEW)
@@ -0,0 +1,256 @@
+"""Indexed row search by description and effective duration.
+
+``RowFilter`` keeps two indexes over a ``TimesheetModel``:
+
+* descriptions, normalized with ``normalize_tag``, grouped by distinct text,
+  plus a trigram index from every three-character slice to the texts that
+  contain it. A query intersects the posting sets of its trigrams and only
+  verifies the surviving texts; queries shorter than a trigram scan the
+  distinct texts, never the rows.
+* a sorted list of ``(abs(contribution), row_id)`` for duration ranges,
+  answered with ``bisect``.
+
+Both are maintained from model events. ``set_filter`` reports the rows whose
+visibility flipped and an edit re-checks only its own row, so the filtered
+total moves by that difference and the view relayouts only its window.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from ui.timesheet import EVENT_INSERT, EVENT_REMOVE, EVENT_RESET, EVENT_UPDATE, ROW_FIELDS, ModelEvent, TimesheetModel
+from ui.utils.time_sum_helpers import normalize_tag
+
+GRAM_SIZE = 3
+
+_DESCRIPTION = ROW_FIELDS.index("description")
+
+
+def _grams(text: str) -> set[str]:
+    return {text[index : index + GRAM_SIZE] for index in range(len(text) - GRAM_SIZE + 1)}
+
+
+@dataclass(frozen=True, slots=True)
+class FilterChange:
+    shown: frozenset[str] = frozenset()
+    hidden: frozenset[str] = frozenset()
+
+    def __bool__(self) -> bool:
+        return bool(self.shown or self.hidden)
+
+
+class RowFilter:
+    """Search state over ``model``; without a query or bounds every row matches."""
+
+    def __init__(self, model: TimesheetModel) -> None:
+        self._model = model
+        self._row_texts: dict[str, str] = {}
+        self._rows_by_text: dict[str, set[str]] = {}
+        self._texts_by_gram: dict[str, set[str]] = {}
+        # Signed contributions as last seen; removed rows are already gone from the model.
+        self._row_contributions: dict[str, int] = {}
+        self._by_seconds: list[tuple[int, str]] = []
+
+        self._query = ""
+        self._min_seconds: int | None = None
+        self._max_seconds: int | None = None
+        self._matches: set[str] = set()
+        self._match_total = 0
+        self._positions: dict[str, int] | None = None
+        self._visible_ids: list[str] | None = None
+
+        for row_id in model.row_ids:
+            self._index(row_id)
+        self._by_seconds.sort()
+        self._matches = set(model.row_ids)
+        self._match_total = model.total_seconds
+        self._unsubscribe: Callable[[], None] = model.subscribe(self._on_model_change)
+
+    @property
+    def active(self) -> bool:
+        return bool(self._query) or self._min_seconds is not None or self._max_seconds is not None
+
+    @property
+    def match_count(self) -> int:
+        return len(self._matches)
+
+    @property
+    def total_seconds(self) -> int:
+        """Signed total of the matching rows."""
+        return self._match_total
+
+    def matches(self, row_id: str) -> bool:
+        return row_id in self._matches
+
+    def visible_ids(self) -> list[str]:
+        """Matching row ids in model order."""
+        if self._visible_ids is None:
+            if len(self._matches) == len(self._model):
+                self._visible_ids = list(self._model.row_ids)
+            else:
+                positions = self._row_positions()
+                self._visible_ids = sorted(self._matches, key=positions.__getitem__)
+        return self._visible_ids
+
+    def close(self) -> None:
+        self._unsubscribe()
+
+    def set_filter(
+        self,
+        query: str = "",
+        min_seconds: int | None = None,
+        max_seconds: int | None = None,
+    ) -> FilterChange:
+        """Apply a new search; returns the rows that appeared and disappeared."""
+        self._query = normalize_tag(query)
+        self._min_seconds = min_seconds
+        self._max_seconds = max_seconds
+
+        matches = self._text_matches()
+        if min_seconds is not None or max_seconds is not None:
+            in_range = self._range_matches()
+            matches = in_range if matches is None else matches & in_range
+        if matches is None:
+            matches = set(self._row_contributions)
+        return self._replace_matches(matches)
+
+    def _text_matches(self) -> set[str] | None:
+        query = self._query
+        if not query:
+            return None
+
+        if len(query) < GRAM_SIZE:
+            texts = [text for text in self._rows_by_text if query in text]
+        else:
+            postings = sorted((self._texts_by_gram.get(gram, set()) for gram in _grams(query)), key=len)
+            texts = [text for text in postings[0].intersection(*postings[1:]) if query in text]
+
+        matches: set[str] = set()
+        for text in texts:
+            matches |= self._rows_by_text[text]
+        return matches
+
+    def _range_matches(self) -> set[str]:
+        start = 0 if self._min_seconds is None else bisect_left(self._by_seconds, (self._min_seconds, ""))
+        if self._max_seconds is None:
+            end = len(self._by_seconds)
+        else:
+            end = bisect_left(self._by_seconds, (self._max_seconds + 1, ""))
+        return {row_id for _seconds, row_id in self._by_seconds[start:end]}
+
+    def _accepts(self, row_id: str) -> bool:
+        if self._query and self._query not in self._row_texts[row_id]:
+            return False
+        seconds = abs(self._row_contributions[row_id])
+        if self._min_seconds is not None and seconds < self._min_seconds:
+            return False
+        return self._max_seconds is None or seconds <= self._max_seconds
+
+    def _replace_matches(self, matches: set[str]) -> FilterChange:
+        contributions = self._row_contributions
+        shown = matches - self._matches
+        hidden = self._matches - matches
+        self._match_total += sum(contributions[row_id] for row_id in shown)
+        self._match_total -= sum(contributions[row_id] for row_id in hidden)
+        self._matches = matches
+        if shown or hidden:
+            self._visible_ids = None
+        return FilterChange(frozenset(shown), frozenset(hidden))
+
+    def _row_positions(self) -> dict[str, int]:
+        if self._positions is None:
+            self._positions = {row_id: index for index, row_id in enumerate(self._model.row_ids)}
+        return self._positions
+
+    def _on_model_change(self, event: ModelEvent) -> None:
+        if event.kind == EVENT_RESET:
+            self._row_texts.clear()
+            self._rows_by_text.clear()
+            self._texts_by_gram.clear()
+            self._row_contributions.clear()
+            self._by_seconds.clear()
+            self._matches.clear()
+            self._match_total = 0
+        elif event.kind == EVENT_INSERT:
+            for row_id in event.row_ids:
+                self._index(row_id, keep_sorted=True)
+                if self._accepts(row_id):
+                    self._matches.add(row_id)
+                    self._match_total += self._row_contributions[row_id]
+        elif event.kind == EVENT_REMOVE:
+            for row_id in event.row_ids:
+                if row_id in self._matches:
+                    self._matches.discard(row_id)
+                    self._match_total -= self._row_contributions[row_id]
+                self._unindex(row_id)
+        elif event.kind == EVENT_UPDATE:
+            # Edits keep the row order; only rows that flipped invalidate the visible list.
+            if any([self._reindex(row_id) for row_id in event.row_ids]):
+                self._visible_ids = None
+            return
+
+        self._positions = None
+        self._visible_ids = None
+
+    def _index(self, row_id: str, keep_sorted: bool = False) -> None:
+        text = normalize_tag(self._model.row_values(row_id)[_DESCRIPTION])
+        self._row_texts[row_id] = text
+        rows = self._rows_by_text.get(text)
+        if rows is None:
+            rows = self._rows_by_text[text] = set()
+            for gram in _grams(text):
+                self._texts_by_gram.setdefault(gram, set()).add(text)
+        rows.add(row_id)
+
+        contribution = self._model.contribution(row_id)
+        self._row_contributions[row_id] = contribution
+        if keep_sorted:
+            insort(self._by_seconds, (abs(contribution), row_id))
+        else:
+            self._by_seconds.append((abs(contribution), row_id))
+
+    def _unindex(self, row_id: str) -> None:
+        text = self._row_texts.pop(row_id)
+        rows = self._rows_by_text[text]
+        rows.discard(row_id)
+        if not rows:
+            del self._rows_by_text[text]
+            for gram in _grams(text):
+                texts = self._texts_by_gram[gram]
+                texts.discard(text)
+                if not texts:
+                    del self._texts_by_gram[gram]
+
+        contribution = self._row_contributions.pop(row_id)
+        del self._by_seconds[bisect_left(self._by_seconds, (abs(contribution), row_id))]
+
+    def _reindex(self, row_id: str) -> bool:
+        """Re-read one edited row; returns whether its visibility flipped."""
+        if row_id not in self._row_texts:
+            return False
+
+        was_matching = row_id in self._matches
+        if was_matching:
+            self._match_total -= self._row_contributions[row_id]
+
+        text = normalize_tag(self._model.row_values(row_id)[_DESCRIPTION])
+        contribution = self._model.contribution(row_id)
+        previous = self._row_contributions[row_id]
+        if text != self._row_texts[row_id]:
+            self._unindex(row_id)
+            self._index(row_id, keep_sorted=True)
+        elif contribution != previous:
+            del self._by_seconds[bisect_left(self._by_seconds, (abs(previous), row_id))]
+            insort(self._by_seconds, (abs(contribution), row_id))
+            self._row_contributions[row_id] = contribution
+
+        is_matching = self._accepts(row_id)
+        if is_matching:
+            self._matches.add(row_id)
+            self._match_total += contribution
+        else:
+            self._matches.discard(row_id)
+        return is_matching != was_matching
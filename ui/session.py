@@ -0,0 +1,309 @@
+"""Session autosave: a binary snapshot plus an append-only journal of row deltas.
+
+Every model event becomes one small JSON line (only the fields that changed
+for updates) handed to a writer thread, so typing never waits for the disk.
+Once the journal grows past ``COMPACT_AFTER_ENTRIES`` the writer folds it
+into a fresh ``.gdz`` snapshot (``ui.utils.binary_snapshot``). Both files
+carry a generation number: a journal whose generation does not match the
+snapshot is left over from an interrupted compaction and is ignored on
+restore. Restored rows stay in the mapped snapshot until they are first
+shown or edited.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import queue
+import threading
+from collections.abc import Callable
+
+from ui.models import TimeRowState
+from ui.timesheet import (
+    EVENT_INSERT,
+    EVENT_REMOVE,
+    EVENT_RESET,
+    EVENT_UPDATE,
+    ROW_FIELDS,
+    ModelEvent,
+    RowValues,
+    TimesheetModel,
+    state_values,
+)
+from ui.utils.binary_snapshot import BinarySnapshot, encode_snapshot
+
+SESSION_DIR_ENV = "GODZINATOR_SESSION_DIR"
+SNAPSHOT_FILE = "session.gdz"
+LEGACY_SNAPSHOT_FILE = "session.json"
+JOURNAL_FILE = "session.journal"
+COMPACT_AFTER_ENTRIES = 2_000
+
+
+def default_session_dir() -> str:
+    return os.environ.get(SESSION_DIR_ENV) or os.path.join(os.path.expanduser("~"), ".godzinator")
+
+
+def _encode_row(row_id: str, values: RowValues) -> list[object]:
+    return [row_id, *values]
+
+
+def _decode_row(record: list[object]) -> TimeRowState:
+    row_id, operator, value, multiplier, is_active, description = record
+    return TimeRowState(
+        row_id=str(row_id),
+        operator=str(operator),
+        value=str(value),
+        multiplier=str(multiplier),
+        is_active=bool(is_active),
+        description=str(description),
+    )
+
+
+def _dump_line(entry: dict[str, object]) -> str:
+    return json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+def _write_atomically(path: str, data: bytes) -> None:
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as handle:
+        handle.write(data)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(temporary, path)
+
+
+def _apply_entry(model: TimesheetModel, entry: dict) -> None:
+    event = entry["event"]
+    if event == EVENT_INSERT:
+        model.insert_rows([_decode_row(record) for record in entry["rows"]], int(entry["index"]))
+    elif event == EVENT_REMOVE:
+        model.remove_rows(entry["row_ids"])
+    elif event == EVENT_UPDATE:
+        if entry["row_id"] in model:
+            fields = {name: value for name, value in entry["fields"].items() if name in ROW_FIELDS}
+            model.update_row(entry["row_id"], **fields)
+    elif event == EVENT_RESET:
+        model.clear()
+
+
+class SessionStore:
+    """Persists one ``TimesheetModel`` under ``directory``.
+
+    ``load()`` builds the model, ``attach()`` starts journaling it and
+    ``close()`` writes the final snapshot. Only ``flush()`` and ``close()`` block.
+    """
+
+    def __init__(self, directory: str, compact_after: int = COMPACT_AFTER_ENTRIES) -> None:
+        self.directory = directory
+        self.compact_after = compact_after
+        self.snapshot_path = os.path.join(directory, SNAPSHOT_FILE)
+        self.legacy_snapshot_path = os.path.join(directory, LEGACY_SNAPSHOT_FILE)
+        self.journal_path = os.path.join(directory, JOURNAL_FILE)
+
+        self._generation = 0
+        self._journal_entries = 0
+        self._journal_clean = False
+        self._model: TimesheetModel | None = None
+        self._unsubscribe: Callable[[], None] | None = None
+        self._shadow: dict[str, RowValues] = {}
+        self._queue: queue.SimpleQueue[tuple[str, object]] = queue.SimpleQueue()
+        self._writer: threading.Thread | None = None
+
+    @property
+    def journal_entries(self) -> int:
+        return self._journal_entries
+
+    def load(self) -> TimesheetModel:
+        """Open the snapshot lazily and replay the matching journal on top of it."""
+        self._generation = 0
+        self._journal_entries = 0
+        self._journal_clean = False
+        model = self._load_snapshot()
+
+        try:
+            with open(self.journal_path, encoding="utf-8") as handle:
+                header = json.loads(handle.readline() or "{}")
+                if header.get("generation") == self._generation:
+                    self._journal_clean = True
+                    for line in handle:
+                        try:
+                            _apply_entry(model, json.loads(line))
+                        except (ValueError, KeyError, TypeError):
+                            # A torn last line from a crash mid-write ends the replay.
+                            self._journal_clean = False
+                            break
+                        self._journal_entries += 1
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as error:
+            print(f"[Godzinator] Nie udało się odczytać dziennika sesji: {error}")
+
+        return model
+
+    def _load_snapshot(self) -> TimesheetModel:
+        try:
+            if os.path.exists(self.snapshot_path):
+                snapshot = BinarySnapshot.open(self.snapshot_path)
+                self._generation = snapshot.generation
+                return TimesheetModel(source=snapshot)
+
+            # Sessions saved before the binary format.
+            with open(self.legacy_snapshot_path, encoding="utf-8") as handle:
+                legacy = json.load(handle)
+            self._generation = int(legacy.get("generation", 0))
+            return TimesheetModel(_decode_row(record) for record in legacy.get("rows", []))
+        except FileNotFoundError:
+            return TimesheetModel()
+        except (OSError, ValueError, TypeError) as error:
+            print(f"[Godzinator] Nie udało się odczytać sesji: {error}")
+            self._generation = 0
+            return TimesheetModel()
+
+    def attach(self, model: TimesheetModel) -> None:
+        """Start journaling ``model``; its current rows are taken as already saved."""
+        if self._model is not None:
+            raise RuntimeError("session store is already attached")
+
+        os.makedirs(self.directory, exist_ok=True)
+
+        self._model = model
+        self._shadow = {state.row_id: state_values(state) for state in model.materialized_states()}
+        self._unsubscribe = model.subscribe(self._on_model_change)
+        self._writer = threading.Thread(
+            target=self._write_loop,
+            args=(self._generation,),
+            name="godzinator-session",
+            daemon=True,
+        )
+        self._writer.start()
+
+        # Replayed, stale or torn journals are folded away before anything is appended.
+        if self._journal_entries or not self._journal_clean or not os.path.exists(self.snapshot_path):
+            self.compact()
+
+    def compact(self) -> None:
+        """Fold the journal into a new snapshot on the writer thread."""
+        model = self._model
+        if model is None:
+            return
+
+        self._generation += 1
+        self._journal_entries = 0
+        shadow = self._shadow
+        rows = [(row_id, *(shadow.get(row_id) or model.row_values(row_id))) for row_id in model.row_ids]
+        # The writer is about to replace the file the model may still have mapped.
+        model.detach_source()
+        self._queue.put(("compact", (self._generation, rows)))
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until everything queued so far is on disk."""
+        if self._writer is None:
+            return True
+        done = threading.Event()
+        self._queue.put(("flush", done))
+        return done.wait(timeout)
+
+    def close(self) -> None:
+        if self._model is None:
+            return
+
+        if self._journal_entries:
+            self.compact()
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+        self._queue.put(("stop", None))
+        if self._writer is not None:
+            self._writer.join()
+
+        self._model = None
+        self._unsubscribe = None
+        self._writer = None
+
+    def _on_model_change(self, event: ModelEvent) -> None:
+        model = self._model
+        if model is None:
+            return
+
+        entries: list[dict[str, object]] = []
+        if event.kind == EVENT_INSERT:
+            rows = []
+            for row_id in event.row_ids:
+                values = model.row_values(row_id)
+                self._shadow[row_id] = values
+                rows.append(_encode_row(row_id, values))
+            entries.append({"event": EVENT_INSERT, "index": event.index, "rows": rows})
+        elif event.kind == EVENT_REMOVE:
+            for row_id in event.row_ids:
+                self._shadow.pop(row_id, None)
+            entries.append({"event": EVENT_REMOVE, "row_ids": list(event.row_ids)})
+        elif event.kind == EVENT_UPDATE:
+            for row_id in event.row_ids:
+                state = model.get(row_id)
+                if state is None:
+                    continue
+                values = state_values(state)
+                # Rows still backed by the snapshot have no shadow yet, so every field is journaled.
+                previous = self._shadow.get(row_id) or (None,) * len(ROW_FIELDS)
+                changed = {name: value for name, value, old in zip(ROW_FIELDS, values, previous) if value != old}
+                if changed:
+                    self._shadow[row_id] = values
+                    entries.append({"event": EVENT_UPDATE, "row_id": row_id, "fields": changed})
+        elif event.kind == EVENT_RESET:
+            self._shadow.clear()
+            entries.append({"event": EVENT_RESET})
+
+        if not entries:
+            return
+
+        self._queue.put(("append", "".join(_dump_line(entry) for entry in entries)))
+        self._journal_entries += len(entries)
+        # Compaction copies every row, so it waits for at least as many entries.
+        if self._journal_entries >= max(self.compact_after, len(model)):
+            self.compact()
+
+    def _write_loop(self, generation: int) -> None:
+        journal = None
+        reset = not os.path.exists(self.journal_path)
+        try:
+            while True:
+                kind, payload = self._queue.get()
+                if kind == "stop":
+                    return
+                # One failed item must not stop the thread: later items would be dropped unseen.
+                try:
+                    if kind == "compact":
+                        new_generation, rows = payload
+                        if journal is not None:
+                            journal.flush()
+                        # The old journal stays valid until the snapshot replacing it is on disk.
+                        _write_atomically(self.snapshot_path, encode_snapshot(rows, new_generation))
+                        generation, reset = new_generation, True
+                        if journal is not None:
+                            journal.close()
+                            journal = None
+                        if os.path.exists(self.legacy_snapshot_path):
+                            os.remove(self.legacy_snapshot_path)
+
+                    if journal is None:
+                        journal = self._open_journal(generation, reset)
+                        reset = False
+
+                    if kind == "append":
+                        journal.write(payload)
+                        if self._queue.empty():
+                            journal.flush()
+                    elif kind == "flush":
+                        journal.flush()
+                except Exception as error:  # noqa: BLE001 - reported, the next item is tried again
+                    print(f"[Godzinator] Nie udało się zapisać sesji: {error}")
+                finally:
+                    if kind == "flush":
+                        payload.set()
+        finally:
+            if journal is not None:
+                journal.close()
+
+    def _open_journal(self, generation: int, reset: bool):
+        if reset:
+            _write_atomically(self.journal_path, _dump_line({"generation": generation}).encode("utf-8"))
+        return open(self.journal_path, "a", encoding="utf-8", newline="\n")
@@ -6,7 +6,7 @@ import customtkinter as ctk
 
 VIEW_TIME_SUM = "time_sum"
 VIEW_TIME_CONVERTER = "time_converter"
-VIEW_TIME_MULTIPLY = "time_multiply"
+VIEW_TIME_EXPRESSION = "time_expression"
 
 
 class Sidebar(ctk.CTkFrame):
@@ -29,7 +29,7 @@ class Sidebar(ctk.CTkFrame):
 
         self._create_nav_button(1, VIEW_TIME_SUM, "Sumowanie czasu")
         self._create_nav_button(2, VIEW_TIME_CONVERTER, "Konwerter czasu")
-        self._create_nav_button(3, VIEW_TIME_MULTIPLY, "Mnożenie czasu")
+        self._create_nav_button(3, VIEW_TIME_EXPRESSION, "Kalkulator czasu")
 
         self.set_active(initial_view)
 
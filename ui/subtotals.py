@@ -0,0 +1,117 @@
+"""Live subtotals per description tag.
+
+``TagSubtotals`` listens to a ``TimesheetModel`` and keeps a hash index from
+``normalize_tag(description)`` to a running subtotal. Every event moves only
+the rows it names: a row whose time changed adjusts its group by the
+contribution delta, a row whose description changed moves from one group to
+another. Nothing is rescanned after the initial build.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from ui.timesheet import EVENT_INSERT, EVENT_REMOVE, EVENT_RESET, EVENT_UPDATE, ROW_FIELDS, ModelEvent, TimesheetModel
+from ui.utils.time_sum_helpers import normalize_tag
+
+_DESCRIPTION = ROW_FIELDS.index("description")
+
+
+@dataclass(slots=True)
+class TagSubtotal:
+    tag: str
+    # Description as first typed, for display; ``tag`` is its normalized key.
+    label: str
+    total_seconds: int = 0
+    rows: int = 0
+
+
+class TagSubtotals:
+    """Hash-indexed subtotals of ``model`` grouped by normalized description."""
+
+    def __init__(self, model: TimesheetModel) -> None:
+        self._model = model
+        self._groups: dict[str, TagSubtotal] = {}
+        self._row_tags: dict[str, str] = {}
+        self._row_seconds: dict[str, int] = {}
+        self._version = 0
+
+        for row_id in model.row_ids:
+            self._add(row_id)
+        self._unsubscribe: Callable[[], None] = model.subscribe(self._on_model_change)
+
+    def __len__(self) -> int:
+        return len(self._groups)
+
+    @property
+    def version(self) -> int:
+        """Incremented whenever a subtotal may have changed."""
+        return self._version
+
+    def get(self, description: str) -> TagSubtotal | None:
+        return self._groups.get(normalize_tag(description))
+
+    def tag_of(self, row_id: str) -> str | None:
+        return self._row_tags.get(row_id)
+
+    def groups(self) -> list[TagSubtotal]:
+        """Groups by descending absolute subtotal, then by tag."""
+        return sorted(self._groups.values(), key=lambda group: (-abs(group.total_seconds), group.tag))
+
+    def close(self) -> None:
+        self._unsubscribe()
+
+    def _on_model_change(self, event: ModelEvent) -> None:
+        if event.kind == EVENT_INSERT:
+            for row_id in event.row_ids:
+                self._add(row_id)
+        elif event.kind == EVENT_REMOVE:
+            for row_id in event.row_ids:
+                self._discard(row_id)
+        elif event.kind == EVENT_UPDATE:
+            for row_id in event.row_ids:
+                self._update(row_id)
+        elif event.kind == EVENT_RESET:
+            self._groups.clear()
+            self._row_tags.clear()
+            self._row_seconds.clear()
+        self._version += 1
+
+    def _add(self, row_id: str) -> None:
+        description = self._model.row_values(row_id)[_DESCRIPTION]
+        tag = normalize_tag(description)
+        seconds = self._model.contribution(row_id)
+
+        group = self._groups.get(tag)
+        if group is None:
+            group = self._groups[tag] = TagSubtotal(tag, " ".join(description.split()))
+        group.total_seconds += seconds
+        group.rows += 1
+        self._row_tags[row_id] = tag
+        self._row_seconds[row_id] = seconds
+
+    def _discard(self, row_id: str) -> None:
+        tag = self._row_tags.pop(row_id, None)
+        if tag is None:
+            return
+
+        group = self._groups[tag]
+        group.total_seconds -= self._row_seconds.pop(row_id)
+        group.rows -= 1
+        if not group.rows:
+            del self._groups[tag]
+
+    def _update(self, row_id: str) -> None:
+        if row_id not in self._row_tags:
+            return
+
+        tag = normalize_tag(self._model.row_values(row_id)[_DESCRIPTION])
+        if tag != self._row_tags[row_id]:
+            self._discard(row_id)
+            self._add(row_id)
+            return
+
+        seconds = self._model.contribution(row_id)
+        self._groups[tag].total_seconds += seconds - self._row_seconds[row_id]
+        self._row_seconds[row_id] = seconds
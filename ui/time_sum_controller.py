@@ -0,0 +1,350 @@
+"""The time-sum screen without Tk.
+
+``TimeSumController`` owns what ``TimeSumView`` used to keep inline: the edit
+history, bulk actions applied as single undo steps, pasted and imported rows,
+the indexes built on first use (tag subtotals, row search, range totals) and
+the text of every summary the view shows. The view forwards input, starts the
+jobs described by ``JobRequest`` and draws what it gets back.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from time_utils import calculate_vacation_days, seconds_to_float_hours, time_to_seconds
+from ui.history import EditHistory
+from ui.models import TimeRowState
+from ui.range_totals import RangeTotals
+from ui.row_filter import RowFilter
+from ui.subtotals import TagSubtotals
+from ui.timesheet import ROW_FIELDS, RowBatch, TimesheetModel, new_row_id
+from ui.utils.background import JobContext
+from ui.utils.time_sum_helpers import format_signed_seconds, is_complete_hhmmss, normalize_tag
+from ui.utils.timesheet_csv import ImportIssue, ImportResult, parse_pasted_rows, read_timesheet, write_timesheet
+
+JOB_IMPORT = "import"
+JOB_EXPORT = "export"
+JOB_PASTE = "paste"
+
+# Pastes with more lines than this are parsed off the UI thread.
+PASTE_BACKGROUND_LINES = 2_000
+
+SUBTOTALS_SHOWN = 50
+NO_DESCRIPTION_LABEL = "(bez opisu)"
+
+OnRowsEdited = Callable[[set[str]], None]
+
+
+@dataclass(frozen=True, slots=True)
+class JobRequest:
+    """Work for ``BackgroundRunner``: ``work`` runs on a worker, never touching the model."""
+
+    key: str
+    label: str
+    work: Callable[[JobContext], Any]
+
+
+@dataclass(frozen=True, slots=True)
+class TotalsSummary:
+    clock: str
+    hours: str
+    days: str
+    norm_valid: bool
+
+
+def is_valid_daily_norm(value: str) -> bool:
+    if not is_complete_hhmmss(value):
+        return False
+
+    try:
+        return time_to_seconds(value) > 0
+    except ValueError:
+        return False
+
+
+def _parse_paste_job(text: str, context: JobContext) -> ImportResult:
+    result = ImportResult()
+    context.report(0, 1)
+    result.rows = parse_pasted_rows(text, result.issues) or []
+    return result
+
+
+class TimeSumController:
+    """Row actions and summaries over ``model``.
+
+    ``on_rows_edited`` gets the ids of rows changed in place by a bulk action,
+    undo or redo; inserts and removals reach the view as model events.
+    """
+
+    def __init__(self, model: TimesheetModel, on_rows_edited: OnRowsEdited | None = None) -> None:
+        self._model = model
+        self._history = EditHistory(model)
+        self._on_rows_edited = on_rows_edited
+        self._subtotals: TagSubtotals | None = None
+        self._subtotals_shown_key: tuple[int, str] | None = None
+        self._row_filter: RowFilter | None = None
+        self._range_totals: RangeTotals | None = None
+
+    @property
+    def model(self) -> TimesheetModel:
+        return self._model
+
+    @property
+    def history(self) -> EditHistory:
+        return self._history
+
+    # Rows and bulk actions
+
+    def add_row(self) -> TimeRowState:
+        return self._model.add_row()
+
+    def remove_row(self, row_id: str) -> bool:
+        """Remove a row; the sheet never stays empty."""
+        with self._history.group():
+            if not self._model.remove_row(row_id):
+                return False
+
+            if not len(self._model):
+                self._model.add_row()
+        return True
+
+    def clear_all(self) -> None:
+        with self._history.group():
+            self._model.clear()
+            self._model.add_row()
+
+    def import_rows(self, states: Iterable[TimeRowState]) -> int:
+        """Insert a whole batch with one event; an untouched placeholder row gives way."""
+        with self._history.group():
+            placeholder_id = self._untouched_placeholder_row_id()
+            inserted = self._model.insert_rows(states)
+            if not inserted:
+                return 0
+
+            if placeholder_id is not None:
+                self._model.remove_row(placeholder_id)
+        return len(inserted)
+
+    @contextmanager
+    def batch(self) -> Iterator[RowBatch]:
+        """Queue row changes and apply them as one undo step with one event per kind."""
+        with self._history.group():
+            with self._model.batch() as batch:
+                yield batch
+
+            if not len(self._model):
+                self._model.add_row()
+        self._rows_edited(set(batch.updated_ids))
+
+    def duplicate_rows(self, row_ids: Iterable[str]) -> int:
+        """Put a copy of every row right below it."""
+        with self.batch() as batch:
+            for row_id in row_ids:
+                state = self._model.get(row_id)
+                if state is not None:
+                    batch.insert(dataclasses.replace(state, row_id=new_row_id()), after=row_id)
+        return len(batch)
+
+    def deactivate_tag(self, description: str) -> int:
+        """Deactivate every active row whose description normalizes to the same tag."""
+        tag = normalize_tag(description)
+        if not tag:
+            return 0
+
+        with self.batch() as batch:
+            for row_id in self._model.row_ids:
+                _, _, _, is_active, row_description = self._model.row_values(row_id)
+                if is_active and normalize_tag(row_description) == tag:
+                    batch.update(row_id, is_active=False)
+        return len(batch)
+
+    def flip_operators(self, row_ids: Iterable[str] | None = None) -> int:
+        """Swap ``+`` and ``-`` on the given rows, or on every row."""
+        model = self._model
+        with self.batch() as batch:
+            for row_id in model.row_ids if row_ids is None else row_ids:
+                if row_id in model:
+                    batch.update(row_id, operator="-" if model.row_values(row_id)[0] == "+" else "+")
+        return len(batch)
+
+    def paste_rows(self, row_id: str, states: list[TimeRowState]) -> int:
+        """Put the first pasted row into ``row_id`` and insert the rest below it, as one step."""
+        if not states:
+            return 0
+
+        with self.batch() as batch:
+            rest = states
+            if row_id in self._model:
+                first, rest = states[0], states[1:]
+                batch.update(row_id, **{name: getattr(first, name) for name in ROW_FIELDS})
+            batch.insert_rows(rest, after=row_id if row_id in self._model else None)
+        return len(states)
+
+    def undo(self) -> None:
+        self._rows_edited(self._history.undo())
+
+    def redo(self) -> None:
+        self._rows_edited(self._history.redo())
+
+    def _rows_edited(self, row_ids: set[str]) -> None:
+        if row_ids and self._on_rows_edited is not None:
+            self._on_rows_edited(row_ids)
+
+    def _untouched_placeholder_row_id(self) -> str | None:
+        if len(self._model) != 1:
+            return None
+
+        state = self._model.state_at(0)
+        if state.is_started or state.description or state.multiplier != "1":
+            return None
+        return state.row_id
+
+    # Paste, import and export
+
+    @staticmethod
+    def parse_paste(text: str) -> ImportResult | JobRequest | None:
+        """Rows pasted into a time entry: parsed now, as a job for long texts, or None for one value."""
+        if text.count("\n") > PASTE_BACKGROUND_LINES:
+            return JobRequest(JOB_PASTE, "Wklejanie…", lambda context: _parse_paste_job(text, context))
+
+        issues: list[ImportIssue] = []
+        states = parse_pasted_rows(text, issues)
+        if states is None:
+            return None
+        return ImportResult(states, issues)
+
+    @staticmethod
+    def import_job(path: str) -> JobRequest:
+        return JobRequest(JOB_IMPORT, "Importowanie…", lambda context: read_timesheet(path, progress=context.report))
+
+    def export_job(self, path: str) -> JobRequest:
+        # The worker writes copies; the UI thread keeps editing the live rows.
+        snapshot = self._model.snapshot_states()
+        return JobRequest(
+            JOB_EXPORT,
+            "Eksportowanie…",
+            lambda context: write_timesheet(path, snapshot, progress=context.report),
+        )
+
+    # Search
+
+    @property
+    def filter_active(self) -> bool:
+        return self._row_filter is not None and self._row_filter.active
+
+    def set_filter(self, query: str, min_text: str = "", max_text: str = "") -> bool:
+        """Search by description and duration bounds (masked ``HH:MM:SS``); True if visible rows changed."""
+        bounds = [time_to_seconds(text) if is_complete_hhmmss(text) else None for text in (min_text, max_text)]
+        if self._row_filter is None:
+            if not query.strip() and bounds == [None, None]:
+                return False
+            # Built on first use, so sessions that never search stay lazily loaded.
+            self._row_filter = RowFilter(self._model)
+        return bool(self._row_filter.set_filter(query, *bounds))
+
+    def visible_row_count(self) -> int:
+        if self.filter_active:
+            return self._row_filter.match_count
+        return len(self._model)
+
+    def visible_state(self, index: int) -> TimeRowState:
+        if self.filter_active:
+            return self._model.get(self._row_filter.visible_ids()[index])
+        return self._model.state_at(index)
+
+    def visible_row_ids(self) -> list[str]:
+        if self.filter_active:
+            return list(self._row_filter.visible_ids())
+        return list(self._model.row_ids)
+
+    def filter_summary(self) -> str:
+        if not self.filter_active:
+            return ""
+
+        row_filter = self._row_filter
+        total_seconds = row_filter.total_seconds
+        return (
+            f"Pasujące: {row_filter.match_count} z {len(self._model)} · "
+            f"{format_signed_seconds(total_seconds)} ({seconds_to_float_hours(total_seconds):.2f} h)"
+        )
+
+    # Totals
+
+    def totals(self, daily_norm: str) -> TotalsSummary:
+        total_seconds = self._model.total_seconds
+        norm_valid = is_valid_daily_norm(daily_norm)
+        days_value = calculate_vacation_days(total_seconds, daily_norm) if norm_valid else 0.0
+
+        hours_value = seconds_to_float_hours(total_seconds)
+        if abs(hours_value) < 0.005:
+            hours_value = 0.0
+        return TotalsSummary(format_signed_seconds(total_seconds), f"{hours_value:.2f} h", f"{days_value:.2f}", norm_valid)
+
+    @property
+    def range_totals(self) -> RangeTotals:
+        """Range subtotals over the model order, built on first use."""
+        if self._range_totals is None:
+            self._range_totals = RangeTotals(self._model)
+        return self._range_totals
+
+    def range_seconds(self, first_row: int, last_row: int) -> int:
+        """Signed total of rows ``first_row``..``last_row``, numbered from 1 as shown to the user."""
+        return self.range_totals.range_seconds(max(first_row, 1) - 1, last_row)
+
+    def range_summary(self, first_row: int | None, last_row: int | None) -> str:
+        if first_row is None and last_row is None:
+            return ""
+
+        first_row = max(first_row or 1, 1)
+        last_row = min(len(self._model) if last_row is None else last_row, len(self._model))
+        if last_row < first_row:
+            return "Pusty zakres"
+
+        total_seconds = self.range_seconds(first_row, last_row)
+        return (
+            f"{first_row}–{last_row}: {format_signed_seconds(total_seconds)} "
+            f"({seconds_to_float_hours(total_seconds):.2f} h)"
+        )
+
+    @property
+    def subtotals_enabled(self) -> bool:
+        return self._subtotals is not None
+
+    def set_subtotals_enabled(self, enabled: bool) -> None:
+        """The tag index is built only while shown, so lazily loaded sessions stay lazy until then."""
+        if enabled and self._subtotals is None:
+            self._subtotals = TagSubtotals(self._model)
+            self._subtotals_shown_key = None
+        elif not enabled and self._subtotals is not None:
+            self._subtotals.close()
+            self._subtotals = None
+
+    def subtotal_lines(self, daily_norm: str) -> list[str] | None:
+        """Lines of the subtotals panel, or None when nothing changed since the last call."""
+        subtotals = self._subtotals
+        if subtotals is None:
+            return None
+
+        shown_key = (subtotals.version, daily_norm)
+        if shown_key == self._subtotals_shown_key:
+            return None
+        self._subtotals_shown_key = shown_key
+
+        norm_valid = is_valid_daily_norm(daily_norm)
+        groups = subtotals.groups()
+        lines = []
+        for group in groups[:SUBTOTALS_SHOWN]:
+            days_value = calculate_vacation_days(group.total_seconds, daily_norm) if norm_valid else 0.0
+            lines.append(
+                f"{(group.label or NO_DESCRIPTION_LABEL)[:24]:<24} "
+                f"{format_signed_seconds(group.total_seconds):>10} "
+                f"{seconds_to_float_hours(group.total_seconds):>8.2f} h "
+                f"{days_value:>6.2f} d"
+            )
+        if len(groups) > SUBTOTALS_SHOWN:
+            lines.append(f"… i {len(groups) - SUBTOTALS_SHOWN} innych")
+        return lines
@@ -0,0 +1,472 @@
+from __future__ import annotations
+
+import dataclasses
+import uuid
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Protocol
+
+from ui.models import TimeRowState
+from ui.utils.running_total import RunningTotal
+
+EVENT_INSERT = "insert"
+EVENT_REMOVE = "remove"
+EVENT_UPDATE = "update"
+EVENT_RESET = "reset"
+
+
+RowValues = tuple[str, str, str, bool, str]
+ROW_FIELDS = ("operator", "value", "multiplier", "is_active", "description")
+
+
+@dataclass(frozen=True, slots=True)
+class RemovedRow:
+    index: int
+    state: TimeRowState
+
+
+@dataclass(frozen=True, slots=True)
+class ClearedRows:
+    """Everything ``clear()`` dropped, kept as-is so ``restore_cleared()`` costs no copying."""
+
+    order: list[str]
+    states: dict[str, TimeRowState]
+    source_rows: dict[str, int]
+    source: LazyRowSource | None
+    contributions: dict[str, int]
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+
+@dataclass(frozen=True, slots=True)
+class ModelEvent:
+    """``removed`` (remove events, by ascending old index) and ``cleared`` (reset events)
+    describe what the change dropped, for listeners that can undo it. Insert events
+    carry the ``index`` of their first row."""
+
+    kind: str
+    row_ids: tuple[str, ...] = ()
+    removed: tuple[RemovedRow, ...] = ()
+    cleared: ClearedRows | None = None
+    index: int = 0
+
+
+ModelListener = Callable[[ModelEvent], None]
+
+
+def _check_row_fields(changes: dict[str, object]) -> None:
+    unknown = set(changes).difference(ROW_FIELDS)
+    if unknown:
+        raise ValueError(f"unknown row fields: {', '.join(sorted(unknown))}")
+
+
+class RowBatch:
+    """Changes queued inside ``TimesheetModel.batch()``; nothing is applied until it exits."""
+
+    def __init__(self) -> None:
+        # Pending rows keyed by the row they follow; ``None`` appends.
+        self._inserts: dict[str | None, list[TimeRowState]] = {}
+        self._inserted: dict[str, TimeRowState] = {}
+        self._removed: dict[str, None] = {}
+        self._updates: dict[str, dict[str, object]] = {}
+
+    def __len__(self) -> int:
+        return len(self._inserted) + len(self._removed) + len(self._updates)
+
+    @property
+    def updated_ids(self) -> tuple[str, ...]:
+        """Existing rows edited in place by this batch."""
+        return tuple(row_id for row_id in self._updates if row_id not in self._removed)
+
+    @property
+    def updates(self) -> dict[str, dict[str, object]]:
+        """Field changes per row in ``updated_ids``."""
+        return {row_id: dict(self._updates[row_id]) for row_id in self.updated_ids}
+
+    @property
+    def removed_ids(self) -> tuple[str, ...]:
+        return tuple(self._removed)
+
+    @property
+    def inserted_states(self) -> tuple[TimeRowState, ...]:
+        return tuple(self._inserted.values())
+
+    @property
+    def inserts(self) -> dict[str | None, tuple[TimeRowState, ...]]:
+        """Queued runs of new rows keyed by the row they follow; ``None`` appends."""
+        return {anchor: tuple(states) for anchor, states in self._inserts.items() if states}
+
+    def insert(self, state: TimeRowState | None = None, after: str | None = None) -> TimeRowState:
+        """Queue ``state`` right below row ``after`` (at the end without one)."""
+        if state is None:
+            state = TimeRowState(row_id=new_row_id())
+        self.insert_rows([state], after)
+        return state
+
+    def insert_rows(self, states: Iterable[TimeRowState], after: str | None = None) -> None:
+        """Queue ``states`` in order as one run below row ``after``."""
+        run = list(states)
+        for state in run:
+            if state.row_id in self._inserted:
+                raise ValueError(f"row {state.row_id!r} already queued")
+            self._inserted[state.row_id] = state
+
+        if after in self._inserted:
+            # Below a queued row: same anchor, next position.
+            anchor, position = self._find(self._inserted[after])
+            self._inserts[anchor][position + 1 : position + 1] = run
+        else:
+            self._inserts.setdefault(after, []).extend(run)
+
+    def remove(self, row_id: str) -> None:
+        state = self._inserted.pop(row_id, None)
+        if state is None:
+            self._removed[row_id] = None
+            return
+        anchor, position = self._find(state)
+        del self._inserts[anchor][position]
+
+    def update(self, row_id: str, **changes: object) -> None:
+        _check_row_fields(changes)
+        state = self._inserted.get(row_id)
+        if state is not None:
+            for field_name, value in changes.items():
+                setattr(state, field_name, value)
+            return
+        self._updates.setdefault(row_id, {}).update(changes)
+
+    def _find(self, state: TimeRowState) -> tuple[str | None, int]:
+        for anchor, pending in self._inserts.items():
+            for position, queued in enumerate(pending):
+                if queued is state:
+                    return anchor, position
+        raise KeyError(state.row_id)
+
+
+class LazyRowSource(Protocol):
+    """Rows that stay in a compact form until the model first needs them."""
+
+    def row_ids(self) -> list[str]: ...
+
+    def contributions(self) -> list[int]: ...
+
+    def values(self, index: int) -> RowValues: ...
+
+    def materialize(self, index: int, row_id: str) -> TimeRowState: ...
+
+    def detach(self) -> None: ...
+
+
+def new_row_id() -> str:
+    return uuid.uuid4().hex
+
+
+def state_values(state: TimeRowState) -> RowValues:
+    """The ``ROW_FIELDS`` of ``state`` as a tuple."""
+    return (state.operator, state.value, state.multiplier, state.is_active, state.description)
+
+
+class TimesheetModel:
+    """Ordered timesheet rows with a live total, independent of any UI toolkit.
+
+    Listeners are called synchronously after every change. The model is not
+    thread-safe: hand workers a ``snapshot_states()`` copy or their own model.
+
+    With a ``source`` the rows start out unmaterialized: ids and contributions
+    come from the source and a ``TimeRowState`` is created the first time a row
+    is read (``state_at``, ``get``, ``states()``...).
+    """
+
+    def __init__(self, states: Iterable[TimeRowState] = (), source: LazyRowSource | None = None) -> None:
+        self._states: dict[str, TimeRowState] = {}
+        self._order: list[str] = []
+        self._total = RunningTotal()
+        self._listeners: list[ModelListener] = []
+        self._version = 0
+        self._source: LazyRowSource | None = None
+        # Index in ``_source`` of every row that came from it, materialized or not.
+        self._source_rows: dict[str, int] = {}
+
+        if source is not None:
+            self._order = list(source.row_ids())
+            self._source_rows = dict(zip(self._order, range(len(self._order))))
+            if len(self._source_rows) != len(self._order):
+                raise ValueError("row ids must be unique")
+            self._total.load(dict(zip(self._order, source.contributions())))
+            self._source = source if self._source_rows else None
+
+        for state in states:
+            self._append(state)
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __contains__(self, row_id: object) -> bool:
+        return row_id in self._states or row_id in self._source_rows
+
+    @property
+    def total_seconds(self) -> int:
+        return self._total.total_seconds
+
+    @property
+    def version(self) -> int:
+        """Incremented on every change; background results compare against it."""
+        return self._version
+
+    @property
+    def row_ids(self) -> tuple[str, ...]:
+        return tuple(self._order)
+
+    @property
+    def materialized_count(self) -> int:
+        return len(self._states)
+
+    def get(self, row_id: str) -> TimeRowState | None:
+        return self._state(row_id)
+
+    def state_at(self, index: int) -> TimeRowState:
+        return self._state(self._order[index])
+
+    def index_of(self, row_id: str) -> int:
+        return self._order.index(row_id)
+
+    def states(self) -> list[TimeRowState]:
+        return [self._state(row_id) for row_id in self._order]
+
+    def materialized_states(self) -> list[TimeRowState]:
+        return list(self._states.values())
+
+    def row_values(self, row_id: str) -> RowValues:
+        """Field values of a row without materializing it."""
+        state = self._states.get(row_id)
+        if state is not None:
+            return state_values(state)
+        return self._source.values(self._source_rows[row_id])
+
+    def source_values(self, row_id: str) -> RowValues | None:
+        """Field values the row was loaded with, even after it was materialized and edited."""
+        index = self._source_rows.get(row_id)
+        return None if index is None else self._source.values(index)
+
+    def detach_source(self) -> None:
+        """Let a file-backed source drop its file, e.g. before it is overwritten."""
+        if self._source is not None:
+            self._source.detach()
+
+    def snapshot_states(self) -> list[TimeRowState]:
+        return [dataclasses.replace(state) for state in self.states()]
+
+    def contribution(self, row_id: str) -> int:
+        return self._total.contribution(row_id)
+
+    def subscribe(self, listener: ModelListener) -> Callable[[], None]:
+        self._listeners.append(listener)
+
+        def unsubscribe() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return unsubscribe
+
+    def add_row(self, state: TimeRowState | None = None, index: int | None = None) -> TimeRowState:
+        if state is None:
+            state = TimeRowState(row_id=new_row_id())
+        self.insert_rows([state], index)
+        return state
+
+    def insert_rows(self, states: Iterable[TimeRowState], index: int | None = None) -> list[TimeRowState]:
+        inserted = list(states)
+        new_ids = [state.row_id for state in inserted]
+        if len(set(new_ids)) != len(new_ids) or any(row_id in self for row_id in new_ids):
+            raise ValueError("row ids must be unique")
+
+        if not inserted:
+            return inserted
+
+        for state in inserted:
+            self._states[state.row_id] = state
+            self._total.update(state)
+
+        if index is None or index >= len(self._order):
+            index = len(self._order)
+            self._order.extend(new_ids)
+        else:
+            index = max(index, 0)
+            self._order[index:index] = new_ids
+
+        self._notify(ModelEvent(EVENT_INSERT, tuple(new_ids), index=index))
+        return inserted
+
+    @contextmanager
+    def batch(self) -> Iterator[RowBatch]:
+        """Queue inserts, removals and edits and apply them together on exit.
+
+        Listeners see at most one update event, one remove event and one insert
+        event per contiguous run of new rows, instead of one event per row. If
+        the block raises, nothing is applied.
+        """
+        batch = RowBatch()
+        yield batch
+        self._commit(batch)
+
+    def remove_row(self, row_id: str) -> bool:
+        return bool(self.remove_rows([row_id]))
+
+    def remove_rows(self, row_ids: Iterable[str]) -> list[str]:
+        removed = [row_id for row_id in dict.fromkeys(row_ids) if row_id in self]
+        if not removed:
+            return removed
+
+        if len(removed) == 1:
+            positions = [self._order.index(removed[0])]
+        else:
+            removed_set = set(removed)
+            positions = [index for index, row_id in enumerate(self._order) if row_id in removed_set]
+        # Copies, so widgets still bound to the old states cannot change what was removed.
+        removed_rows = tuple(
+            RemovedRow(index, dataclasses.replace(self._state(self._order[index]))) for index in positions
+        )
+
+        for row_id in removed:
+            self._states.pop(row_id, None)
+            self._source_rows.pop(row_id, None)
+            self._total.remove(row_id)
+        self._release_source()
+
+        if len(removed) == 1:
+            del self._order[positions[0]]
+        else:
+            self._order = [row_id for row_id in self._order if row_id not in removed_set]
+
+        self._notify(ModelEvent(EVENT_REMOVE, tuple(row.state.row_id for row in removed_rows), removed=removed_rows))
+        return removed
+
+    def clear(self) -> ClearedRows:
+        """Drop every row; the returned containers can be handed back to ``restore_cleared``."""
+        cleared = ClearedRows(self._order, self._states, self._source_rows, self._source, self._total.take())
+        self._order = []
+        self._states = {}
+        self._source_rows = {}
+        self._source = None
+        self._notify(ModelEvent(EVENT_RESET, cleared=cleared))
+        return cleared
+
+    def restore_cleared(self, cleared: ClearedRows) -> None:
+        """Undo ``clear()`` on an empty model, reusing the dropped containers."""
+        if self._order:
+            raise ValueError("model must be empty to restore cleared rows")
+
+        self._order = cleared.order
+        self._states = cleared.states
+        self._source_rows = cleared.source_rows
+        self._source = cleared.source
+        self._total.load(cleared.contributions)
+        self._notify(ModelEvent(EVENT_INSERT, tuple(self._order)))
+
+    def update_row(self, row_id: str, **changes: object) -> TimeRowState:
+        state = self._state(row_id)
+        if state is None:
+            raise KeyError(row_id)
+        for field_name, value in changes.items():
+            setattr(state, field_name, value)
+        self.row_changed(row_id)
+        return state
+
+    def row_changed(self, row_id: str) -> None:
+        """Re-read a row after its state was edited in place."""
+        state = self._state(row_id)
+        if state is None:
+            return
+
+        self._total.update(state)
+        self._notify(ModelEvent(EVENT_UPDATE, (row_id,)))
+
+    def recalculate(self) -> int:
+        return self._total.rebuild(self.states())
+
+    def apply_contributions(self, contributions: dict[str, int], version: int) -> bool:
+        """Adopt totals computed off-thread unless the model changed since ``version``."""
+        if version != self._version or len(contributions) != len(self._order) or contributions.keys() != set(self._order):
+            return False
+
+        self._total.load(contributions)
+        return True
+
+    def _state(self, row_id: str) -> TimeRowState | None:
+        state = self._states.get(row_id)
+        if state is None and row_id in self._source_rows:
+            state = self._source.materialize(self._source_rows[row_id], row_id)
+            self._states[row_id] = state
+        return state
+
+    def _commit(self, batch: RowBatch) -> None:
+        # Check everything before the first event, so a rejected batch changes nothing.
+        inserted = batch.inserted_states
+        removed_ids = batch.removed_ids
+        removed_set = set(removed_ids)
+        if any(state.row_id in self and state.row_id not in removed_set for state in inserted):
+            raise ValueError("row ids must be unique")
+        updates = batch.updates
+        for changes in updates.values():
+            _check_row_fields(changes)
+
+        updated = []
+        for row_id, changes in updates.items():
+            state = self._state(row_id)
+            if state is None:
+                continue
+            for field_name, value in changes.items():
+                setattr(state, field_name, value)
+            self._total.update(state)
+            updated.append(row_id)
+        if updated:
+            self._notify(ModelEvent(EVENT_UPDATE, tuple(updated)))
+
+        self.remove_rows(removed_ids)
+
+        if not inserted:
+            return
+
+        for state in inserted:
+            self._states[state.row_id] = state
+            self._total.update(state)
+
+        # One pass over the order; rows below a removed or unknown row go to the end.
+        pending = batch.inserts
+        order = []
+        for row_id in self._order:
+            order.append(row_id)
+            states = pending.pop(row_id, None)
+            if states:
+                order.extend(state.row_id for state in states)
+        for states in pending.values():
+            order.extend(state.row_id for state in states)
+        self._order = order
+
+        new_set = {state.row_id for state in inserted}
+        run_start = -1
+        for index, row_id in enumerate([*order, None]):
+            if row_id in new_set:
+                if run_start < 0:
+                    run_start = index
+            elif run_start >= 0:
+                self._notify(ModelEvent(EVENT_INSERT, tuple(order[run_start:index]), index=run_start))
+                run_start = -1
+
+    def _release_source(self) -> None:
+        if not self._source_rows:
+            self._source = None
+
+    def _append(self, state: TimeRowState) -> None:
+        if state.row_id in self:
+            raise ValueError(f"row {state.row_id!r} already exists")
+        self._states[state.row_id] = state
+        self._order.append(state.row_id)
+        self._total.update(state)
+
+    def _notify(self, event: ModelEvent) -> None:
+        self._version += 1
+        for listener in list(self._listeners):
+            listener(event)
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import queue
+import threading
+from collections.abc import Callable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from ui.utils.scheduler import SupportsAfter
+
+POLL_INTERVAL_MS = 50
+
+
+class JobCancelled(Exception):
+    """Raised inside a job when it notices that it was cancelled."""
+
+
+class JobContext:
+    """Handed to the worker function to report progress and check for cancellation."""
+
+    def __init__(self, job: Job) -> None:
+        self._job = job
+
+    @property
+    def cancelled(self) -> bool:
+        return self._job.cancel_event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        if self.cancelled:
+            raise JobCancelled()
+
+    def report(self, done: int, total: int) -> None:
+        self.raise_if_cancelled()
+        self._job.runner._events.put(("progress", self._job, (done, total)))
+
+
+@dataclass(eq=False)
+class Job:
+    runner: BackgroundRunner
+    key: str
+    version: int
+    on_done: Callable[[Any], None]
+    on_progress: Callable[[int, int], None] | None = None
+    on_error: Callable[[BaseException], None] | None = None
+    on_finished: Callable[[Job], None] | None = None
+    current_version: Callable[[], int] | None = None
+    cancel_event: threading.Event = field(default_factory=threading.Event)
+    finished: bool = False
+
+    def cancel(self) -> None:
+        self.cancel_event.set()
+
+
+class BackgroundRunner:
+    """Runs work off the Tk thread and delivers results back through ``after`` polling.
+
+    Every job carries a version. A result is dropped instead of applied when a
+    newer job with the same key was submitted meanwhile, or when
+    ``current_version()`` no longer matches the version the job started from.
+    """
+
+    def __init__(
+        self,
+        widget: SupportsAfter,
+        executor: Executor | None = None,
+        poll_interval_ms: int = POLL_INTERVAL_MS,
+    ) -> None:
+        self._widget = widget
+        self._executor = executor if executor is not None else ThreadPoolExecutor(
+            max_workers=2,
+            thread_name_prefix="godzinator-worker",
+        )
+        self._poll_interval_ms = poll_interval_ms
+        self._events: queue.SimpleQueue[tuple[str, Job, Any]] = queue.SimpleQueue()
+        self._latest: dict[str, Job] = {}
+        self._running: set[Job] = set()
+        self._poll_after_id: str | None = None
+
+        self.applied_count = 0
+        self.dropped_count = 0
+
+    @property
+    def is_busy(self) -> bool:
+        return bool(self._running)
+
+    def is_running(self, key: str) -> bool:
+        job = self._latest.get(key)
+        return job is not None and job in self._running
+
+    def submit(
+        self,
+        key: str,
+        work: Callable[[JobContext], Any],
+        on_done: Callable[[Any], None],
+        *,
+        version: int = 0,
+        current_version: Callable[[], int] | None = None,
+        on_progress: Callable[[int, int], None] | None = None,
+        on_error: Callable[[BaseException], None] | None = None,
+        on_finished: Callable[[Job], None] | None = None,
+    ) -> Job:
+        previous = self._latest.get(key)
+        if previous is not None:
+            previous.cancel()
+
+        job = Job(
+            runner=self,
+            key=key,
+            version=version,
+            on_done=on_done,
+            on_progress=on_progress,
+            on_error=on_error,
+            on_finished=on_finished,
+            current_version=current_version,
+        )
+        self._latest[key] = job
+        self._running.add(job)
+
+        context = JobContext(job)
+
+        def _run() -> None:
+            try:
+                result = work(context)
+            except JobCancelled:
+                self._events.put(("cancelled", job, None))
+            except BaseException as error:  # noqa: BLE001 - forwarded to the UI thread
+                self._events.put(("error", job, error))
+            else:
+                self._events.put(("done", job, result))
+
+        self._executor.submit(_run)
+        self._ensure_polling()
+        return job
+
+    def cancel(self, key: str) -> None:
+        job = self._latest.get(key)
+        if job is not None:
+            job.cancel()
+
+    def shutdown(self) -> None:
+        for job in self._running:
+            job.cancel()
+        if self._poll_after_id is not None:
+            self._widget.after_cancel(self._poll_after_id)
+            self._poll_after_id = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def poll(self) -> None:
+        """Deliver queued progress and results on the calling (UI) thread."""
+        self._poll_after_id = None
+
+        while True:
+            try:
+                kind, job, payload = self._events.get_nowait()
+            except queue.Empty:
+                break
+
+            if kind == "progress":
+                if job.on_progress is not None and not job.cancel_event.is_set():
+                    job.on_progress(*payload)
+                continue
+
+            self._finish(job, kind, payload)
+
+        self._ensure_polling()
+
+    def _finish(self, job: Job, kind: str, payload: Any) -> None:
+        self._running.discard(job)
+        job.finished = True
+        if self._latest.get(job.key) is job:
+            del self._latest[job.key]
+
+        if kind == "done" and self._is_current(job):
+            self.applied_count += 1
+            job.on_done(payload)
+        elif kind == "error" and not job.cancel_event.is_set():
+            self.dropped_count += 1
+            if job.on_error is not None:
+                job.on_error(payload)
+            else:
+                print(f"[Godzinator] Background job {job.key!r} failed: {payload}")
+        else:
+            self.dropped_count += 1
+
+        if job.on_finished is not None:
+            job.on_finished(job)
+
+    def _is_current(self, job: Job) -> bool:
+        if job.cancel_event.is_set():
+            return False
+        if job.current_version is not None and job.current_version() != job.version:
+            return False
+        return True
+
+    def _ensure_polling(self) -> None:
+        if self._running and self._poll_after_id is None:
+            self._poll_after_id = self._widget.after(self._poll_interval_ms, self.poll)
@@ -0,0 +1,344 @@
+"""Versioned binary timesheet snapshots (``.gdz``).
+
+Little-endian layout, every column 4- or 8-byte aligned::
+
+    header      magic "GDZS", u16 version, u16 reserved, u64 rows, u64 generation, 8 bytes padding
+    i64[rows]   fixed-point multipliers (``fixed_point``), -1 when the text is invalid,
+                -2 when it is valid but does not fit (read from the string table)
+    16B[rows]   row ids as raw UUID bytes (zero when stored in the string table)
+    i32[rows]   parsed seconds, -1 while the time is incomplete
+    u32[rows]   string refs: value, multiplier, row id, description (0 = derived / empty)
+    u8[rows]    flags: active, negative operator
+    strings     u32 count, u32 offsets[count + 1], UTF-8 blob; entry 0 is ""
+
+Values and multipliers are only written to the string table when their text
+differs from the canonical form of the parsed column, so a typical row is 45
+bytes. ``BinarySnapshot`` maps the file and answers ``row_ids()`` and
+``contributions()`` from the columns; ``TimeRowState`` objects are built one
+at a time by ``materialize()``.
+"""
+
+from __future__ import annotations
+
+import mmap
+import re
+import struct
+import sys
+from array import array
+from collections.abc import Iterable
+
+from fixed_point import apply_fixed_multiplier, format_fixed_multiplier, parse_fixed_multiplier
+from time_codec import clean_digits, digits_to_seconds, format_clock
+from ui.models import TimeRowState
+
+SNAPSHOT_MAGIC = b"GDZS"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_EXTENSION = ".gdz"
+
+FLAG_ACTIVE = 1
+FLAG_NEGATIVE = 2
+
+NO_SECONDS = -1
+NO_MULTIPLIER = -1
+WIDE_MULTIPLIER = -2
+_INT64_MAX = 2**63 - 1
+
+_HEADER = struct.Struct("<4sHHQQ8x")
+_ID_WIDTH = 16
+_UUID_HEX = re.compile(r"[0-9a-f]{32}")
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+SnapshotRow = tuple[str, str, str, str, bool, str]
+RowValues = tuple[str, str, str, bool, str]
+
+
+def _column_offsets(row_count: int) -> dict[str, int]:
+    offsets = {"multipliers": _HEADER.size}
+    offsets["ids"] = offsets["multipliers"] + 8 * row_count
+    offsets["seconds"] = offsets["ids"] + _ID_WIDTH * row_count
+    offsets["refs"] = offsets["seconds"] + 4 * row_count
+    offsets["flags"] = offsets["refs"] + 16 * row_count
+    offsets["strings"] = (offsets["flags"] + row_count + 3) & ~3
+    return offsets
+
+
+def _le_bytes(column: array) -> bytes:
+    if not _LITTLE_ENDIAN:
+        column = array(column.typecode, column)
+        column.byteswap()
+    return column.tobytes()
+
+
+def _cast(view: memoryview, start: int, count: int, typecode: str, width: int):
+    column = view[start : start + count * width].cast(typecode)
+    if _LITTLE_ENDIAN:
+        return column
+    swapped = array(typecode, column)
+    column.release()
+    swapped.byteswap()
+    return swapped
+
+
+def rows_from_states(states: Iterable[TimeRowState]) -> list[SnapshotRow]:
+    return [
+        (state.row_id, state.operator, state.value, state.multiplier, state.is_active, state.description)
+        for state in states
+    ]
+
+
+def encode_snapshot(rows: Iterable[SnapshotRow], generation: int = 0) -> bytes:
+    strings: dict[str, int] = {"": 0}
+
+    def _ref(text: str) -> int:
+        index = strings.get(text)
+        if index is None:
+            index = strings[text] = len(strings)
+        return index
+
+    # Sheets repeat a small set of times and multipliers; encode each text once.
+    value_columns: dict[str, tuple[int, int]] = {}
+    multiplier_columns: dict[str, tuple[int, int]] = {}
+
+    def _value_column(value: str) -> tuple[int, int]:
+        digits = clean_digits(value)
+        seconds = digits_to_seconds(digits) if 5 <= len(digits) <= 7 else NO_SECONDS
+        return seconds, 0 if seconds >= 0 and format_clock(seconds) == value else _ref(value)
+
+    def _multiplier_column(multiplier: str) -> tuple[int, int]:
+        scaled = parse_fixed_multiplier(multiplier)
+        if scaled is None:
+            return NO_MULTIPLIER, _ref(multiplier)
+        if scaled > _INT64_MAX:
+            return WIDE_MULTIPLIER, _ref(multiplier)
+        return scaled, 0 if format_fixed_multiplier(scaled) == multiplier else _ref(multiplier)
+
+    multipliers = array("q")
+    id_hex: list[str] = []
+    seconds_column = array("i")
+    refs = array("I")
+    flags = bytearray()
+    empty_id = "0" * (2 * _ID_WIDTH)
+
+    for row_id, operator, value, multiplier, is_active, description in rows:
+        seconds, value_ref = value_columns.get(value) or value_columns.setdefault(value, _value_column(value))
+        seconds_column.append(seconds)
+
+        scaled, multiplier_ref = multiplier_columns.get(multiplier) or multiplier_columns.setdefault(
+            multiplier, _multiplier_column(multiplier)
+        )
+        multipliers.append(scaled)
+
+        if len(row_id) == 32 and _UUID_HEX.fullmatch(row_id):
+            id_hex.append(row_id)
+            id_ref = 0
+        else:
+            id_hex.append(empty_id)
+            id_ref = _ref(row_id)
+
+        refs.extend((value_ref, multiplier_ref, id_ref, _ref(description) if description else 0))
+        flags.append((FLAG_ACTIVE if is_active else 0) | (FLAG_NEGATIVE if operator == "-" else 0))
+
+    row_count = len(seconds_column)
+    offsets = _column_offsets(row_count)
+    encoded = [text.encode("utf-8") for text in strings]
+    string_offsets = array("I", [0])
+    for text in encoded:
+        string_offsets.append(string_offsets[-1] + len(text))
+
+    parts = [
+        _HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, 0, row_count, generation),
+        _le_bytes(multipliers),
+        bytes.fromhex("".join(id_hex)),
+        _le_bytes(seconds_column),
+        _le_bytes(refs),
+        bytes(flags),
+        bytes(offsets["strings"] - offsets["flags"] - row_count),
+        struct.pack("<I", len(encoded)),
+        _le_bytes(string_offsets),
+        *encoded,
+    ]
+    return b"".join(parts)
+
+
+def write_snapshot(path: str, rows: Iterable[SnapshotRow], generation: int = 0) -> int:
+    payload = encode_snapshot(rows, generation)
+    with open(path, "wb") as handle:
+        handle.write(payload)
+    return len(payload)
+
+
+def is_snapshot_file(path: str) -> bool:
+    try:
+        with open(path, "rb") as handle:
+            return handle.read(len(SNAPSHOT_MAGIC)) == SNAPSHOT_MAGIC
+    except OSError:
+        return False
+
+
+class BinarySnapshot:
+    """Read-only view of a snapshot buffer; also the lazy row source of ``TimesheetModel``."""
+
+    def __init__(self, buffer: bytes | bytearray | mmap.mmap) -> None:
+        if len(buffer) < _HEADER.size:
+            raise ValueError("not a Godzinator snapshot")
+        magic, version, _reserved, row_count, generation = _HEADER.unpack_from(buffer)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError("not a Godzinator snapshot")
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(f"unsupported snapshot version {version}")
+
+        self.row_count = row_count
+        self.generation = generation
+        self._buffer = buffer
+        self._bind(buffer)
+
+    @classmethod
+    def open(cls, path: str) -> BinarySnapshot:
+        with open(path, "rb") as handle:
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return cls(mapped)
+        except ValueError:
+            mapped.close()
+            raise
+
+    def __len__(self) -> int:
+        return self.row_count
+
+    def _bind(self, buffer) -> None:
+        count = self.row_count
+        offsets = _column_offsets(count)
+        if len(buffer) < offsets["strings"] + 4:
+            raise ValueError("truncated Godzinator snapshot")
+        (string_count,) = struct.unpack_from("<I", buffer, offsets["strings"])
+        blob_offset = offsets["strings"] + 4 * (string_count + 2)
+        if len(buffer) < blob_offset:
+            raise ValueError("truncated Godzinator snapshot")
+        (blob_size,) = struct.unpack_from("<I", buffer, blob_offset - 4)
+        if len(buffer) < blob_offset + blob_size:
+            raise ValueError("truncated Godzinator snapshot")
+
+        view = memoryview(buffer)
+        self._view = view
+        self._multipliers = _cast(view, offsets["multipliers"], count, "q", 8)
+        self._seconds = _cast(view, offsets["seconds"], count, "i", 4)
+        self._refs = _cast(view, offsets["refs"], count * 4, "I", 4)
+        self._flags = view[offsets["flags"] : offsets["flags"] + count]
+        self._ids_offset = offsets["ids"]
+        self._string_offsets = _cast(view, offsets["strings"] + 4, string_count + 1, "I", 4)
+        self._blob_offset = blob_offset
+
+    def _release(self) -> None:
+        for column in (self._multipliers, self._seconds, self._refs, self._flags, self._string_offsets, self._view):
+            if isinstance(column, memoryview):
+                column.release()
+
+    def string(self, index: int) -> str:
+        start = self._blob_offset + self._string_offsets[index]
+        end = self._blob_offset + self._string_offsets[index + 1]
+        return str(self._view[start:end], "utf-8")
+
+    def row_ids(self) -> list[str]:
+        start = self._ids_offset
+        hexed = self._view[start : start + _ID_WIDTH * self.row_count].hex()
+        ids = [hexed[index : index + 32] for index in range(0, len(hexed), 32)]
+        for row, id_ref in enumerate(self._refs[2::4]):
+            if id_ref:
+                ids[row] = self.string(id_ref)
+        return ids
+
+    def contributions(self) -> list[int]:
+        """Signed effective seconds per row, computed from the numeric columns only."""
+        if self.row_count and WIDE_MULTIPLIER not in self._multipliers:
+            # Imported here, not with the module: session restore is on the startup path.
+            from time_batch import HAS_NUMPY
+
+            if HAS_NUMPY:
+                return self._contributions_numpy()
+
+        result = []
+        for row, (seconds, scaled, flags) in enumerate(zip(self._seconds, self._multipliers, self._flags)):
+            if scaled == WIDE_MULTIPLIER:
+                scaled = parse_fixed_multiplier(self.string(self._refs[4 * row + 1]))
+            if not flags & FLAG_ACTIVE or seconds < 0 or scaled < 0:
+                result.append(0)
+                continue
+            effective = apply_fixed_multiplier(seconds, scaled)
+            result.append(-effective if flags & FLAG_NEGATIVE else effective)
+        return result
+
+    def _contributions_numpy(self) -> list[int]:
+        from time_batch import np
+
+        seconds = np.asarray(self._seconds, dtype=np.int64)
+        scaled = np.asarray(self._multipliers, dtype=np.int64)
+        flags = np.asarray(self._flags, dtype=np.uint8)
+        valid = ((flags & FLAG_ACTIVE) != 0) & (seconds >= 0) & (scaled >= 0)
+        if int(scaled.max(initial=0)) * int(seconds.max(initial=0)) >= 2**62:
+            # Products could overflow int64; the scalar path stays exact.
+            return [
+                (-1 if flag & FLAG_NEGATIVE else 1) * apply_fixed_multiplier(int(second), int(scale)) if ok else 0
+                for second, scale, flag, ok in zip(seconds.tolist(), scaled.tolist(), flags.tolist(), valid.tolist())
+            ]
+
+        effective = apply_fixed_multiplier(np.where(valid, seconds, 0), np.where(valid, scaled, 0))
+        effective = np.where((flags & FLAG_NEGATIVE) != 0, -effective, effective)
+        return effective.tolist()
+
+    def total_seconds(self) -> int:
+        return sum(self.contributions())
+
+    def values(self, index: int) -> RowValues:
+        value_ref, multiplier_ref, _id_ref, description_ref = self._refs[4 * index : 4 * index + 4]
+        seconds = self._seconds[index]
+        flags = self._flags[index]
+
+        value = self.string(value_ref) if value_ref or seconds < 0 else format_clock(seconds)
+        if multiplier_ref or self._multipliers[index] < 0:
+            multiplier = self.string(multiplier_ref)
+        else:
+            multiplier = format_fixed_multiplier(self._multipliers[index])
+        return (
+            "-" if flags & FLAG_NEGATIVE else "+",
+            value,
+            multiplier,
+            bool(flags & FLAG_ACTIVE),
+            self.string(description_ref),
+        )
+
+    def materialize(self, index: int, row_id: str) -> TimeRowState:
+        operator, value, multiplier, is_active, description = self.values(index)
+        return TimeRowState(
+            row_id=row_id,
+            operator=operator,
+            value=value,
+            multiplier=multiplier,
+            is_active=is_active,
+            description=description,
+        )
+
+    def states(self) -> list[TimeRowState]:
+        return [self.materialize(index, row_id) for index, row_id in enumerate(self.row_ids())]
+
+    def detach(self) -> None:
+        """Copy the buffer into memory so the mapped file can be replaced or deleted."""
+        if not isinstance(self._buffer, mmap.mmap):
+            return
+        data = bytes(self._buffer)
+        self._release()
+        self._buffer.close()
+        self._buffer = data
+        self._bind(data)
+
+    def close(self) -> None:
+        self._release()
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+
+def read_snapshot_states(path: str) -> list[TimeRowState]:
+    snapshot = BinarySnapshot.open(path)
+    try:
+        return snapshot.states()
+    finally:
+        snapshot.close()
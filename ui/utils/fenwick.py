@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+
+class FenwickTree:
+    """Prefix sums over a list of integers with O(log N) point updates and range queries."""
+
+    def __init__(self, values: Iterable[int] = ()) -> None:
+        self._values = list(values)
+        # 1-based: ``_tree[i]`` holds the sum of ``_values[i - (i & -i) : i]``.
+        tree = [0, *self._values]
+        size = len(tree)
+        for index in range(1, size):
+            parent = index + (index & -index)
+            if parent < size:
+                tree[parent] += tree[index]
+        self._tree = tree
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    @property
+    def total(self) -> int:
+        return self.prefix_sum(len(self._values))
+
+    def value(self, index: int) -> int:
+        return self._values[index]
+
+    def add(self, index: int, delta: int) -> None:
+        self._values[index] += delta
+        position = index + 1
+        tree = self._tree
+        while position < len(tree):
+            tree[position] += delta
+            position += position & -position
+
+    def set(self, index: int, value: int) -> None:
+        delta = value - self._values[index]
+        if delta:
+            self.add(index, delta)
+
+    def append(self, value: int) -> None:
+        position = len(self._tree)
+        # The new node covers ``(position - lowbit, position]``: the value plus what precedes it in that span.
+        covered = self.prefix_sum(position - 1) - self.prefix_sum(position - (position & -position))
+        self._values.append(value)
+        self._tree.append(value + covered)
+
+    def prefix_sum(self, end: int) -> int:
+        """Sum of the first ``end`` values."""
+        total = 0
+        position = min(max(end, 0), len(self._values))
+        tree = self._tree
+        while position:
+            total += tree[position]
+            position &= position - 1
+        return total
+
+    def range_sum(self, start: int, end: int) -> int:
+        """Sum of ``values[start:end]``."""
+        if end <= start:
+            return 0
+        return self.prefix_sum(end) - self.prefix_sum(start)
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import math
+
+
+class RowViewport:
+    """Maps a pixel scroll offset onto the window of rows that is actually visible."""
+
+    def __init__(self, row_height: int) -> None:
+        if row_height <= 0:
+            raise ValueError("row_height must be greater than 0")
+
+        self.row_height = row_height
+        self.height = 0
+        self.offset = 0
+
+    def set_height(self, height: int, total_rows: int) -> None:
+        self.height = max(int(height), 0)
+        self.scroll_to(self.offset, total_rows)
+
+    def content_height(self, total_rows: int) -> int:
+        return total_rows * self.row_height
+
+    def max_offset(self, total_rows: int) -> int:
+        return max(self.content_height(total_rows) - self.height, 0)
+
+    def scroll_to(self, offset: float, total_rows: int) -> int:
+        self.offset = min(max(int(offset), 0), self.max_offset(total_rows))
+        return self.offset
+
+    def scroll_by(self, delta: float, total_rows: int) -> int:
+        return self.scroll_to(self.offset + delta, total_rows)
+
+    def ensure_visible(self, index: int, total_rows: int) -> int:
+        row_top = index * self.row_height
+        row_bottom = row_top + self.row_height
+
+        if row_top < self.offset:
+            return self.scroll_to(row_top, total_rows)
+        if row_bottom > self.offset + self.height:
+            return self.scroll_to(row_bottom - self.height, total_rows)
+        return self.offset
+
+    def pool_size(self) -> int:
+        return math.ceil(self.height / self.row_height) + 1
+
+    def visible_window(self, total_rows: int) -> tuple[int, int, int]:
+        """Return ``(first_index, end_index, pixel_shift)`` for the current offset."""
+        first_index, shift = divmod(self.offset, self.row_height)
+        end_index = min(first_index + self.pool_size(), total_rows)
+        return first_index, max(end_index, first_index), shift
+
+    def scrollbar_fractions(self, total_rows: int) -> tuple[float, float]:
+        content_height = self.content_height(total_rows)
+        if content_height <= self.height or content_height == 0:
+            return 0.0, 1.0
+
+        start = self.offset / content_height
+        end = min((self.offset + self.height) / content_height, 1.0)
+        return start, end
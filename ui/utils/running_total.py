@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from ui.models import TimeRowState
+from ui.utils.time_sum_helpers import row_signed_seconds
+
+
+class RunningTotal:
+    """Keeps the signed contribution of every row and applies only deltas."""
+
+    def __init__(self) -> None:
+        self._contributions: dict[str, int] = {}
+        self._total_seconds = 0
+
+    @property
+    def total_seconds(self) -> int:
+        return self._total_seconds
+
+    def __len__(self) -> int:
+        return len(self._contributions)
+
+    def contribution(self, row_id: str) -> int:
+        return self._contributions.get(row_id, 0)
+
+    def update(self, row: TimeRowState) -> int:
+        new_value = row_signed_seconds(row)
+        old_value = self._contributions.get(row.row_id, 0)
+        self._contributions[row.row_id] = new_value
+        self._total_seconds += new_value - old_value
+        return self._total_seconds
+
+    def remove(self, row_id: str) -> int:
+        self._total_seconds -= self._contributions.pop(row_id, 0)
+        return self._total_seconds
+
+    def clear(self) -> None:
+        self._contributions.clear()
+        self._total_seconds = 0
+
+    def take(self) -> dict[str, int]:
+        """Hand over the contributions without copying them and start empty."""
+        contributions = self._contributions
+        self._contributions = {}
+        self._total_seconds = 0
+        return contributions
+
+    def load(self, contributions: dict[str, int]) -> int:
+        """Adopt contributions computed elsewhere, e.g. by a background job."""
+        self._contributions = dict(contributions)
+        self._total_seconds = sum(self._contributions.values())
+        return self._total_seconds
+
+    def rebuild(self, rows: Iterable[TimeRowState]) -> int:
+        self.clear()
+        for row in rows:
+            self.update(row)
+        return self._total_seconds
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from typing import Protocol
+
+
+class SupportsAfter(Protocol):
+    def after(self, ms: int, func: Callable[[], None]) -> str: ...
+
+    def after_idle(self, func: Callable[[], None]) -> str: ...
+
+    def after_cancel(self, id: str) -> None: ...
+
+
+class CoalescingScheduler:
+    """Collects dirty work per key and runs it in one idle-time pass.
+
+    Scheduling a key that is already pending replaces its callback, so only the
+    latest request for that key runs and the earlier one is counted as skipped.
+    Keys scheduled by a callback during the pass run in the same pass, unless
+    that key already ran in it.
+    """
+
+    def __init__(
+        self,
+        widget: SupportsAfter,
+        min_interval_ms: int = 0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._widget = widget
+        self._clock = clock
+        self._pending: dict[str, Callable[[], None]] = {}
+        self._after_id: str | None = None
+        self._last_flush: float | None = None
+        self._flushing = False
+
+        self.min_interval_ms = max(int(min_interval_ms), 0)
+        self.scheduled_count = 0
+        self.executed_count = 0
+        self.skipped_count = 0
+
+    @property
+    def pending_keys(self) -> tuple[str, ...]:
+        return tuple(self._pending)
+
+    def schedule(self, key: str, callback: Callable[[], None]) -> None:
+        self.scheduled_count += 1
+        if key in self._pending:
+            self.skipped_count += 1
+
+        self._pending[key] = callback
+
+        if self._after_id is None and not self._flushing:
+            self._arm()
+
+    def cancel(self, key: str) -> None:
+        self._pending.pop(key, None)
+
+        if not self._pending and self._after_id is not None:
+            self._widget.after_cancel(self._after_id)
+            self._after_id = None
+
+    def flush(self) -> None:
+        if self._after_id is not None:
+            self._widget.after_cancel(self._after_id)
+        self._run_pending()
+
+    def reset_stats(self) -> None:
+        self.scheduled_count = 0
+        self.executed_count = 0
+        self.skipped_count = 0
+
+    def _arm(self) -> None:
+        delay_ms = 0
+        if self.min_interval_ms and self._last_flush is not None:
+            elapsed_ms = (self._clock() - self._last_flush) * 1000
+            delay_ms = max(int(self.min_interval_ms - elapsed_ms), 0)
+
+        if delay_ms > 0:
+            self._after_id = self._widget.after(delay_ms, self._run_pending)
+        else:
+            self._after_id = self._widget.after_idle(self._run_pending)
+
+    def _run_pending(self) -> None:
+        self._after_id = None
+        self._last_flush = self._clock()
+        self._flushing = True
+        ran: set[str] = set()
+        try:
+            # Row edits schedule the results refresh; drain it here instead of one interval later.
+            while ready := [key for key in self._pending if key not in ran]:
+                for key in ready:
+                    callback = self._pending.pop(key, None)
+                    if callback is None:
+                        continue
+                    ran.add(key)
+                    self.executed_count += 1
+                    try:
+                        callback()
+                    except Exception as error:  # noqa: BLE001 - the other keys still run
+                        print(f"[Godzinator] Scheduled callback {key!r} failed: {error!r}")
+        finally:
+            self._flushing = False
+            # A key that rescheduled itself waits for the next pass rather than spinning here.
+            if self._pending and self._after_id is None:
+                self._arm()
@@ -2,23 +2,17 @@
 
 from collections.abc import Iterable
 
-from time_utils import time_to_seconds
+from fixed_point import apply_fixed_multiplier, fixed_to_float, parse_fixed_multiplier
+from time_codec import clean_digits, digits_to_seconds, format_signed_clock, mask_digits
 from ui.models import TimeRowState
 
 
 def sanitize_digits(value: str) -> str:
-    return "".join(character for character in value if character.isdigit())[:7]
+    return clean_digits(value)
 
 
 def mask_hhmmss(value: str) -> str:
-    digits = sanitize_digits(value)
-    length = len(digits)
-
-    if length <= 3:
-        return digits
-    if length == 4:
-        return f"{digits[:2]}:{digits[2:]}"
-    return f"{digits[:-4]}:{digits[-4:-2]}:{digits[-2:]}"
+    return mask_digits(clean_digits(value))
 
 
 def is_complete_hhmmss(value: str) -> bool:
@@ -44,48 +38,29 @@ def normalize_multiplier(raw: str) -> str:
 
 
 def parse_multiplier(raw: str) -> float | None:
-    normalized = normalize_multiplier(raw)
-    if not normalized:
-        return None
-
-    if normalized.count(".") > 1:
+    scaled = parse_fixed_multiplier(raw)
+    if scaled is None:
         return None
-
-    if any(character not in "0123456789." for character in normalized):
-        return None
-
-    if normalized in {".", "+", "-", "+.", "-."}:
-        return None
-
-    try:
-        value = float(normalized)
-    except ValueError:
-        return None
-
-    if value < 0:
-        return None
-
-    return value
+    return fixed_to_float(scaled)
 
 
 def is_valid_multiplier(raw: str) -> bool:
-    return parse_multiplier(raw) is not None
+    return parse_fixed_multiplier(raw) is not None
 
 
 def format_signed_seconds(total_seconds: int) -> str:
-    sign = "-" if total_seconds < 0 else ""
-    absolute_seconds = abs(total_seconds)
-    hours = absolute_seconds // 3600
-    minutes = (absolute_seconds % 3600) // 60
-    seconds = absolute_seconds % 60
-    return f"{sign}{hours:02}:{minutes:02}:{seconds:02}"
+    return format_signed_clock(total_seconds)
 
 
 def digits_to_hhmmss(value: str) -> str:
     digits = sanitize_digits(value)
     if not 5 <= len(digits) <= 7:
         raise ValueError("Time value must contain from 5 to 7 digits")
-    return f"{digits[:-4]}:{digits[-4:-2]}:{digits[-2:]}"
+    return mask_digits(digits)
+
+
+def normalize_tag(description: str) -> str:
+    return " ".join(description.split()).casefold()
 
 
 def round_half_up_non_negative(value: float) -> int:
@@ -105,19 +80,48 @@ def build_expression_payload(rows: Iterable[TimeRowState]) -> tuple[list[str], l
         if not row.is_complete:
             continue
 
-        multiplier = parse_multiplier(row.multiplier)
+        multiplier = row.multiplier_fixed
         if multiplier is None:
             continue
 
         operator = row.operator if row.operator in {"+", "-"} else "+"
-        time_value = digits_to_hhmmss(row.digits)
+        digits = row.digits
 
-        times.append(time_value)
+        times.append(mask_digits(digits))
         operators.append(operator)
-        multipliers.append(multiplier)
+        multipliers.append(fixed_to_float(multiplier))
 
-        row_seconds = time_to_seconds(time_value)
-        effective_seconds = round_half_up_non_negative(row_seconds * multiplier)
+        effective_seconds = apply_fixed_multiplier(digits_to_seconds(digits), multiplier)
         total_seconds += effective_seconds if operator == "+" else -effective_seconds
 
     return times, operators, multipliers, total_seconds
+
+
+def compute_contributions(rows: Iterable[TimeRowState]) -> dict[str, int]:
+    return {row.row_id: row_signed_seconds(row) for row in rows}
+
+
+def signed_effective_seconds(operator: str, time_text: str, multiplier_text: str = "1") -> int | None:
+    """Signed row seconds with the ``build_expression_payload`` rules, or None if invalid."""
+    digits = clean_digits(time_text)
+    multiplier = parse_fixed_multiplier(multiplier_text)
+    if not 5 <= len(digits) <= 7 or multiplier is None:
+        return None
+
+    effective_seconds = apply_fixed_multiplier(digits_to_seconds(digits), multiplier)
+    return -effective_seconds if operator == "-" else effective_seconds
+
+
+def row_signed_seconds(row: TimeRowState) -> int:
+    if not row.is_active:
+        return 0
+
+    if not row.is_complete:
+        return 0
+
+    multiplier = row.multiplier_fixed
+    if multiplier is None:
+        return 0
+
+    effective_seconds = apply_fixed_multiplier(digits_to_seconds(row.digits), multiplier)
+    return -effective_seconds if row.operator == "-" else effective_seconds
@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import csv
+import os
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+
+from time_codec import format_clock, parse_clock, parse_time_input
+from ui.models import TimeRowState
+from ui.timesheet import new_row_id
+from ui.utils.time_sum_helpers import is_complete_hhmmss, is_valid_multiplier, mask_hhmmss
+
+COLUMN_OPERATOR = "operator"
+COLUMN_TIME = "time"
+COLUMN_MULTIPLIER = "multiplier"
+COLUMN_ACTIVE = "active"
+COLUMN_DESCRIPTION = "description"
+COLUMN_DATE = "date"
+
+DEFAULT_COLUMNS = (COLUMN_OPERATOR, COLUMN_TIME, COLUMN_MULTIPLIER, COLUMN_ACTIVE, COLUMN_DESCRIPTION)
+
+HEADER_ALIASES = {
+    "operator": COLUMN_OPERATOR,
+    "op": COLUMN_OPERATOR,
+    "znak": COLUMN_OPERATOR,
+    "time": COLUMN_TIME,
+    "czas": COLUMN_TIME,
+    "multiplier": COLUMN_MULTIPLIER,
+    "mnożnik": COLUMN_MULTIPLIER,
+    "mnoznik": COLUMN_MULTIPLIER,
+    "active": COLUMN_ACTIVE,
+    "aktywny": COLUMN_ACTIVE,
+    "description": COLUMN_DESCRIPTION,
+    "opis": COLUMN_DESCRIPTION,
+    "date": COLUMN_DATE,
+    "data": COLUMN_DATE,
+}
+
+PROGRESS_EVERY_ROWS = 2000
+
+ProgressCallback = Callable[[int, int], None]
+
+TRUE_VALUES = {"", "1", "true", "yes", "y", "tak", "t", "x", "+"}
+FALSE_VALUES = {"0", "false", "no", "n", "nie", "f", "-"}
+
+
+@dataclass(frozen=True, slots=True)
+class ImportIssue:
+    line_number: int
+    message: str
+
+
+@dataclass(slots=True)
+class ImportResult:
+    rows: list[TimeRowState] = field(default_factory=list)
+    issues: list[ImportIssue] = field(default_factory=list)
+
+
+def detect_delimiter(sample: str) -> str:
+    first_line = sample.splitlines()[0] if sample else ""
+    if "\t" in first_line:
+        return "\t"
+    if ";" in first_line:
+        return ";"
+    return ","
+
+
+def _header_columns(record: list[str]) -> list[str | None] | None:
+    columns = [HEADER_ALIASES.get(value.strip().lower()) for value in record]
+    if COLUMN_TIME not in columns:
+        return None
+    return columns
+
+
+def parse_active(raw: str) -> bool | None:
+    value = raw.strip().lower()
+    if value in TRUE_VALUES:
+        return True
+    if value in FALSE_VALUES:
+        return False
+    return None
+
+
+def _record_to_state(record: dict[str, str]) -> TimeRowState | str:
+    operator = record.get(COLUMN_OPERATOR, "").strip() or "+"
+    if operator not in {"+", "-"}:
+        return f"nieprawidłowy znak {operator!r}"
+
+    time_value = record.get(COLUMN_TIME, "").strip()
+    if not is_complete_hhmmss(time_value):
+        return f"nieprawidłowy czas {time_value!r}"
+
+    multiplier = record.get(COLUMN_MULTIPLIER, "").strip() or "1"
+    if not is_valid_multiplier(multiplier):
+        return f"nieprawidłowy mnożnik {multiplier!r}"
+
+    is_active = parse_active(record.get(COLUMN_ACTIVE, ""))
+    if is_active is None:
+        return f"nieprawidłowa aktywność {record.get(COLUMN_ACTIVE)!r}"
+
+    return TimeRowState(
+        row_id=new_row_id(),
+        operator=operator,
+        value=mask_hhmmss(time_value),
+        multiplier=multiplier,
+        is_active=is_active,
+        description=record.get(COLUMN_DESCRIPTION, "").strip(),
+    )
+
+
+def iter_timesheet_records(
+    lines: Iterable[str],
+    delimiter: str | None = None,
+) -> Iterator[tuple[int, dict[str, str]]]:
+    """Stream raw ``(line_number, {column: value})`` records without validating them.
+
+    An optional header row (English or Polish column names) selects the columns;
+    otherwise the order is operator, time, multiplier, active, description.
+    """
+    iterator = iter(lines)
+    first_line = next(iterator, None)
+    if first_line is None:
+        return
+
+    if delimiter is None:
+        delimiter = detect_delimiter(first_line)
+
+    def _all_lines() -> Iterator[str]:
+        yield first_line
+        yield from iterator
+
+    reader = csv.reader(_all_lines(), delimiter=delimiter)
+    columns: list[str | None] = list(DEFAULT_COLUMNS)
+
+    for record in reader:
+        if not record or all(not value.strip() for value in record):
+            continue
+
+        if reader.line_num == 1:
+            header = _header_columns(record)
+            if header is not None:
+                columns = header
+                continue
+
+        yield reader.line_num, {column: value for column, value in zip(columns, record) if column is not None}
+
+
+def iter_timesheet_rows(
+    lines: Iterable[str],
+    issues: list[ImportIssue] | None = None,
+    delimiter: str | None = None,
+) -> Iterator[TimeRowState]:
+    """Stream rows from CSV/TSV text, validating them like the time rows do.
+
+    Columns are resolved by ``iter_timesheet_records``.
+    Invalid lines are skipped and reported through ``issues``.
+    """
+    for line_number, record in iter_timesheet_records(lines, delimiter):
+        state = _record_to_state(record)
+        if isinstance(state, str):
+            if issues is not None:
+                issues.append(ImportIssue(line_number, state))
+            continue
+
+        yield state
+
+
+def _pasted_cells_to_state(cells: list[str]) -> TimeRowState | None:
+    # Strict clock cells first, so a date or an id next to the duration is not read as digits.
+    for parse in (parse_clock, parse_time_input):
+        for position, cell in enumerate(cells):
+            seconds = parse(cell.lstrip("+-").strip())
+            if seconds is None:
+                continue
+
+            description = " ".join(other for index, other in enumerate(cells) if index != position and other)
+            return TimeRowState(
+                row_id=new_row_id(),
+                operator="-" if cell.startswith("-") else "+",
+                value=format_clock(seconds),
+                description=description,
+            )
+    return None
+
+
+def parse_pasted_rows(text: str, issues: list[ImportIssue] | None = None) -> list[TimeRowState] | None:
+    """Rows from clipboard text, or ``None`` when it is a single value for one entry.
+
+    Text copied from a spreadsheet is one row per line with tab-separated
+    cells. A first line with known column names is read like a TSV file;
+    otherwise the first cell that parses as a time (``parse_clock``, then
+    ``parse_time_input`` rules; a leading sign picks the operator) is the
+    duration and the remaining cells become the description.
+    """
+    lines = text.splitlines()
+    if "\t" not in text and sum(1 for line in lines if line.strip()) < 2:
+        return None
+
+    if lines and _header_columns(lines[0].split("\t")) is not None:
+        return list(iter_timesheet_rows(lines, issues, delimiter="\t"))
+
+    rows = []
+    for line_number, line in enumerate(lines, start=1):
+        cells = [cell.strip() for cell in line.split("\t")]
+        if not any(cells):
+            continue
+
+        state = _pasted_cells_to_state(cells)
+        if state is None:
+            if issues is not None:
+                issues.append(ImportIssue(line_number, f"brak czasu w {line.strip()!r}"))
+            continue
+        rows.append(state)
+    return rows
+
+
+def _track_progress(lines: Iterable[str], total: int, progress: ProgressCallback) -> Iterator[str]:
+    consumed = 0
+    for index, line in enumerate(lines, start=1):
+        consumed += len(line)
+        if index % PROGRESS_EVERY_ROWS == 0:
+            progress(min(consumed, total), total)
+        yield line
+    progress(total, total)
+
+
+def read_timesheet(path: str, progress: ProgressCallback | None = None) -> ImportResult:
+    result = ImportResult()
+    with open(path, encoding="utf-8-sig", newline="") as handle:
+        lines: Iterable[str] = handle
+        if progress is not None:
+            lines = _track_progress(handle, os.path.getsize(path), progress)
+        result.rows.extend(iter_timesheet_rows(lines, result.issues))
+    return result
+
+
+def write_timesheet(path: str, rows: Iterable[TimeRowState], progress: ProgressCallback | None = None) -> int:
+    """Write rows with a header; ``.tsv`` files are tab separated, everything else CSV."""
+    states = rows if isinstance(rows, list) else list(rows)
+    delimiter = "\t" if path.lower().endswith(".tsv") else ","
+
+    with open(path, "w", encoding="utf-8", newline="") as handle:
+        writer = csv.writer(handle, delimiter=delimiter)
+        writer.writerow(DEFAULT_COLUMNS)
+        for index, state in enumerate(states, start=1):
+            writer.writerow(
+                [state.operator, state.value, state.multiplier, "1" if state.is_active else "0", state.description]
+            )
+            if progress is not None and index % PROGRESS_EVERY_ROWS == 0:
+                progress(index, len(states))
+
+    if progress is not None:
+        progress(len(states), len(states))
+    return len(states)
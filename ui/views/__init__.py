@@ -1,6 +1,21 @@
 """Views package for Godzinator."""
 
-from ui.views.time_converter_view import TimeConverterView
-from ui.views.time_sum_view import TimeSumView
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+_LAZY_EXPORTS = {
+    "TimeConverterView": "ui.views.time_converter_view",
+    "TimeSumView": "ui.views.time_sum_view",
+}
 
 __all__ = ["TimeConverterView", "TimeSumView"]
+
+
+def __getattr__(name: str) -> Any:
+    # Views are imported on first use so that loading one view does not pull in the others.
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name), name)
@@ -4,6 +4,7 @@ from collections.abc import Iterable
 
 import customtkinter as ctk
 
+from profiling import profiled
 from time_utils import seconds_to_time
 from ui.utils.time_converter_helpers import (
     format_float_compact,
@@ -12,13 +13,15 @@ from ui.utils.time_converter_helpers import (
     round_half_up_non_negative,
     sanitize_decimal_input,
 )
+from ui.utils.scheduler import CoalescingScheduler
 from ui.utils.time_sum_helpers import mask_hhmmss
 
 
 class TimeConverterView(ctk.CTkFrame):
-    def __init__(self, master: ctk.CTkBaseClass) -> None:
+    def __init__(self, master: ctk.CTkBaseClass, scheduler: CoalescingScheduler | None = None) -> None:
         super().__init__(master, fg_color="transparent")
 
+        self._scheduler = scheduler if scheduler is not None else CoalescingScheduler(self)
         self._is_updating = False
 
         self._seconds_var = ctk.StringVar(value="")
@@ -113,8 +116,12 @@ class TimeConverterView(ctk.CTkFrame):
             font=ctk.CTkFont(family="Segoe UI", size=15),
         )
         entry.grid(row=row, column=1, sticky="ew", padx=(0, 28), pady=8)
-        entry.bind("<KeyRelease>", handler)
-        entry.bind("<FocusOut>", handler)
+
+        def _schedule_handler(_: object | None = None) -> None:
+            self._scheduler.schedule(f"converter:{key}", handler)
+
+        entry.bind("<KeyRelease>", _schedule_handler)
+        entry.bind("<FocusOut>", _schedule_handler)
 
         border_color = entry.cget("border_color")
         border_width = entry.cget("border_width")
@@ -203,15 +210,19 @@ class TimeConverterView(ctk.CTkFrame):
         if had_invalid_chars:
             self._set_entry_invalid(key, True)
 
+    @profiled("converter.seconds")
     def _on_seconds_change(self, _: object | None = None) -> None:
         self._handle_numeric_input("seconds", self._seconds_var, 1)
 
+    @profiled("converter.minutes")
     def _on_minutes_change(self, _: object | None = None) -> None:
         self._handle_numeric_input("minutes", self._minutes_var, 60)
 
+    @profiled("converter.hours")
     def _on_hours_change(self, _: object | None = None) -> None:
         self._handle_numeric_input("hours", self._hours_var, 3600)
 
+    @profiled("converter.clock")
     def _on_clock_change(self, _: object | None = None) -> None:
         if self._is_updating:
             return
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import customtkinter as ctk
+
+from profiling import profiled
+from time_expression import ExpressionError, Quantity, compile_expression, evaluate_many
+from time_utils import seconds_to_float_hours
+from ui.utils.scheduler import CoalescingScheduler
+from ui.utils.time_sum_helpers import format_signed_seconds
+
+INVALID_LINE_LABEL = "błąd"
+
+
+class TimeExpressionView(ctk.CTkFrame):
+    def __init__(self, master: ctk.CTkBaseClass, scheduler: CoalescingScheduler | None = None) -> None:
+        super().__init__(master, fg_color="transparent")
+
+        self._scheduler = scheduler if scheduler is not None else CoalescingScheduler(self)
+
+        self._expression_var = ctk.StringVar(value="")
+        self._clock_result_var = ctk.StringVar(value="")
+        self._hours_result_var = ctk.StringVar(value="")
+        self._error_var = ctk.StringVar(value="")
+        self._lines_total_var = ctk.StringVar(value="")
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+
+        self._build_ui()
+
+    def _build_ui(self) -> None:
+        card = ctk.CTkFrame(self, corner_radius=18)
+        card.grid(row=0, column=0, sticky="nsew", padx=20, pady=20)
+        card.grid_columnconfigure(0, weight=1)
+        card.grid_columnconfigure(1, weight=1)
+        card.grid_rowconfigure(6, weight=1)
+
+        heading = ctk.CTkLabel(
+            card,
+            text="Kalkulator czasu",
+            font=ctk.CTkFont(family="Segoe UI", size=34, weight="bold"),
+        )
+        heading.grid(row=0, column=0, columnspan=2, sticky="w", padx=28, pady=(24, 8))
+
+        description = ctk.CTkLabel(
+            card,
+            text=(
+                "Nawiasy, +, -, * i /. Czas jako 08:00:00, 8:00, 083000 lub 7,5h; "
+                "liczby jako mnożniki, np. (08:00:00 - 00:30:00) * 5."
+            ),
+            font=ctk.CTkFont(family="Segoe UI", size=15),
+            text_color=("#475569", "#94a3b8"),
+            justify="left",
+        )
+        description.grid(row=1, column=0, columnspan=2, sticky="w", padx=28, pady=(0, 20))
+        card.bind(
+            "<Configure>",
+            lambda event: description.configure(wraplength=max(event.width - 56, 260)),
+            add="+",
+        )
+
+        self._expression_entry = ctk.CTkEntry(
+            card,
+            textvariable=self._expression_var,
+            height=42,
+            placeholder_text="(08:00:00 - 00:30:00) * 5",
+            font=ctk.CTkFont(family="Consolas", size=16),
+        )
+        self._expression_entry.grid(row=2, column=0, columnspan=2, sticky="ew", padx=28, pady=(0, 8))
+        self._expression_entry.bind("<KeyRelease>", self._on_expression_change)
+        self._expression_entry.bind("<FocusOut>", self._on_expression_change)
+        self._default_border = (
+            self._expression_entry.cget("border_color"),
+            self._expression_entry.cget("border_width"),
+        )
+
+        result_frame = ctk.CTkFrame(card, fg_color="transparent")
+        result_frame.grid(row=3, column=0, columnspan=2, sticky="ew", padx=28, pady=(0, 4))
+        result_frame.grid_columnconfigure(1, weight=1)
+
+        clock_label = ctk.CTkLabel(
+            result_frame,
+            textvariable=self._clock_result_var,
+            font=ctk.CTkFont(family="Segoe UI", size=30, weight="bold"),
+        )
+        clock_label.grid(row=0, column=0, sticky="w", padx=(0, 16))
+
+        hours_label = ctk.CTkLabel(
+            result_frame,
+            textvariable=self._hours_result_var,
+            font=ctk.CTkFont(family="Segoe UI", size=18),
+            text_color=("#475569", "#94a3b8"),
+        )
+        hours_label.grid(row=0, column=1, sticky="w")
+
+        error_label = ctk.CTkLabel(
+            card,
+            textvariable=self._error_var,
+            font=ctk.CTkFont(family="Segoe UI", size=14),
+            text_color=("#dc2626", "#f87171"),
+        )
+        error_label.grid(row=4, column=0, columnspan=2, sticky="w", padx=28)
+
+        lines_heading = ctk.CTkLabel(
+            card,
+            text="Wiele wyrażeń (jedno w linii)",
+            font=ctk.CTkFont(family="Segoe UI", size=15, weight="bold"),
+        )
+        lines_heading.grid(row=5, column=0, sticky="w", padx=(28, 8), pady=(16, 6))
+
+        lines_total = ctk.CTkLabel(
+            card,
+            textvariable=self._lines_total_var,
+            font=ctk.CTkFont(family="Segoe UI", size=14),
+            text_color=("#475569", "#94a3b8"),
+        )
+        lines_total.grid(row=5, column=1, sticky="e", padx=(8, 28), pady=(16, 6))
+
+        self._lines_input = ctk.CTkTextbox(card, font=ctk.CTkFont(family="Consolas", size=14), wrap="none")
+        self._lines_input.grid(row=6, column=0, sticky="nsew", padx=(28, 6), pady=(0, 24))
+        self._lines_input.bind("<KeyRelease>", self._on_lines_change)
+
+        self._lines_output = ctk.CTkTextbox(
+            card,
+            font=ctk.CTkFont(family="Consolas", size=14),
+            wrap="none",
+            state="disabled",
+        )
+        self._lines_output.grid(row=6, column=1, sticky="nsew", padx=(6, 28), pady=(0, 24))
+
+    def _on_expression_change(self, _: object | None = None) -> None:
+        self._scheduler.schedule("expression:single", self._apply_expression_input)
+
+    @profiled("expression.single")
+    def _apply_expression_input(self) -> None:
+        text = self._expression_var.get()
+        if not text.strip():
+            self._show_result(None)
+            self._error_var.set("")
+            self._set_entry_invalid(False)
+            return
+
+        try:
+            result = compile_expression(text).evaluate()
+        except ExpressionError as error:
+            self._show_result(None)
+            where = "" if error.position is None else f" (znak {error.position + 1})"
+            self._error_var.set(f"Nieprawidłowe wyrażenie{where}: {error}")
+            self._set_entry_invalid(True)
+            return
+
+        self._show_result(result)
+        self._error_var.set("")
+        self._set_entry_invalid(False)
+
+    def _show_result(self, result: Quantity | None) -> None:
+        if result is None:
+            self._clock_result_var.set("")
+            self._hours_result_var.set("")
+        elif result.is_duration:
+            self._clock_result_var.set(format_signed_seconds(result.seconds))
+            self._hours_result_var.set(f"{seconds_to_float_hours(result.seconds):.2f} h")
+        else:
+            self._clock_result_var.set(str(result))
+            self._hours_result_var.set("liczba")
+
+    def _on_lines_change(self, _: object | None = None) -> None:
+        self._scheduler.schedule("expression:lines", self._apply_lines_input)
+
+    @profiled("expression.lines")
+    def _apply_lines_input(self) -> None:
+        lines = self._lines_input.get("1.0", "end-1c").splitlines()
+        expressions = [line for line in lines if line.strip()]
+        results = iter(evaluate_many(expressions))
+
+        output = []
+        total_seconds = 0
+        for line in lines:
+            if not line.strip():
+                output.append("")
+                continue
+            result = next(results)
+            if result is None:
+                output.append(INVALID_LINE_LABEL)
+                continue
+            if result.is_duration:
+                total_seconds += result.seconds
+            output.append(str(result))
+
+        self._lines_output.configure(state="normal")
+        self._lines_output.delete("1.0", "end")
+        self._lines_output.insert("1.0", "\n".join(output))
+        self._lines_output.configure(state="disabled")
+        self._lines_total_var.set(
+            f"Suma: {format_signed_seconds(total_seconds)} ({seconds_to_float_hours(total_seconds):.2f} h)"
+            if expressions
+            else ""
+        )
+
+    def _set_entry_invalid(self, is_invalid: bool) -> None:
+        if is_invalid:
+            self._expression_entry.configure(border_color=("#dc2626", "#f87171"), border_width=2)
+            return
+
+        border_color, border_width = self._default_border
+        self._expression_entry.configure(border_color=border_color, border_width=border_width)
@@ -1,35 +1,61 @@
 ﻿from __future__ import annotations
 
-import uuid
+import csv
+import sys
+import tkinter
+from collections.abc import Callable
+from tkinter import filedialog, messagebox
+from typing import Any
 
 import customtkinter as ctk
 
-from time_utils import (
-    calculate_time_expression,
-    calculate_vacation_days,
-    seconds_to_float_hours,
-    time_to_seconds,
-)
-from ui.models import TimeRowState
-from ui.utils.time_sum_helpers import (
-    build_expression_payload,
-    format_signed_seconds,
-    is_complete_hhmmss,
-    mask_hhmmss,
-)
+from profiling import PROFILER, profiled
+from ui.history import EditHistory
+from ui.time_sum_controller import JobRequest, TimeSumController
+from ui.timesheet import EVENT_UPDATE, ModelEvent, TimesheetModel
+from ui.utils.background import BackgroundRunner, Job
+from ui.utils.row_viewport import RowViewport
+from ui.utils.scheduler import CoalescingScheduler
+from ui.utils.time_sum_helpers import mask_hhmmss
+from ui.utils.timesheet_csv import ImportIssue, ImportResult
 from ui.widgets.time_row import TimeRowWidget
+from ui.widgets.time_table import TABLE_ROW_HEIGHT, TimeTable
+
+ROW_WIDGET_HEIGHT = 36
+ROW_HEIGHT = ROW_WIDGET_HEIGHT + 8
+
+PROGRESS_DELAY_MS = 300
+
+
+def _widget_within(widget: object, ancestor: tkinter.Misc) -> bool:
+    """Whether Tk path ``widget`` is ``ancestor`` or below it; ``.a.b2`` is not below ``.a.b``."""
+    path, ancestor_path = str(widget), str(ancestor)
+    return path == ancestor_path or path.startswith(ancestor_path.rstrip(".") + ".")
 
 
 class TimeSumView(ctk.CTkFrame):
-    def __init__(self, master: ctk.CTkBaseClass) -> None:
+    def __init__(
+        self,
+        master: ctk.CTkBaseClass,
+        scheduler: CoalescingScheduler | None = None,
+        model: TimesheetModel | None = None,
+    ) -> None:
         super().__init__(master, fg_color="transparent")
 
+        self._scheduler = scheduler if scheduler is not None else CoalescingScheduler(self)
+        self._model = model if model is not None else TimesheetModel()
+        self._controller = TimeSumController(self._model, on_rows_edited=self._refresh_row_widgets)
+        self._background = BackgroundRunner(self)
+        self._visible_job: Job | None = None
+
         self.grid_columnconfigure(0, weight=1)
         self.grid_columnconfigure(1, weight=0, minsize=360)
         self.grid_rowconfigure(0, weight=1)
 
-        self._rows: dict[str, TimeRowWidget] = {}
-        self._row_order: list[str] = []
+        self._row_pool: list[TimeRowWidget] = []
+        self._viewport = RowViewport(ROW_HEIGHT)
+        self._table: TimeTable | None = None
+        self._table_mode_var = ctk.BooleanVar(value=False)
 
         self._clock_result_var = ctk.StringVar(value="00:00:00")
         self._hours_result_var = ctk.StringVar(value="0.00 h")
@@ -38,11 +64,19 @@ class TimeSumView(ctk.CTkFrame):
         self._daily_norm_quick_target = "07:35:00"
         self._clock_copy_after: str | None = None
         self._hours_copy_after: str | None = None
+        self._range_summary_var = ctk.StringVar(value="")
+        self._search_var = ctk.StringVar(value="")
+        self._filter_summary_var = ctk.StringVar(value="")
 
         self._build_rows_panel()
         self._build_results_panel()
 
-        self.add_row()
+        self._model.subscribe(self._on_model_change)
+        if len(self._model):
+            self._render_rows()
+            self._refresh_results()
+        else:
+            self.add_row()
 
     def _build_rows_panel(self) -> None:
         panel = ctk.CTkFrame(self, corner_radius=18)
@@ -60,6 +94,41 @@ class TimeSumView(ctk.CTkFrame):
         )
         heading.grid(row=0, column=0, sticky="w")
 
+        history_frame = ctk.CTkFrame(header, fg_color="transparent")
+        history_frame.grid(row=0, column=1, sticky="e")
+
+        table_mode_switch = ctk.CTkSwitch(
+            history_frame,
+            text="Tryb tabeli",
+            variable=self._table_mode_var,
+            command=self._on_table_mode_toggle,
+            font=ctk.CTkFont(family="Segoe UI", size=13),
+        )
+        table_mode_switch.grid(row=0, column=0, padx=(0, 12))
+
+        self._undo_button = ctk.CTkButton(
+            history_frame,
+            text="Cofnij",
+            width=86,
+            height=34,
+            command=self.undo,
+        )
+        self._undo_button.grid(row=0, column=1, padx=(0, 8))
+
+        self._redo_button = ctk.CTkButton(
+            history_frame,
+            text="Ponów",
+            width=86,
+            height=34,
+            command=self.redo,
+        )
+        self._redo_button.grid(row=0, column=2)
+
+        self._controller.history.subscribe(self._sync_history_buttons)
+        self._sync_history_buttons()
+        for sequence in ("<Control-z>", "<Control-y>", "<Control-Z>"):
+            self.bind_all(sequence, self._on_history_key, add="+")
+
         norm_frame = ctk.CTkFrame(header, fg_color="transparent")
         norm_frame.grid(row=1, column=0, sticky="w", pady=(8, 0))
         norm_frame.grid_columnconfigure(1, weight=0)
@@ -92,6 +161,8 @@ class TimeSumView(ctk.CTkFrame):
         )
         self._daily_norm_quick_button.grid(row=0, column=2, sticky="e")
 
+        self._build_search_bar(header)
+
         self._default_daily_norm_border_color = self._daily_norm_entry.cget("border_color")
         self._default_daily_norm_border_width = self._daily_norm_entry.cget("border_width")
 
@@ -109,14 +180,30 @@ class TimeSumView(ctk.CTkFrame):
             add="+",
         )
 
-        self._rows_scrollable = ctk.CTkScrollableFrame(panel, fg_color="transparent")
-        self._rows_scrollable.grid(row=2, column=0, sticky="nsew", padx=16, pady=(0, 12))
-        self._rows_scrollable.grid_columnconfigure(0, weight=1)
+        rows_frame = ctk.CTkFrame(panel, fg_color="transparent")
+        rows_frame.grid(row=2, column=0, sticky="nsew", padx=16, pady=(0, 12))
+        rows_frame.grid_columnconfigure(0, weight=1)
+        rows_frame.grid_rowconfigure(0, weight=1)
+
+        self._rows_viewport = ctk.CTkFrame(rows_frame, fg_color="transparent")
+        self._rows_viewport.grid(row=0, column=0, sticky="nsew")
+        self._rows_viewport.bind("<Configure>", self._on_viewport_configure, add="+")
+
+        self._rows_scrollbar = ctk.CTkScrollbar(rows_frame, command=self._on_scrollbar)
+        self._rows_scrollbar.grid(row=0, column=1, sticky="ns", padx=(4, 0))
+
+        self.bind_all("<MouseWheel>", self._on_mouse_wheel, add="+")
+        self.bind_all("<Button-4>", self._on_mouse_wheel, add="+")
+        self.bind_all("<Button-5>", self._on_mouse_wheel, add="+")
+
+        self._build_job_bar(panel)
 
         footer = ctk.CTkFrame(panel, fg_color="transparent")
-        footer.grid(row=3, column=0, sticky="ew", padx=16, pady=(0, 16))
+        footer.grid(row=4, column=0, sticky="ew", padx=16, pady=(0, 16))
         footer.grid_columnconfigure(0, weight=1)
         footer.grid_columnconfigure(1, weight=1)
+        footer.grid_columnconfigure(2, weight=1)
+        footer.grid_columnconfigure(3, weight=1)
 
         add_button = ctk.CTkButton(
             footer,
@@ -126,6 +213,22 @@ class TimeSumView(ctk.CTkFrame):
         )
         add_button.grid(row=0, column=0, sticky="ew", padx=(0, 6))
 
+        import_button = ctk.CTkButton(
+            footer,
+            text="Importuj CSV/TSV",
+            height=38,
+            command=self._import_from_file,
+        )
+        import_button.grid(row=0, column=1, sticky="ew", padx=6)
+
+        export_button = ctk.CTkButton(
+            footer,
+            text="Eksportuj",
+            height=38,
+            command=self._export_to_file,
+        )
+        export_button.grid(row=0, column=2, sticky="ew", padx=6)
+
         clear_button = ctk.CTkButton(
             footer,
             text="Wyczyść wszystko",
@@ -137,18 +240,115 @@ class TimeSumView(ctk.CTkFrame):
             text_color=("#991b1b", "#fecaca"),
             command=self.clear_all,
         )
-        clear_button.grid(row=0, column=1, sticky="ew", padx=(6, 0))
+        clear_button.grid(row=0, column=3, sticky="ew", padx=(6, 0))
+
+        bulk_actions = (
+            ("Duplikuj widoczne", lambda: self._controller.duplicate_rows(self._controller.visible_row_ids())),
+            ("Wyłącz opis z wyszukiwania", lambda: self._controller.deactivate_tag(self._search_var.get())),
+            ("Odwróć znaki widocznych", lambda: self._controller.flip_operators(self._controller.visible_row_ids())),
+        )
+        for column, (text, command) in enumerate(bulk_actions):
+            bulk_button = ctk.CTkButton(
+                footer,
+                text=text,
+                height=34,
+                fg_color="transparent",
+                border_width=1,
+                border_color=("#d1d5db", "#4b5563"),
+                text_color=("#111827", "#f3f4f6"),
+                hover_color=("#e5e7eb", "#374151"),
+                command=command,
+            )
+            bulk_button.grid(
+                row=1,
+                column=column,
+                columnspan=2 if column == len(bulk_actions) - 1 else 1,
+                sticky="ew",
+                padx=(0 if column == 0 else 6, 0 if column == len(bulk_actions) - 1 else 6),
+                pady=(8, 0),
+            )
 
         panel.grid_rowconfigure(2, weight=1)
         self._sync_daily_norm_quick_button()
         self._set_daily_norm_validation_state(False)
 
+    def _build_search_bar(self, header: ctk.CTkFrame) -> None:
+        search_frame = ctk.CTkFrame(header, fg_color="transparent")
+        search_frame.grid(row=2, column=0, columnspan=2, sticky="ew", pady=(8, 0))
+        search_frame.grid_columnconfigure(0, weight=1)
+
+        self._search_entry = ctk.CTkEntry(
+            search_frame,
+            height=34,
+            textvariable=self._search_var,
+            placeholder_text="Szukaj w opisach…",
+            font=ctk.CTkFont(family="Segoe UI", size=14),
+        )
+        self._search_entry.grid(row=0, column=0, sticky="ew", padx=(0, 8))
+        self._search_entry.bind("<KeyRelease>", self._on_filter_change)
+
+        self._min_duration_entry = ctk.CTkEntry(
+            search_frame,
+            width=96,
+            height=34,
+            placeholder_text="od",
+            font=ctk.CTkFont(family="Segoe UI", size=14),
+        )
+        self._min_duration_entry.grid(row=0, column=1, padx=(0, 8))
+        self._min_duration_entry.bind("<KeyRelease>", self._on_filter_change)
+
+        self._max_duration_entry = ctk.CTkEntry(
+            search_frame,
+            width=96,
+            height=34,
+            placeholder_text="do",
+            font=ctk.CTkFont(family="Segoe UI", size=14),
+        )
+        self._max_duration_entry.grid(row=0, column=2)
+        self._max_duration_entry.bind("<KeyRelease>", self._on_filter_change)
+
+        filter_summary = ctk.CTkLabel(
+            search_frame,
+            textvariable=self._filter_summary_var,
+            font=ctk.CTkFont(family="Segoe UI", size=13),
+            text_color=("#475569", "#94a3b8"),
+        )
+        filter_summary.grid(row=1, column=0, columnspan=3, sticky="w")
+
+    def _build_job_bar(self, panel: ctk.CTkFrame) -> None:
+        self._job_bar = ctk.CTkFrame(panel, fg_color="transparent")
+        self._job_bar.grid(row=3, column=0, sticky="ew", padx=16, pady=(0, 12))
+        self._job_bar.grid_columnconfigure(1, weight=1)
+
+        self._job_label_var = ctk.StringVar(value="")
+        job_label = ctk.CTkLabel(
+            self._job_bar,
+            textvariable=self._job_label_var,
+            font=ctk.CTkFont(family="Segoe UI", size=13),
+            text_color=("#475569", "#94a3b8"),
+        )
+        job_label.grid(row=0, column=0, sticky="w", padx=(0, 8))
+
+        self._job_progress = ctk.CTkProgressBar(self._job_bar, height=10)
+        self._job_progress.grid(row=0, column=1, sticky="ew", padx=(0, 8))
+
+        cancel_button = ctk.CTkButton(
+            self._job_bar,
+            text="Anuluj",
+            width=90,
+            height=30,
+            command=self._cancel_visible_job,
+        )
+        cancel_button.grid(row=0, column=2, sticky="e")
+
+        self._job_bar.grid_remove()
+
     def _build_results_panel(self) -> None:
         panel = ctk.CTkFrame(self, corner_radius=18, width=360)
         panel.grid(row=0, column=1, sticky="ns", padx=(12, 0), pady=0)
         panel.grid_propagate(False)
         panel.grid_columnconfigure(0, weight=1)
-        panel.grid_rowconfigure(7, weight=1)
+        panel.grid_rowconfigure(8, weight=1)
 
         heading = ctk.CTkLabel(
             panel,
@@ -234,79 +434,312 @@ class TimeSumView(ctk.CTkFrame):
         )
         days_result.grid(row=6, column=0, sticky="nw", padx=24, pady=(0, 24))
 
+        subtotals_frame = ctk.CTkFrame(panel, fg_color="transparent")
+        self._build_range_bar(panel)
+
+        subtotals_frame.grid(row=8, column=0, sticky="nsew", padx=24, pady=(0, 24))
+        subtotals_frame.grid_columnconfigure(0, weight=1)
+        subtotals_frame.grid_rowconfigure(1, weight=1)
+
+        self._subtotals_switch = ctk.CTkSwitch(
+            subtotals_frame,
+            text="Sumy według opisu",
+            font=ctk.CTkFont(family="Segoe UI", size=14),
+            command=self._on_subtotals_toggle,
+        )
+        self._subtotals_switch.grid(row=0, column=0, sticky="w")
+
+        self._subtotals_text = ctk.CTkTextbox(
+            subtotals_frame,
+            wrap="none",
+            font=ctk.CTkFont(family="Consolas", size=13),
+            state="disabled",
+        )
+
+    def _build_range_bar(self, panel: ctk.CTkFrame) -> None:
+        range_frame = ctk.CTkFrame(panel, fg_color="transparent")
+        range_frame.grid(row=7, column=0, sticky="ew", padx=24, pady=(0, 16))
+        range_frame.grid_columnconfigure(4, weight=1)
+
+        range_title = ctk.CTkLabel(
+            range_frame,
+            text="Suma wierszy",
+            font=ctk.CTkFont(family="Segoe UI", size=14),
+            text_color=("#64748b", "#94a3b8"),
+        )
+        range_title.grid(row=0, column=0, sticky="w", padx=(0, 8))
+
+        self._range_start_entry = ctk.CTkEntry(range_frame, width=64, height=30, placeholder_text="od")
+        self._range_start_entry.grid(row=0, column=1, padx=(0, 4))
+        range_dash = ctk.CTkLabel(range_frame, text="–", width=12)
+        range_dash.grid(row=0, column=2, padx=(0, 4))
+        self._range_end_entry = ctk.CTkEntry(range_frame, width=64, height=30, placeholder_text="do")
+        self._range_end_entry.grid(row=0, column=3, sticky="w")
+        for entry in (self._range_start_entry, self._range_end_entry):
+            entry.bind("<KeyRelease>", self._on_range_change)
+
+        range_summary = ctk.CTkLabel(
+            range_frame,
+            textvariable=self._range_summary_var,
+            font=ctk.CTkFont(family="Consolas", size=14, weight="bold"),
+        )
+        range_summary.grid(row=1, column=0, columnspan=5, sticky="w", pady=(4, 0))
+
+    @property
+    def model(self) -> TimesheetModel:
+        return self._model
+
+    @property
+    def controller(self) -> TimeSumController:
+        return self._controller
+
+    @property
+    def history(self) -> EditHistory:
+        return self._controller.history
+
     def add_row(self) -> None:
-        row_id = uuid.uuid4().hex
-        row_state = TimeRowState(row_id=row_id, multiplier="1", is_active=True)
+        self._controller.add_row()
+        total_rows = self._controller.visible_row_count()
+        self._viewport.ensure_visible(total_rows - 1, total_rows)
+
+    def _on_row_paste(self, row_id: str, text: str) -> bool:
+        parsed = self._controller.parse_paste(text)
+        if parsed is None:
+            return False
+
+        if isinstance(parsed, JobRequest):
+            self._start_job(parsed, lambda result: self._apply_paste_result(row_id, result))
+        else:
+            self._apply_paste_result(row_id, parsed)
+        return True
+
+    def _apply_paste_result(self, row_id: str, result: ImportResult) -> None:
+        self._controller.paste_rows(row_id, result.rows)
+        if not result.rows and not result.issues:
+            # Large pastes are taken over before parsing, so an empty result must not pass silently.
+            messagebox.showwarning("Wklejanie", "Schowek nie zawiera wierszy z czasem.", parent=self)
+        elif result.issues:
+            self._show_import_issues(len(result.rows), result.issues, title="Wklejanie")
+
+    def undo(self) -> None:
+        self._controller.undo()
+
+    def redo(self) -> None:
+        self._controller.redo()
+
+    def _refresh_row_widgets(self, row_ids: set[str]) -> None:
+        """Re-read rows edited in place; inserts and removals go through the layout pass."""
+        if not row_ids:
+            return
+        if self._table is not None and self.table_mode:
+            self._table.refresh_rows(row_ids)
+            return
+        for row_widget in self._row_pool:
+            if row_widget.state.row_id in row_ids and row_widget.winfo_ismapped():
+                row_widget.refresh()
+
+    def _sync_history_buttons(self) -> None:
+        history = self._controller.history
+        self._undo_button.configure(state="normal" if history.can_undo else "disabled")
+        self._redo_button.configure(state="normal" if history.can_redo else "disabled")
+
+    def _on_history_key(self, event: tkinter.Event) -> str | None:
+        if not _widget_within(event.widget, self):
+            return None
+
+        if event.keysym.lower() == "z" and not event.state & 0x1:
+            self.undo()
+        else:
+            self.redo()
+        return "break"
+
+    def _import_from_file(self) -> None:
+        path = filedialog.askopenfilename(
+            parent=self,
+            title="Importuj wiersze",
+            filetypes=[("CSV / TSV", "*.csv *.tsv *.txt"), ("Wszystkie pliki", "*.*")],
+        )
+        if not path:
+            return
 
-        row_widget = TimeRowWidget(
-            self._rows_scrollable,
-            row_state=row_state,
-            on_change=self._on_row_change,
-            on_toggle=self._on_row_toggle,
-            on_remove=self._on_row_remove,
+        self._start_job(
+            self._controller.import_job(path),
+            self._apply_import_result,
+            on_error=lambda error: self._show_job_error("Import", "Nie udało się wczytać pliku", error),
         )
 
-        self._rows[row_id] = row_widget
-        self._row_order.append(row_id)
+    def _apply_import_result(self, result: ImportResult) -> None:
+        self._controller.import_rows(result.rows)
+        if result.issues:
+            self._show_import_issues(len(result.rows), result.issues)
+
+    def _export_to_file(self) -> None:
+        path = filedialog.asksaveasfilename(
+            parent=self,
+            title="Eksportuj wiersze",
+            defaultextension=".csv",
+            filetypes=[("CSV", "*.csv"), ("TSV", "*.tsv")],
+        )
+        if not path:
+            return
 
-        self._regrid_rows()
-        self.recalculate()
+        self._start_job(
+            self._controller.export_job(path),
+            lambda _count: None,
+            on_error=lambda error: self._show_job_error("Eksport", "Nie udało się zapisać pliku", error),
+        )
 
-    def remove_row(self, row_id: str) -> None:
-        row_widget = self._rows.pop(row_id, None)
-        if row_widget is None:
+    def _start_job(
+        self,
+        request: JobRequest,
+        on_done: Callable[[Any], None],
+        *,
+        on_error: Callable[[BaseException], None] | None = None,
+    ) -> Job:
+        key = request.key
+        job = self._background.submit(
+            key,
+            request.work,
+            on_done,
+            on_progress=lambda done, total: self._update_job_progress(key, done, total),
+            on_error=on_error,
+            on_finished=self._on_job_finished,
+        )
+        self._job_label_var.set(request.label)
+        self.after(PROGRESS_DELAY_MS, lambda: self._show_job_bar(job))
+        return job
+
+    def _show_job_bar(self, job: Job) -> None:
+        if job.finished or job.cancel_event.is_set():
             return
 
-        row_widget.destroy()
-        self._row_order = [current_id for current_id in self._row_order if current_id != row_id]
+        self._visible_job = job
+        self._job_progress.set(0)
+        self._job_bar.grid()
 
-        if not self._row_order:
-            self.add_row()
+    def _update_job_progress(self, key: str, done: int, total: int) -> None:
+        if self._visible_job is not None and self._visible_job.key == key and total > 0:
+            self._job_progress.set(done / total)
+
+    def _on_job_finished(self, job: Job) -> None:
+        if self._visible_job is job:
+            self._visible_job = None
+            self._job_bar.grid_remove()
+
+    def _cancel_visible_job(self) -> None:
+        if self._visible_job is not None:
+            self._visible_job.cancel()
+
+    def _show_job_error(self, title: str, message: str, error: BaseException) -> None:
+        if isinstance(error, (OSError, UnicodeDecodeError, csv.Error)):
+            messagebox.showerror(title, f"{message}:\n{error}", parent=self)
             return
+        print(f"[Godzinator] {title} error: {error}")
 
-        self._regrid_rows()
-        self.recalculate()
+    def _show_import_issues(self, imported_count: int, issues: list[ImportIssue], title: str = "Import") -> None:
+        lines = [f"Wiersz {issue.line_number}: {issue.message}" for issue in issues[:10]]
+        if len(issues) > len(lines):
+            lines.append(f"… i {len(issues) - len(lines)} więcej")
+
+        messagebox.showwarning(
+            title,
+            f"Zaimportowano {imported_count} wierszy, pominięto {len(issues)}:\n" + "\n".join(lines),
+            parent=self,
+        )
 
     def clear_all(self) -> None:
-        for row_id in list(self._row_order):
-            self._rows[row_id].destroy()
-
-        self._rows.clear()
-        self._row_order.clear()
-
-        self.add_row()
-
-    def recalculate(self) -> None:
-        ordered_states = [self._rows[row_id].state for row_id in self._row_order]
-        times, operators, multipliers, total_seconds = build_expression_payload(ordered_states)
-        daily_norm_text = self._daily_norm_var.get()
-        daily_norm_invalid = self._is_daily_norm_invalid(daily_norm_text)
-        self._set_daily_norm_validation_state(daily_norm_invalid)
-
-        days_value = 0.0
-        if not daily_norm_invalid:
-            days_value = calculate_vacation_days(total_seconds, daily_norm_text)
-
-        try:
-            calculate_time_expression(times, operators, multipliers)
-        except Exception as error:
-            print(f"[Godzinator] Calculation error: {error}")
-            self._set_result_values(0, 0.0)
+        self._viewport.scroll_to(0, 0)
+        self._controller.clear_all()
+
+    @property
+    def row_count(self) -> int:
+        return len(self._model)
+
+    @property
+    def row_pool_size(self) -> int:
+        return len(self._row_pool)
+
+    @property
+    def table_mode(self) -> bool:
+        return self._table_mode_var.get()
+
+    def set_table_mode(self, enabled: bool) -> None:
+        """Switch between the row widget pool and the single-canvas table."""
+        if self._table_mode_var.get() != enabled:
+            self._table_mode_var.set(enabled)
+        self._on_table_mode_toggle()
+
+    def _on_table_mode_toggle(self) -> None:
+        enabled = self.table_mode
+        row_height = TABLE_ROW_HEIGHT if enabled else ROW_HEIGHT
+        if row_height == self._viewport.row_height:
             return
 
-        self._set_result_values(total_seconds, days_value)
-
-    def _set_result_values(self, total_seconds: int, days_value: float) -> None:
-        self._clock_result_var.set(format_signed_seconds(total_seconds))
+        # Keep the same first row in view across the switch.
+        first_index = self._viewport.offset // self._viewport.row_height
+        total_rows = self._controller.visible_row_count()
+        viewport = RowViewport(row_height)
+        viewport.set_height(self._viewport.height, total_rows)
+        viewport.scroll_to(first_index * row_height, total_rows)
+        self._viewport = viewport
+
+        if enabled:
+            for row_widget in self._row_pool:
+                row_widget.place_forget()
+            if self._table is None:
+                self._table = TimeTable(
+                    self._rows_viewport,
+                    on_change=self._on_row_change,
+                    on_remove=self._on_row_remove,
+                    scheduler=self._scheduler,
+                    on_paste=self._on_row_paste,
+                )
+            self._table.place(x=0, y=0, relwidth=1, relheight=1)
+        elif self._table is not None:
+            self._table.commit_edit()
+            self._table.place_forget()
+        self._render_rows()
+
+    def shutdown(self) -> None:
+        """Cancel running jobs and stop the worker threads; called when the app closes."""
+        self._background.shutdown()
+
+    def _refresh_results(self) -> None:
+        PROFILER.count("time_sum.refresh_results")
+        totals = self._controller.totals(self._daily_norm_var.get())
+        self._set_daily_norm_validation_state(not totals.norm_valid)
+        self._clock_result_var.set(totals.clock)
+        self._hours_result_var.set(totals.hours)
+        self._days_result_var.set(totals.days)
+
+        self._refresh_subtotals()
+        self._filter_summary_var.set(self._controller.filter_summary())
+        self._refresh_range_summary()
+
+    def _on_subtotals_toggle(self) -> None:
+        enabled = bool(self._subtotals_switch.get())
+        self._controller.set_subtotals_enabled(enabled)
+        if enabled:
+            self._subtotals_text.grid(row=1, column=0, sticky="nsew", pady=(8, 0))
+            self._refresh_subtotals()
+        else:
+            self._subtotals_text.grid_remove()
 
-        hours_value = seconds_to_float_hours(total_seconds)
-        if abs(hours_value) < 0.005:
-            hours_value = 0.0
+    def _refresh_subtotals(self) -> None:
+        lines = self._controller.subtotal_lines(self._daily_norm_var.get())
+        if lines is None:
+            return
 
-        self._hours_result_var.set(f"{hours_value:.2f} h")
-        self._days_result_var.set(f"{days_value:.2f}")
+        self._subtotals_text.configure(state="normal")
+        self._subtotals_text.delete("1.0", "end")
+        self._subtotals_text.insert("1.0", "\n".join(lines))
+        self._subtotals_text.configure(state="disabled")
 
     def _on_daily_norm_change(self, _: object | None = None) -> None:
+        self._scheduler.schedule("time_sum:daily_norm", self._apply_daily_norm_input)
+
+    @profiled("norm.input")
+    def _apply_daily_norm_input(self) -> None:
         current_value = self._daily_norm_entry.get()
         masked_value = mask_hhmmss(current_value)
 
@@ -316,14 +749,15 @@ class TimeSumView(ctk.CTkFrame):
 
         self._daily_norm_var.set(masked_value)
         self._sync_daily_norm_quick_button()
-        self.recalculate()
+        self._refresh_results()
 
+    @profiled("norm.quick_toggle")
     def _on_daily_norm_quick_toggle(self) -> None:
         self._daily_norm_entry.delete(0, "end")
         self._daily_norm_entry.insert(0, self._daily_norm_quick_target)
         self._daily_norm_var.set(self._daily_norm_quick_target)
         self._sync_daily_norm_quick_button()
-        self.recalculate()
+        self._refresh_results()
 
     def _sync_daily_norm_quick_button(self) -> None:
         current_value = self._daily_norm_var.get()
@@ -346,17 +780,6 @@ class TimeSumView(ctk.CTkFrame):
             border_width=self._default_daily_norm_border_width,
         )
 
-    def _is_daily_norm_invalid(self, value: str) -> bool:
-        if not is_complete_hhmmss(value):
-            return True
-
-        try:
-            norm_seconds = time_to_seconds(value)
-        except ValueError:
-            return True
-
-        return norm_seconds <= 0
-
     def _copy_clock_result(self) -> None:
         self._copy_to_clipboard(self._clock_result_var.get())
         self._show_copy_feedback("clock")
@@ -401,20 +824,121 @@ class TimeSumView(ctk.CTkFrame):
 
         self._hours_copy_after = self.after(1500, _reset_hours_button)
 
-    def _regrid_rows(self) -> None:
-        for row_widget in self._rows.values():
-            row_widget.grid_forget()
+    def _on_filter_change(self, _: object | None = None) -> None:
+        self._scheduler.schedule("time_sum:filter", self._apply_filter_input)
+
+    @profiled("filter.input")
+    def _apply_filter_input(self) -> None:
+        bounds = []
+        for entry in (self._min_duration_entry, self._max_duration_entry):
+            current_value = entry.get()
+            masked_value = mask_hhmmss(current_value)
+            if current_value != masked_value:
+                entry.delete(0, "end")
+                entry.insert(0, masked_value)
+            bounds.append(masked_value)
+
+        if self._controller.set_filter(self._search_var.get(), *bounds):
+            self._viewport.scroll_to(0, self._controller.visible_row_count())
+            self._render_rows()
+        self._filter_summary_var.set(self._controller.filter_summary())
+
+    def _on_range_change(self, _: object | None = None) -> None:
+        self._scheduler.schedule("time_sum:range", self._refresh_range_summary)
+
+    def _refresh_range_summary(self) -> None:
+        bounds = []
+        for entry in (self._range_start_entry, self._range_end_entry):
+            current_value = entry.get()
+            digits = "".join(character for character in current_value if "0" <= character <= "9")
+            if current_value != digits:
+                entry.delete(0, "end")
+                entry.insert(0, digits)
+            bounds.append(int(digits) if digits else None)
+
+        self._range_summary_var.set(self._controller.range_summary(*bounds))
+
+    def _render_rows(self) -> None:
+        total_rows = self._controller.visible_row_count()
+        self._viewport.scroll_to(self._viewport.offset, total_rows)
+        first_index, end_index, shift = self._viewport.visible_window(total_rows)
+        visible_count = end_index - first_index
+
+        if self._table is not None and self.table_mode:
+            self._table.render([self._controller.visible_state(index) for index in range(first_index, end_index)], shift)
+            self._rows_scrollbar.set(*self._viewport.scrollbar_fractions(total_rows))
+            return
+
+        while len(self._row_pool) < visible_count:
+            row_state = self._controller.visible_state(first_index + len(self._row_pool))
+            self._row_pool.append(
+                TimeRowWidget(
+                    self._rows_viewport,
+                    row_state=row_state,
+                    on_change=self._on_row_change,
+                    on_toggle=self._on_row_toggle,
+                    on_remove=self._on_row_remove,
+                    scheduler=self._scheduler,
+                    on_paste=self._on_row_paste,
+                )
+            )
+
+        for slot, row_widget in enumerate(self._row_pool):
+            if slot >= visible_count:
+                row_widget.place_forget()
+                continue
+
+            row_widget.bind_state(self._controller.visible_state(first_index + slot))
+            row_widget.place(x=0, y=slot * ROW_HEIGHT - shift, relwidth=1, height=ROW_WIDGET_HEIGHT)
+
+        self._rows_scrollbar.set(*self._viewport.scrollbar_fractions(total_rows))
+
+    def _on_viewport_configure(self, event: tkinter.Event) -> None:
+        scaling = ctk.ScalingTracker.get_widget_scaling(self)
+        self._viewport.set_height(round(event.height / scaling), self._controller.visible_row_count())
+        self._render_rows()
+
+    def _on_scrollbar(self, action: str, value: str, unit: str | None = None) -> None:
+        total_rows = self._controller.visible_row_count()
+
+        if action == "moveto":
+            self._viewport.scroll_to(float(value) * self._viewport.content_height(total_rows), total_rows)
+        elif unit == "pages":
+            self._viewport.scroll_by(int(value) * self._viewport.height, total_rows)
+        else:
+            self._viewport.scroll_by(int(value) * self._viewport.row_height, total_rows)
+
+        self._render_rows()
+
+    def _on_mouse_wheel(self, event: tkinter.Event) -> None:
+        if not _widget_within(event.widget, self._rows_viewport):
+            return
+
+        row_height = self._viewport.row_height
+        if event.num == 4:
+            delta = -row_height
+        elif event.num == 5:
+            delta = row_height
+        elif sys.platform == "darwin":
+            delta = -event.delta * 4
+        else:
+            delta = -round(event.delta / 120 * row_height)
+
+        previous_offset = self._viewport.offset
+        if self._viewport.scroll_by(delta, self._controller.visible_row_count()) != previous_offset:
+            self._render_rows()
 
-        for index, row_id in enumerate(self._row_order):
-            self._rows[row_id].grid(row=index, column=0, sticky="ew", pady=(0, 8))
+    def _on_model_change(self, event: ModelEvent) -> None:
+        # With a filter, an edit can hide or reveal its row.
+        if event.kind != EVENT_UPDATE or self._controller.filter_active:
+            self._scheduler.schedule("time_sum:layout", self._render_rows)
+        self._scheduler.schedule("time_sum:results", self._refresh_results)
 
     def _on_row_change(self, row_id: str) -> None:
-        if row_id in self._rows:
-            self.recalculate()
+        self._model.row_changed(row_id)
 
     def _on_row_toggle(self, row_id: str) -> None:
-        if row_id in self._rows:
-            self.recalculate()
+        self._on_row_change(row_id)
 
     def _on_row_remove(self, row_id: str) -> None:
-        self.remove_row(row_id)
+        self._controller.remove_row(row_id)
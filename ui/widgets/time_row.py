@@ -1,19 +1,24 @@
 ﻿from __future__ import annotations
 
+import tkinter
 from collections.abc import Callable
 
 import customtkinter as ctk
 
+from profiling import profiled
 from ui.models import TimeRowState
 from ui.utils.time_sum_helpers import (
     is_valid_multiplier,
     mask_hhmmss,
     sanitize_multiplier_text,
 )
+from ui.utils.scheduler import CoalescingScheduler
 
 OnRowChange = Callable[[str], None]
 OnRowToggle = Callable[[str], None]
 OnRowRemove = Callable[[str], None]
+# Gets the clipboard text pasted into the time entry; returns whether it was handled.
+OnRowPaste = Callable[[str, str], bool]
 
 
 class TimeRowWidget(ctk.CTkFrame):
@@ -24,6 +29,8 @@ class TimeRowWidget(ctk.CTkFrame):
         on_change: OnRowChange,
         on_toggle: OnRowToggle,
         on_remove: OnRowRemove,
+        scheduler: CoalescingScheduler | None = None,
+        on_paste: OnRowPaste | None = None,
     ) -> None:
         super().__init__(master, fg_color="transparent")
 
@@ -31,6 +38,10 @@ class TimeRowWidget(ctk.CTkFrame):
         self._on_change = on_change
         self._on_toggle = on_toggle
         self._on_remove = on_remove
+        self._on_paste = on_paste
+        self._scheduler = scheduler
+        # Scheduler key -> input handler still waiting for the idle pass.
+        self._pending_inputs: dict[str, Callable[[], None]] = {}
 
         self.grid_columnconfigure(4, weight=2)
         self.grid_columnconfigure(5, weight=1)
@@ -83,6 +94,7 @@ class TimeRowWidget(ctk.CTkFrame):
         self._time_entry.grid(row=0, column=4, sticky="ew", padx=(0, 8))
         self._time_entry.bind("<KeyRelease>", self._on_time_interaction)
         self._time_entry.bind("<FocusOut>", self._on_time_interaction)
+        self._time_entry.bind("<<Paste>>", self._on_time_paste)
 
         self._description_entry = ctk.CTkEntry(
             self,
@@ -126,6 +138,44 @@ class TimeRowWidget(ctk.CTkFrame):
         self._apply_active_visual_state()
         self._refresh_validation_state()
 
+    def bind_state(self, row_state: TimeRowState) -> None:
+        if row_state is self.state:
+            return
+
+        # Pending input belongs to the row bound now; apply it before the entries change hands.
+        self.flush_pending_input()
+        self.state = row_state
+        self.refresh()
+
+    def flush_pending_input(self) -> None:
+        pending = self._pending_inputs
+        self._pending_inputs = {}
+        for key, callback in pending.items():
+            self._scheduler.cancel(key)
+            callback()
+
+    def refresh(self) -> None:
+        """Re-read the bound state after it was changed outside this widget, e.g. by undo."""
+        row_state = self.state
+        self._active_var.set(row_state.is_active)
+        self._replace_entry_text(self._multiplier_entry, row_state.multiplier)
+        self._replace_entry_text(self._time_entry, row_state.value)
+        self._replace_entry_text(self._description_entry, row_state.description)
+
+        self._apply_operator_style()
+        self._apply_active_visual_state()
+        self._refresh_validation_state()
+
+    @staticmethod
+    def _replace_entry_text(entry: ctk.CTkEntry, value: str) -> None:
+        if entry.get() == value:
+            return
+
+        entry.delete(0, "end")
+        if value:
+            entry.insert(0, value)
+
+    @profiled("row.operator")
     def _toggle_operator(self) -> None:
         self.state.operator = "-" if self.state.operator == "+" else "+"
         self._apply_operator_style()
@@ -135,13 +185,41 @@ class TimeRowWidget(ctk.CTkFrame):
     def _remove_self(self) -> None:
         self._on_remove(self.state.row_id)
 
+    @profiled("row.active")
     def _on_active_change(self) -> None:
         self.state.is_active = bool(self._active_var.get())
         self._apply_active_visual_state()
         self._refresh_validation_state()
         self._on_change(self.state.row_id)
 
+    def _schedule(self, field: str, callback: Callable[[], None]) -> None:
+        if self._scheduler is None:
+            callback()
+            return
+
+        key = f"row:{id(self)}:{field}"
+        self._pending_inputs[key] = callback
+        self._scheduler.schedule(key, lambda: self._run_pending_input(key))
+
+    def _run_pending_input(self, key: str) -> None:
+        callback = self._pending_inputs.pop(key, None)
+        if callback is not None:
+            callback()
+
     def _on_time_interaction(self, _: object | None = None) -> None:
+        self._schedule("time", self._apply_time_input)
+
+    def _on_time_paste(self, _: object | None = None) -> str | None:
+        if self._on_paste is None:
+            return None
+        try:
+            text = self.clipboard_get()
+        except tkinter.TclError:
+            return None
+        return "break" if self._on_paste(self.state.row_id, text) else None
+
+    @profiled("row.time")
+    def _apply_time_input(self) -> None:
         current_value = self._time_entry.get()
         masked_value = mask_hhmmss(current_value)
 
@@ -154,6 +232,10 @@ class TimeRowWidget(ctk.CTkFrame):
         self._on_change(self.state.row_id)
 
     def _on_multiplier_interaction(self, _: object | None = None) -> None:
+        self._schedule("multiplier", self._apply_multiplier_input)
+
+    @profiled("row.multiplier")
+    def _apply_multiplier_input(self) -> None:
         current_value = self._multiplier_entry.get()
         sanitized_value = sanitize_multiplier_text(current_value)
 
@@ -166,7 +248,17 @@ class TimeRowWidget(ctk.CTkFrame):
         self._on_change(self.state.row_id)
 
     def _on_description_change(self, _: object | None = None) -> None:
-        self.state.description = self._description_entry.get()
+        self._schedule("description", self._apply_description_input)
+
+    @profiled("row.description")
+    def _apply_description_input(self) -> None:
+        description = self._description_entry.get()
+        if description == self.state.description:
+            return
+
+        # Subtotals, history and autosave all key on the description.
+        self.state.description = description
+        self._on_change(self.state.row_id)
 
     def _apply_operator_style(self) -> None:
         if self.state.operator == "+":
@@ -0,0 +1,374 @@
+from __future__ import annotations
+
+import tkinter
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+import customtkinter as ctk
+
+from profiling import profiled
+from ui.models import TimeRowState
+from ui.utils.scheduler import CoalescingScheduler
+from ui.utils.time_sum_helpers import is_valid_multiplier, mask_hhmmss, sanitize_multiplier_text
+
+OnRowChange = Callable[[str], None]
+OnRowRemove = Callable[[str], None]
+OnRowPaste = Callable[[str, str], bool]
+
+TABLE_ROW_HEIGHT = 30
+
+COLUMN_ACTIVE = "is_active"
+COLUMN_OPERATOR = "operator"
+COLUMN_MULTIPLIER = "multiplier"
+COLUMN_TIME = "value"
+COLUMN_DESCRIPTION = "description"
+COLUMN_REMOVE = "remove"
+
+# Same order as the columns of ``TimeRowWidget``.
+COLUMN_ORDER = (COLUMN_ACTIVE, COLUMN_OPERATOR, COLUMN_MULTIPLIER, COLUMN_TIME, COLUMN_DESCRIPTION, COLUMN_REMOVE)
+EDITABLE_COLUMNS = (COLUMN_MULTIPLIER, COLUMN_TIME, COLUMN_DESCRIPTION)
+
+_FIXED_WIDTHS = {COLUMN_ACTIVE: 32, COLUMN_OPERATOR: 36, COLUMN_MULTIPLIER: 72, COLUMN_TIME: 110, COLUMN_REMOVE: 36}
+_DESCRIPTION_MIN_WIDTH = 120
+_CELL_PADDING = 8
+
+_TEXT_COLOR = ("#111827", "#f3f4f6")
+_MUTED_COLOR = ("#94a3b8", "#94a3b8")
+_INVALID_COLOR = ("#dc2626", "#f87171")
+_PLUS_COLOR = ("#15803d", "#22c55e")
+_MINUS_COLOR = ("#dc2626", "#ef4444")
+_REMOVE_COLOR = ("#991b1b", "#fecaca")
+_BACKGROUND_COLOR = ("#ffffff", "#111827")
+_INACTIVE_BACKGROUND_COLOR = ("#f8fafc", "#1f2937")
+_GRID_COLOR = ("#e5e7eb", "#374151")
+
+
+@dataclass(frozen=True, slots=True)
+class TableColumn:
+    key: str
+    x0: int
+    x1: int
+
+
+def layout_columns(width: int) -> list[TableColumn]:
+    """Column spans for a table ``width`` pixels wide; the description takes what is left."""
+    description_width = max(width - sum(_FIXED_WIDTHS.values()), _DESCRIPTION_MIN_WIDTH)
+    columns = []
+    x = 0
+    for key in COLUMN_ORDER:
+        column_width = _FIXED_WIDTHS.get(key, description_width)
+        columns.append(TableColumn(key, x, x + column_width))
+        x += column_width
+    return columns
+
+
+def column_at(columns: Iterable[TableColumn], x: int) -> str | None:
+    for column in columns:
+        if column.x0 <= x < column.x1:
+            return column.key
+    return None
+
+
+def sanitize_cell_input(column: str, text: str) -> str:
+    """The same input rules as the row widget's entries."""
+    if column == COLUMN_TIME:
+        return mask_hhmmss(text)
+    if column == COLUMN_MULTIPLIER:
+        return sanitize_multiplier_text(text)
+    return text
+
+
+class TimeTable(ctk.CTkFrame):
+    """Visible rows drawn on one canvas, edited through one shared entry.
+
+    The widget count is constant: the canvas reuses one set of items per
+    visible slot and ``render`` only reconfigures them. Rows hold nothing
+    beyond their ``TimeRowState``.
+    """
+
+    def __init__(
+        self,
+        master: ctk.CTkBaseClass,
+        on_change: OnRowChange,
+        on_remove: OnRowRemove,
+        scheduler: CoalescingScheduler | None = None,
+        on_paste: OnRowPaste | None = None,
+    ) -> None:
+        super().__init__(master, fg_color="transparent")
+
+        self._on_change = on_change
+        self._on_remove = on_remove
+        self._on_paste = on_paste
+        self._scheduler = scheduler
+
+        self._states: list[TimeRowState] = []
+        self._shift = 0
+        self._slots: list[dict[str, int]] = []
+        self._columns = layout_columns(0)
+        self._editing: tuple[TimeRowState, str] | None = None
+        self._editing_original = ""
+        self._editor_size: tuple[int, int] | None = None
+
+        self._canvas = tkinter.Canvas(
+            self,
+            highlightthickness=0,
+            borderwidth=0,
+            background=self._apply_appearance_mode(_BACKGROUND_COLOR),
+        )
+        self._canvas.place(x=0, y=0, relwidth=1, relheight=1)
+        self._canvas.bind("<Configure>", self._on_canvas_configure)
+        self._canvas.bind("<Button-1>", self._on_click)
+
+        # Canvas items are not scaled by customtkinter; geometry is kept in
+        # unscaled units like the rest of the view and converted when drawn.
+        self._scaling = ctk.ScalingTracker.get_widget_scaling(self)
+        self._font: tuple[str | int, ...] = ("Segoe UI", -self._px(14))
+        self._bold_font: tuple[str | int, ...] = ("Segoe UI", -self._px(15), "bold")
+
+        self._editor = ctk.CTkEntry(
+            self,
+            height=TABLE_ROW_HEIGHT,
+            border_width=1,
+            corner_radius=0,
+            font=ctk.CTkFont(family="Segoe UI", size=14),
+        )
+        self._editor.bind("<KeyRelease>", self._on_editor_key)
+        self._editor.bind("<Return>", lambda _: self._move_editor(rows=1))
+        self._editor.bind("<KP_Enter>", lambda _: self._move_editor(rows=1))
+        self._editor.bind("<Tab>", lambda _: self._move_editor(columns=1))
+        self._editor.bind("<Shift-Tab>", lambda _: self._move_editor(columns=-1))
+        self._editor.bind("<ISO_Left_Tab>", lambda _: self._move_editor(columns=-1))
+        self._editor.bind("<Escape>", self._cancel_edit)
+        self._editor.bind("<FocusOut>", lambda _: self.commit_edit())
+        self._editor.bind("<<Paste>>", self._on_editor_paste)
+
+    @property
+    def editing_row_id(self) -> str | None:
+        return None if self._editing is None else self._editing[0].row_id
+
+    def render(self, states: list[TimeRowState], shift: int) -> None:
+        """Draw ``states`` (the visible window) with the first row ``shift`` pixels above the top."""
+        self._states = states
+        self._shift = shift
+        self._update_scaling()
+
+        while len(self._slots) < len(states):
+            self._slots.append(self._create_slot_items())
+        for slot, items in enumerate(self._slots):
+            if slot < len(states):
+                self._draw_slot(slot)
+            else:
+                for item in items.values():
+                    self._canvas.itemconfigure(item, state="hidden")
+
+        self._place_editor()
+
+    def refresh_rows(self, row_ids: set[str]) -> None:
+        """Redraw rows changed outside the table, e.g. by undo."""
+        for slot, state in enumerate(self._states):
+            if state.row_id in row_ids:
+                self._draw_slot(slot)
+        if self._editing is not None and self._editing[0].row_id in row_ids:
+            state, column = self._editing
+            self._set_editor_text(getattr(state, column))
+
+    def commit_edit(self) -> None:
+        if self._editing is None:
+            return
+        self._apply_editor_input()
+        self._editing = None
+        self._editor.place_forget()
+
+    def _create_slot_items(self) -> dict[str, int]:
+        canvas = self._canvas
+        items = {"background": canvas.create_rectangle(0, 0, 0, 0, width=0)}
+        for key in COLUMN_ORDER:
+            items[key] = canvas.create_text(0, 0, anchor="w")
+        items["times"] = canvas.create_text(0, 0, anchor="center", text="x")
+        items["grid"] = canvas.create_line(0, 0, 0, 0)
+        return items
+
+    def _draw_slot(self, slot: int) -> None:
+        canvas = self._canvas
+        color = self._apply_appearance_mode
+        items = self._slots[slot]
+        state = self._states[slot]
+        top = slot * TABLE_ROW_HEIGHT - self._shift
+        middle = top + TABLE_ROW_HEIGHT // 2
+        width = self._columns[-1].x1
+
+        text_color = color(_TEXT_COLOR if state.is_active else _MUTED_COLOR)
+        time_invalid = state.is_active and state.is_started and not state.is_complete
+        multiplier_invalid = state.is_active and not is_valid_multiplier(state.multiplier)
+        cells = {
+            COLUMN_ACTIVE: ("☑" if state.is_active else "☐", text_color, self._font),
+            COLUMN_OPERATOR: (
+                state.operator,
+                color(_MINUS_COLOR if state.operator == "-" else _PLUS_COLOR),
+                self._bold_font,
+            ),
+            COLUMN_MULTIPLIER: (state.multiplier, color(_INVALID_COLOR) if multiplier_invalid else text_color, self._font),
+            COLUMN_TIME: (state.value or "00:00:00", color(_INVALID_COLOR) if time_invalid else text_color, self._font),
+            COLUMN_DESCRIPTION: (state.description or "Opis", text_color if state.description else color(_MUTED_COLOR), self._font),
+            COLUMN_REMOVE: ("X", color(_REMOVE_COLOR if state.is_active else _MUTED_COLOR), self._bold_font),
+        }
+
+        background = color(_BACKGROUND_COLOR if state.is_active else _INACTIVE_BACKGROUND_COLOR)
+        px = self._px
+        canvas.coords(items["background"], 0, px(top), px(width), px(top + TABLE_ROW_HEIGHT))
+        canvas.itemconfigure(items["background"], fill=background, state="normal")
+        for column in self._columns:
+            text, fill, font = cells[column.key]
+            canvas.coords(items[column.key], px(column.x0 + _CELL_PADDING), px(middle))
+            canvas.itemconfigure(items[column.key], text=text, fill=fill, font=font, state="normal")
+
+        # The "x" between multiplier and time, as in the row widget.
+        canvas.coords(items["times"], px(self._columns[2].x1 - 6), px(middle))
+        canvas.itemconfigure(items["times"], fill=color(_MUTED_COLOR), font=self._font, state="normal")
+        bottom = px(top + TABLE_ROW_HEIGHT) - 1
+        canvas.coords(items["grid"], 0, bottom, px(width), bottom)
+        canvas.itemconfigure(items["grid"], fill=color(_GRID_COLOR), state="normal")
+
+    def _px(self, value: float) -> int:
+        return round(value * self._scaling)
+
+    def _update_scaling(self) -> None:
+        scaling = ctk.ScalingTracker.get_widget_scaling(self)
+        if scaling == self._scaling:
+            return
+        self._scaling = scaling
+        self._font = ("Segoe UI", -self._px(14))
+        self._bold_font = ("Segoe UI", -self._px(15), "bold")
+        self._columns = layout_columns(round(self._canvas.winfo_width() / scaling))
+
+    def _slot_at(self, y: int) -> int | None:
+        slot = (round(y / self._scaling) + self._shift) // TABLE_ROW_HEIGHT
+        return slot if 0 <= slot < len(self._states) else None
+
+    def _on_canvas_configure(self, event: tkinter.Event) -> None:
+        self._columns = layout_columns(round(event.width / self._scaling))
+        for slot in range(len(self._states)):
+            self._draw_slot(slot)
+        self._place_editor()
+
+    @profiled("table.click")
+    def _on_click(self, event: tkinter.Event) -> None:
+        slot = self._slot_at(event.y)
+        column = column_at(self._columns, round(event.x / self._scaling))
+        if slot is None or column is None:
+            self.commit_edit()
+            return
+
+        state = self._states[slot]
+        if column in EDITABLE_COLUMNS:
+            self._start_edit(state, column)
+            return
+
+        self.commit_edit()
+        if column == COLUMN_REMOVE:
+            self._on_remove(state.row_id)
+            return
+
+        if column == COLUMN_ACTIVE:
+            state.is_active = not state.is_active
+        elif column == COLUMN_OPERATOR:
+            state.operator = "-" if state.operator == "+" else "+"
+        self._draw_slot(slot)
+        self._on_change(state.row_id)
+
+    def _start_edit(self, state: TimeRowState, column: str) -> None:
+        self.commit_edit()
+        self._editing = (state, column)
+        self._editing_original = getattr(state, column)
+        self._set_editor_text(self._editing_original)
+        self._place_editor()
+        self._editor.focus_set()
+        self._editor.select_range(0, "end")
+
+    def _place_editor(self) -> None:
+        if self._editing is None:
+            return
+
+        state, column_key = self._editing
+        slot = next((index for index, visible in enumerate(self._states) if visible is state), None)
+        if slot is None:
+            # Scrolled out of view: keep the value, drop the editor.
+            self.commit_edit()
+            return
+
+        column = next(column for column in self._columns if column.key == column_key)
+        # customtkinter widgets refuse width/height in place(); size goes through configure().
+        size = (column.x1 - column.x0, TABLE_ROW_HEIGHT)
+        if size != self._editor_size:
+            self._editor.configure(width=size[0], height=size[1])
+            self._editor_size = size
+        self._editor.place(x=column.x0, y=slot * TABLE_ROW_HEIGHT - self._shift)
+        self._editor.lift()
+
+    def _set_editor_text(self, value: str) -> None:
+        self._editor.delete(0, "end")
+        if value:
+            self._editor.insert(0, value)
+
+    def _on_editor_key(self, event: tkinter.Event) -> None:
+        if event.keysym in {"Return", "KP_Enter", "Tab", "ISO_Left_Tab", "Escape"}:
+            return
+        if self._scheduler is None:
+            self._apply_editor_input()
+            return
+        self._scheduler.schedule("table:editor", self._apply_editor_input)
+
+    @profiled("table.editor")
+    def _apply_editor_input(self) -> None:
+        if self._editing is None:
+            return
+
+        state, column = self._editing
+        current_value = self._editor.get()
+        sanitized_value = sanitize_cell_input(column, current_value)
+        if current_value != sanitized_value:
+            self._set_editor_text(sanitized_value)
+
+        if getattr(state, column) == sanitized_value:
+            return
+        setattr(state, column, sanitized_value)
+        self._redraw_state(state)
+        self._on_change(state.row_id)
+
+    def _on_editor_paste(self, _: object | None = None) -> str | None:
+        if self._on_paste is None or self._editing is None or self._editing[1] != COLUMN_TIME:
+            return None
+        try:
+            text = self.clipboard_get()
+        except tkinter.TclError:
+            return None
+        return "break" if self._on_paste(self._editing[0].row_id, text) else None
+
+    def _cancel_edit(self, _: object | None = None) -> str:
+        if self._editing is not None:
+            self._set_editor_text(self._editing_original)
+            self.commit_edit()
+        self._canvas.focus_set()
+        return "break"
+
+    def _move_editor(self, rows: int = 0, columns: int = 0) -> str:
+        if self._editing is None:
+            return "break"
+
+        state, column = self._editing
+        self.commit_edit()
+        slot = next((index for index, visible in enumerate(self._states) if visible is state), None)
+        if slot is None:
+            return "break"
+
+        column_index = EDITABLE_COLUMNS.index(column) + columns
+        slot += rows + column_index // len(EDITABLE_COLUMNS)
+        if 0 <= slot < len(self._states):
+            self._start_edit(self._states[slot], EDITABLE_COLUMNS[column_index % len(EDITABLE_COLUMNS)])
+        return "break"
+
+    def _redraw_state(self, state: TimeRowState) -> None:
+        for slot, visible in enumerate(self._states):
+            if visible is state:
+                self._draw_slot(slot)
+                return